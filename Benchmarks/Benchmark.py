@@ -0,0 +1,283 @@
+# Benchmarks for the hot paths of Polynomial, PolynomialArithmetic, Prime and Factoring.
+# - Running: python Benchmarks/Benchmark.py run [--output results.json] [--quick] [--cases mul,add] [--max-degree 1000]
+# 	measures every case over the grid of DEGREES and MODULI (and BITS for the integer functions) and writes the results as JSON,
+# 	together with the machine they were measured on (Python version, platform, processor, number of cores, NumPy version, git commit).
+# - Comparing: python Benchmarks/Benchmark.py compare baseline.json results.json [--threshold 0.25]
+# 	prints the ratio of every measurement that appears in both files and marks the ones that got more than 'threshold' slower
+# 	as a regression. The exit code is 1 if there is a regression, so it can be used in scripts.
+# 	run --compare baseline.json does both at once.
+#
+# Every measurement is the best time per call out of REPEATS rounds, where a round calls the function until it took at least MIN_TIME
+# seconds, like timeit does. The inputs are random, but generated from a fixed seed, so every run measures the same polynomials.
+# A case is only measured up to its own maximum degree, as some of them (eg: isIrreducible above degree 100) would take minutes for the larger degrees.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "Polynomials")]
+
+from Polynomial import Polynomial as Poly
+import PolynomialArithmetic
+from MathExtensions import Prime, Factoring
+from typing import List, Dict, Callable, Tuple
+import argparse
+import datetime
+import json
+import platform
+import random
+import subprocess
+import time
+
+# The degrees of the polynomials
+DEGREES = [10, 100, 1000, 10000, 100000]
+# The moduli of the polynomials, by name
+MODULI = {"2": 2, "small": 10007, "31bit": 2**31 - 1, "61bit": 2**61 - 1}
+# The sizes in bits of the integers for the functions of Prime and Factoring
+BITS = [16, 32, 48, 64]
+# The number of rounds per measurement, the best round counts
+REPEATS = 5
+# The minimum time of a round in seconds
+MIN_TIME = 0.2
+# The seed for the random inputs
+SEED = 1
+# A measurement that got more than this fraction slower than the baseline is a regression
+REGRESSION_THRESHOLD = 0.25
+
+
+# Returns a random polynomial of the given degree mod m, with a nonzero leading coefficient
+def randomPoly(degree : int, m : int) -> Poly:
+	return Poly([random.randrange(1, m)] + [random.randrange(m) for _ in range(degree)], m)
+
+
+# Returns a random monic polynomial of the given degree mod m
+def randomMonic(degree : int, m : int) -> Poly:
+	return Poly([1] + [random.randrange(m) for _ in range(degree)], m)
+
+
+# Returns random integers with the given number of bits
+def randomIntegers(bits : int, count : int = 16) -> List[int]:
+	return [random.getrandbits(bits) | (1 << (bits - 1)) for _ in range(count)]
+
+
+# The polynomial cases, as name: (function that returns the call to measure for a degree and modulus, max degree).
+# The calls are built before the time starts, so creating the inputs is not measured
+def polynomialCases() -> Dict[str, Tuple[Callable, int]]:
+	def mul(degree, m):
+		f, g = randomPoly(degree, m), randomPoly(degree, m)
+		return lambda: f*g
+
+	def add(degree, m):
+		f, g = randomPoly(degree, m), randomPoly(degree, m)
+		return lambda: f + g
+
+	def compute(degree, m):
+		f, x = randomPoly(degree, m), random.randrange(m)
+		return lambda: f.compute(x)
+
+	def zeros(degree, m):
+		f = randomPoly(degree, m)
+		return lambda: f.zeros()
+
+	def isIrreducible(degree, m):
+		f = randomMonic(degree, m)
+		return lambda: f.isIrreducible()
+
+	def longDivision(degree, m):
+		f, g = randomPoly(2*degree, m), randomPoly(degree, m)
+		return lambda: PolynomialArithmetic.longDivision(f, g)
+
+	def euclidExtended(degree, m):
+		f, g = randomPoly(degree, m), randomPoly(degree - 1, m)
+		return lambda: PolynomialArithmetic.euclidExtended(f, g)
+
+	# The random search with the same seed every time, so that every call tries the same polynomials
+	def findIrreducible(degree, m):
+		def call():
+			random.seed(SEED)
+			return PolynomialArithmetic.findIrreducible(degree, m, "random", False)
+		return call
+
+	# The maximum degree of each case, measured on CPython 3.11. At degree 10^4 euclidExtended takes 1s mod 2 to 8s mod the 61 bit prime,
+	# and zeros takes 9s mod the 31 bit prime and 70s mod the 61 bit prime. At degree 10^5 euclidExtended takes 28s mod 2 and minutes
+	# for the larger moduli. isIrreducible takes 10s mod 2 and minutes for the larger moduli at degree 1000
+	return {
+		"mul": (mul, 100000),
+		"add": (add, 100000),
+		"compute": (compute, 100000),
+		"zeros": (zeros, 10000),
+		"isIrreducible": (isIrreducible, 100),
+		"longDivision": (longDivision, 10000),
+		"euclidExtended": (euclidExtended, 10000),
+		"findIrreducible": (findIrreducible, 100)
+	}
+
+
+# The integer cases, as name: function that returns the call to measure for a number of bits
+def integerCases() -> Dict[str, Callable]:
+	def primeFactors(bits):
+		numbers = randomIntegers(bits)
+		return lambda: [Factoring.primeFactors(n) for n in numbers]
+
+	def divisors(bits):
+		numbers = randomIntegers(bits)
+		return lambda: [Factoring.divisors(n) for n in numbers]
+
+	def prime(bits):
+		numbers = randomIntegers(bits)
+		return lambda: [Prime.prime(n) for n in numbers]
+
+	return {"primeFactors": primeFactors, "divisors": divisors, "prime": prime}
+
+
+# Returns the best time per call of f in seconds, with the number of calls per round
+def measure(f : Callable, repeats : int = REPEATS, minTime : float = MIN_TIME) -> Tuple[float, int]:
+	loops = 1
+	while True:
+		start = time.perf_counter()
+		for _ in range(loops):
+			f()
+		elapsed = time.perf_counter() - start
+		if elapsed >= minTime:
+			break
+		loops = max(2*loops, int(loops*minTime/max(elapsed, 1e-9)) + 1)
+
+	best = elapsed/loops
+	for _ in range(repeats - 1):
+		start = time.perf_counter()
+		for _ in range(loops):
+			f()
+		best = min(best, (time.perf_counter() - start)/loops)
+
+	return best, loops
+
+
+# Returns the description of the machine and the code that is measured
+def metadata() -> dict:
+	try:
+		import numpy
+		numpyVersion = numpy.__version__
+	except ImportError:
+		numpyVersion = None
+
+	try:
+		commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip() or None
+	except OSError:
+		commit = None
+
+	return {
+		"time": datetime.datetime.now().isoformat(timespec="seconds"),
+		"python": platform.python_version(),
+		"implementation": platform.python_implementation(),
+		"platform": platform.platform(),
+		"machine": platform.machine(),
+		"processor": platform.processor(),
+		"cpuCount": os.cpu_count(),
+		"numpy": numpyVersion,
+		"commit": commit
+	}
+
+
+# Returns the key that identifies a measurement in a results file
+def key(result : dict) -> Tuple[str, str, int]:
+	return result["name"], result["modulus"], result["size"]
+
+
+# Measures the cases with the given names (all of them if None) and prints every measurement, returns the results
+def run(names : List[str] = None, maxDegree : int = None, repeats : int = REPEATS, minTime : float = MIN_TIME) -> dict:
+	results = []
+
+	def record(name, modulus, size, call):
+		seconds, loops = measure(call, repeats, minTime)
+		results.append({"name": name, "modulus": modulus, "size": size, "seconds": seconds, "loops": loops})
+		print("%-16s %-6s %7d  %12.6fs" % (name, modulus, size, seconds), flush=True)
+
+	for name, (setup, caseMaxDegree) in polynomialCases().items():
+		if names is not None and name not in names:
+			continue
+		for modulusName, m in MODULI.items():
+			for degree in DEGREES:
+				if degree > caseMaxDegree or (maxDegree is not None and degree > maxDegree):
+					continue
+				random.seed(SEED)
+				record(name, modulusName, degree, setup(degree, m))
+
+	for name, setup in integerCases().items():
+		if names is not None and name not in names:
+			continue
+		for bits in BITS:
+			random.seed(SEED)
+			record(name, "bits", bits, setup(bits))
+
+	return {"metadata": metadata(), "results": results}
+
+
+# Prints the comparison of two results files and returns the number of regressions
+def compare(baseline : dict, current : dict, threshold : float = REGRESSION_THRESHOLD) -> int:
+	old = {key(result): result["seconds"] for result in baseline["results"]}
+	regressions = 0
+	for result in current["results"]:
+		if key(result) not in old:
+			continue
+
+		ratio = result["seconds"]/old[key(result)]
+		mark = ""
+		if ratio > 1 + threshold:
+			mark = "REGRESSION"
+			regressions += 1
+		elif ratio < 1/(1 + threshold):
+			mark = "faster"
+
+		print("%-16s %-6s %7d  %12.6fs -> %12.6fs  %6.2fx  %s" % (*key(result), old[key(result)], result["seconds"], ratio, mark))
+
+	if baseline["metadata"].get("platform") != current["metadata"].get("platform") or \
+			baseline["metadata"].get("python") != current["metadata"].get("python"):
+		print("Note: the results were measured on a different platform or Python version")
+
+	print("%d regression(s) with a threshold of %d%%" % (regressions, round(100*threshold)))
+	return regressions
+
+
+def main(arguments : List[str]) -> int:
+	parser = argparse.ArgumentParser(description="Benchmarks for the polynomial and integer functions")
+	commands = parser.add_subparsers(dest="command", required=True)
+
+	runParser = commands.add_parser("run", help="measure all cases")
+	runParser.add_argument("--output", help="the file to write the results to")
+	runParser.add_argument("--cases", help="the names of the cases to measure, separated by commas")
+	runParser.add_argument("--max-degree", type=int, help="skip the degrees above this")
+	runParser.add_argument("--quick", action="store_true", help="a single short round per measurement, for a rough picture")
+	runParser.add_argument("--compare", help="a baseline results file to compare with")
+	runParser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+
+	compareParser = commands.add_parser("compare", help="compare two results files")
+	compareParser.add_argument("baseline")
+	compareParser.add_argument("current")
+	compareParser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+
+	options = parser.parse_args(arguments)
+	if options.command == "compare":
+		with open(options.baseline) as file:
+			baseline = json.load(file)
+		with open(options.current) as file:
+			current = json.load(file)
+		return 1 if compare(baseline, current, options.threshold) > 0 else 0
+
+	names = options.cases.split(",") if options.cases else None
+	if options.quick:
+		results = run(names, options.max_degree, 1, 0.0)
+	else:
+		results = run(names, options.max_degree)
+
+	if options.output:
+		with open(options.output, "w") as file:
+			json.dump(results, file, indent=1)
+
+	if options.compare:
+		with open(options.compare) as file:
+			return 1 if compare(json.load(file), results, options.threshold) > 0 else 0
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
@@ -1,45 +1,80 @@
-from math import sqrt
-from typing import List
+from math import gcd
+from typing import List, Dict
 from MathExtensions import Prime
+import random
 
 
+# Returns the prime factorization of n as a dictionary {prime: exponent}, sorted by prime. Eg: factorization(360) == {2: 3, 3: 2, 5: 1}
+# The small prime factors are divided out first, the rest is split with Pollard's rho algorithm (Brent's variant) until every part is prime
+def factorization(n : int) -> Dict[int, int]:
+	factors = {}
+	for q in Prime.SMALL_PRIMES:
+		if q*q > n:
+			break
+		while n % q == 0:
+			n //= q
+			factors[q] = factors.get(q, 0) + 1
+
+	parts = [n] if n > 1 else []
+	while parts:
+		part = parts.pop()
+		if Prime.prime(part):
+			factors[part] = factors.get(part, 0) + 1
+		else:
+			d = pollardBrent(part)
+			parts += [d, part//d]
+
+	return dict(sorted(factors.items()))
+
+
+# Returns a nontrivial factor of the composite number n, with Pollard's rho algorithm in Brent's variant.
+# The sequence y -> y^2 + c mod n repeats mod an unknown prime factor p long before it does mod n, and gcd(x - y, n) reveals that.
+# The differences are multiplied together in batches of 128, so that only one gcd per batch is needed
+def pollardBrent(n : int) -> int:
+	if n % 2 == 0:
+		return 2
+
+	while True:
+		y, c = random.randrange(1, n), random.randrange(1, n)
+		batch = 128
+		g, r, q = 1, 1, 1
+		while g == 1:
+			x = y
+			for _ in range(r):
+				y = (y*y + c) % n
+			k = 0
+			while k < r and g == 1:
+				ys = y		# Remember where this batch started, in case the whole batch has to be redone one step at a time
+				for _ in range(min(batch, r - k)):
+					y = (y*y + c) % n
+					q = q*abs(x - y) % n
+				g = gcd(q, n)
+				k += batch
+			r *= 2
+
+		if g == n:
+			# The batch multiplied all factors of n together, redo it one step at a time
+			g = 1
+			while g == 1:
+				ys = (ys*ys + c) % n
+				g = gcd(abs(x - ys), n)
+
+		# g == n means this c failed, try again with another one
+		if g != n:
+			return g
+
+
+# Returns the prime factors of n with multiplicity, in ascending order. Eg: primeFactors(12) == [2, 2, 3]
 def primeFactors(n : int) -> List[int]:
 	factors = []
-	m = 1
-	n_ = n
-	prime = Prime.primeFirstResult(n)
-	if prime[0]:
-		return [n]
-	else:
-		n_ = n_//prime[1]
-		m *= prime[1]
-		factors.append(prime[1])
-
-	while n_ % 2 == 0:
-		n_ = n_//2
-		m *= 2
-		factors.append(2)
-
-	for d in range(3, n_ + 1, 2):
-		while n_ % d == 0:
-			n_ = n_//d
-			m *= d
-			factors.append(d)
-
-		if m == n:
-			break
+	for q, e in factorization(n).items():
+		factors += [q]*e
 
 	return factors
 
 
 def primeFactorsUnique(n : int) -> List[int]:
-	allFactors = primeFactors(n)
-	uniqueFactors = []
-	for f in allFactors:
-		if f not in uniqueFactors:
-			uniqueFactors.append(f)
-
-	return uniqueFactors
+	return list(factorization(n))
 
 # Initial version of divisors, that is 10x slower than the new version below
 # def divisors(n : int) -> List[int]:
@@ -53,35 +88,12 @@ def primeFactorsUnique(n : int) -> List[int]:
 # 	return ds
 
 
+# Returns the divisors of n. Every divisor is built exactly once, from the exponents of the prime factorization
 def divisors(n : int, sort=True) -> List[int]:
-	factors = primeFactors(n)
-	multiplyList = [0]*len(factors)
-	ds = []
-
-	# Iterate over "Binary" list as if it's counting
-	finished = False
-	while not finished:
-		divisor = 1
-		# With current list, create a divisor
-		for i in range(len(multiplyList)):
-			if multiplyList[i] == 1:
-				divisor *= factors[i]
-		ds.append(divisor)
-
-		# Iterate
-		multiplyList[0] += 1
-		for i in range(len(multiplyList) - 1):
-			if multiplyList[i] == 2:
-				multiplyList[i + 1] += 1
-
-		# End condition
-		if multiplyList[-1] == 2:
-			finished = True
-
-		# Reduce integers back
-		for i in range(len(multiplyList)):
-			if multiplyList[i] == 2:
-				multiplyList[i] = 0
+	ds = [1]
+	for q, e in factorization(n).items():
+		powers = [q**k for k in range(e + 1)]
+		ds = [d*power for d in ds for power in powers]
 
 	if sort:
 		return sorted(ds)
@@ -1,9 +1,37 @@
-from math import sqrt
-from typing import Tuple
+from math import isqrt
+from typing import Tuple, List
+import random
+
+# Below this, prime() uses trial division. From this on it uses the Miller-Rabin test
+TRIAL_DIVISION_LIMIT = 1 << 20
+# For n below this bound, Miller-Rabin with the bases in DETERMINISTIC_BASES gives the correct answer for every n.
+# The first 12 primes are enough for all n < 3.3*10^24, which includes every 64 bit number
+DETERMINISTIC_BOUND = 1 << 64
+DETERMINISTIC_BASES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+# The number of random bases used above DETERMINISTIC_BOUND. A composite n passes a single random base with a chance of at most 1/4
+DEFAULT_SAMPLES = 40
+
+
+# Returns the primes below n, with the sieve of Eratosthenes
+def primesBelow(n : int) -> List[int]:
+	sieve = bytearray([1])*max(n, 2)
+	sieve[0] = sieve[1] = 0
+	for i in range(2, isqrt(max(n - 1, 0)) + 1):
+		if sieve[i]:
+			sieve[i*i::i] = bytes(len(range(i*i, len(sieve), i)))
+
+	return [i for i in range(n) if sieve[i]]
+
+
+# The small primes that every number is divided by before running Miller-Rabin
+SMALL_PRIMES = primesBelow(1000)
 
 
 def prime(n) -> bool:
-	for i in range(2, int(sqrt(n)) + 1):
+	if n >= TRIAL_DIVISION_LIMIT:
+		return MillerRabinTest(n)
+
+	for i in range(2, isqrt(n) + 1 if n > 0 else 0):
 		if n % i == 0:
 			return False
 
@@ -11,13 +39,50 @@ def prime(n) -> bool:
 
 
 def primeFirstResult(n) -> Tuple[bool, int]:
-	for i in range(2, int(sqrt(n)) + 1):
+	# For large n, a prime would take all the way up to sqrt(n) to be recognized
+	if n >= TRIAL_DIVISION_LIMIT and MillerRabinTest(n):
+		return True, 0
+
+	for i in range(2, isqrt(n) + 1 if n > 0 else 0):
 		if n % i == 0:
 			return False, i
 
 	return True, 0
 
 
-# TODO: implement Miller-Rabin for primality testing, as this can be faster for very large n
-def MillerRabinTest(n, samples) -> bool:
-	pass
+# Returns whether n is prime, with the Miller-Rabin test.
+# Write n - 1 = d*2^s with d odd. For a prime n and any base a, either a^d == 1 or a^(d*2^r) == -1 for some r < s.
+# For a composite n at least 3/4 of all bases fail this, so passing for many bases means n is prime.
+# For n < DETERMINISTIC_BOUND the answer is exact. Above it 'samples' random bases are used (DEFAULT_SAMPLES if not given),
+# and a composite n is called prime with a chance of at most 4^(-samples)
+def MillerRabinTest(n, samples = None) -> bool:
+	if n < 2:
+		return False
+
+	for q in SMALL_PRIMES:
+		if n % q == 0:
+			return n == q
+
+	d, s = n - 1, 0
+	while d % 2 == 0:
+		d //= 2
+		s += 1
+
+	if n < DETERMINISTIC_BOUND:
+		bases = DETERMINISTIC_BASES
+	else:
+		bases = [random.randrange(2, n - 1) for _ in range(DEFAULT_SAMPLES if samples is None else samples)]
+
+	for a in bases:
+		x = pow(a, d, n)
+		if x == 1 or x == n - 1:
+			continue
+
+		for _ in range(s - 1):
+			x = x*x % n
+			if x == n - 1:
+				break
+		else:
+			return False
+
+	return True
@@ -0,0 +1,114 @@
+from array import array
+from collections import OrderedDict
+from math import isqrt
+from typing import List, Dict
+from MathExtensions import Prime, Factoring
+
+# The number of integers per segment of the table
+SEGMENT_SIZE = 1 << 18
+
+
+# A table of smallest prime factors for all integers below 'limit', for answering many questions about integers in that range.
+# Every question about an integer below the limit takes O(log n) steps, integers outside the range go to Prime and Factoring as usual.
+# Usage: sieve = Sieve(10**7), then sieve.primeFactors(n), sieve.primeFactorsUnique(n), sieve.factorization(n), sieve.divisors(n), sieve.prime(n)
+#
+# Memory: the table is split into segments of 'segmentSize' integers, which are only built when a number in them is asked about.
+# For every integer the table stores its smallest prime factor if it is composite, and 0 if it is prime.
+# The smallest prime factor of a composite n is at most sqrt(n), so for limits up to 2^32 this takes 2 bytes per integer
+# (an array of type 'H'), and 4 bytes per integer above that. So the full table takes 2*limit bytes, eg: 20MB for a limit of 10^7.
+# With maxSegments given, only that many segments are kept (the least recently used ones are dropped and rebuilt when needed),
+# which bounds the memory to 2*segmentSize*maxSegments bytes.
+class Sieve:
+	limit : int
+	segmentSize : int
+	maxSegments : int
+	basePrimes : List[int]		# The primes up to sqrt(limit), the only ones that can be a smallest factor of a composite in range
+
+	def __init__(self, limit : int, segmentSize : int = SEGMENT_SIZE, maxSegments : int = None):
+		self.limit = limit
+		self.segmentSize = segmentSize
+		self.maxSegments = maxSegments
+		self.typecode = "H" if limit <= 1 << 32 else "I"
+		self.basePrimes = Prime.primesBelow(isqrt(max(limit - 1, 0)) + 1)
+		self.segments : "OrderedDict[int, array]" = OrderedDict()
+
+	# Returns the segment with the given index, building it first if needed
+	def segment(self, index : int) -> array:
+		if index in self.segments:
+			self.segments.move_to_end(index)
+			return self.segments[index]
+
+		low = index*self.segmentSize
+		high = min(low + self.segmentSize, self.limit)
+		table = array(self.typecode, bytes(array(self.typecode).itemsize*(high - low)))
+		# Going over the primes from large to small, every entry ends up with the smallest prime that divides it
+		for q in reversed(self.basePrimes):
+			if q*q >= high:
+				continue
+
+			start = max(q*q, (low + q - 1)//q*q)
+			if start < high:
+				count = len(range(start, high, q))
+				table[start - low::q] = array(self.typecode, [q])*count
+
+		self.segments[index] = table
+		if self.maxSegments is not None and len(self.segments) > self.maxSegments:
+			self.segments.popitem(last=False)
+
+		return table
+
+	# Returns the smallest prime factor of n, for 2 <= n < limit
+	def smallestPrimeFactor(self, n : int) -> int:
+		factor = self.segment(n//self.segmentSize)[n % self.segmentSize]
+		return factor if factor != 0 else n
+
+	# Returns whether n is prime. Numbers below 2 are not prime
+	def prime(self, n : int) -> bool:
+		if n >= self.limit:
+			return Prime.prime(n)
+
+		return n >= 2 and self.segment(n//self.segmentSize)[n % self.segmentSize] == 0
+
+	# Returns the prime factorization of n as a dictionary {prime: exponent}, like Factoring.factorization
+	def factorization(self, n : int) -> Dict[int, int]:
+		if n >= self.limit:
+			return Factoring.factorization(n)
+
+		factors = {}
+		while n > 1:
+			q = self.smallestPrimeFactor(n)
+			n //= q
+			factors[q] = factors.get(q, 0) + 1
+
+		return factors
+
+	# Returns the prime factors of n with multiplicity, in ascending order, like Factoring.primeFactors
+	def primeFactors(self, n : int) -> List[int]:
+		if n >= self.limit:
+			return Factoring.primeFactors(n)
+
+		factors = []
+		while n > 1:
+			q = self.smallestPrimeFactor(n)
+			n //= q
+			factors.append(q)
+
+		return factors
+
+	# Returns the distinct prime factors of n, in ascending order, like Factoring.primeFactorsUnique
+	def primeFactorsUnique(self, n : int) -> List[int]:
+		return list(self.factorization(n))
+
+	# Returns the divisors of n, like Factoring.divisors
+	def divisors(self, n : int, sort=True) -> List[int]:
+		if n >= self.limit:
+			return Factoring.divisors(n, sort)
+
+		ds = [1]
+		for q, e in self.factorization(n).items():
+			powers = [q**k for k in range(e + 1)]
+			ds = [d*power for d in ds for power in powers]
+
+		if sort:
+			return sorted(ds)
+		return ds
@@ -0,0 +1,193 @@
+# Running the same question for many independent polynomials on several processes, with a concurrent.futures process pool.
+# - isIrreducible(polynomials, m, method), zeros(polynomials, m) and factor(polynomials, m) take an iterable of coefficient lists
+# 	(highest degree first, like Polynomial.poly) and a modulus. findIrreducible(degrees, m, method) takes an iterable of degrees.
+# 	They return a BatchRun, which gives the results while iterating over it:
+# 	for result in Batch.isIrreducible(polynomials, 7): ...
+#
+# - The polynomials are sent to the processes in chunks of chunkSize at once. For moduli that fit in 64 bits a chunk is sent as two byte
+# 	strings (the lengths and all the coefficients, as arrays of type 'q'), which is much smaller and faster to pickle than a list of lists.
+# - With ordered=True the results come in the same order as the polynomials. With ordered=False they come as soon as they are done,
+# 	as (index, result) pairs, where index is the position of the polynomial in the input.
+# - At most maxInFlight chunks are submitted at the same time (2 per process by default), and the input is only read as far as needed
+# 	for that. So an input generator of any length can be used, and the memory use stays the same during the whole run.
+# - run.cancel() stops the run: the chunks that have not started are cancelled and the iteration ends. Breaking out of the loop
+# 	does the same. A BatchRun can also be used with 'with', which cancels whatever is left at the end of the block.
+#
+# The processes import this file and the files it uses, so like for the rest of this repository, the Polynomials directory and its parent
+# have to be on the import path of the main process.
+import Irreducibility
+import Roots
+import Factorization
+import PolynomialArithmetic
+from concurrent.futures import ProcessPoolExecutor, Executor, wait, FIRST_COMPLETED
+from collections import deque
+from array import array
+from itertools import islice
+from typing import List, Iterable, Iterator
+import os
+
+# The number of polynomials sent to a process at once
+CHUNK_SIZE = 256
+# The number of chunks per process that can be submitted at the same time, if maxInFlight is not given
+IN_FLIGHT_PER_WORKER = 2
+# The largest modulus for which a chunk is sent as packed arrays of type 'q'
+PACKED_MAX_MODULUS = 1 << 63
+
+
+# Returns a chunk of coefficient lists in the form that is sent to a process, see the top of this file
+def packChunk(polynomials : List[List[int]], m : int):
+	if m > PACKED_MAX_MODULUS:
+		return [list(c) for c in polynomials]
+
+	lengths = array("q", [len(c) for c in polynomials])
+	coefficients = array("q", [x % m for c in polynomials for x in c])
+	return lengths.tobytes(), coefficients.tobytes()
+
+
+# Returns the coefficient lists from a chunk made by packChunk
+def unpackChunk(chunk, m : int) -> List[List[int]]:
+	if m > PACKED_MAX_MODULUS:
+		return chunk
+
+	lengths = array("q")
+	lengths.frombytes(chunk[0])
+	coefficients = array("q")
+	coefficients.frombytes(chunk[1])
+	polynomials = []
+	start = 0
+	for length in lengths:
+		polynomials.append(coefficients[start:start + length].tolist())
+		start += length
+
+	return polynomials
+
+
+# Returns the results of the task for all polynomials (or degrees, for "findIrreducible") in the chunk. This runs in the processes
+def runChunk(task : str, chunk, m : int, method : str) -> list:
+	if task == "findIrreducible":
+		results = [PolynomialArithmetic.findIrreducible(degree, m, method) for degree in chunk]
+		return [None if f is None else f.polynomial() for f in results]
+
+	polynomials = unpackChunk(chunk, m)
+	if task == "isIrreducible":
+		return [Irreducibility.isIrreducible(c, m, method) for c in polynomials]
+	if task == "zeros":
+		return [Roots.zeros(c, m) for c in polynomials]
+	if task == "factor":
+		return [Factorization.factor(c, m) for c in polynomials]
+
+	raise Exception("Unknown batch task: " + str(task))
+
+
+# A run of one task over many polynomials, see the top of this file. Iterating over it gives the results
+class BatchRun:
+	task : str
+	modulus : int
+	ordered : bool
+	chunkSize : int
+	maxInFlight : int
+	cancelled : bool
+
+	# Constructor. An executor can be given to reuse a pool between runs, otherwise a ProcessPoolExecutor with 'workers' processes
+	# (all cores by default) is created for this run and shut down at the end
+	def __init__(self, task : str, items : Iterable, modulus : int, method : str = None, ordered : bool = True, chunkSize : int = CHUNK_SIZE,
+			maxInFlight : int = None, workers : int = None, executor : Executor = None):
+		self.task = task
+		self.items = iter(items)
+		self.modulus = modulus
+		self.method = method
+		self.ordered = ordered
+		self.chunkSize = chunkSize
+		self.workers = workers or os.cpu_count() or 1
+		self.maxInFlight = maxInFlight or IN_FLIGHT_PER_WORKER*self.workers
+		self.executor = executor
+		self.ownsExecutor = executor is None
+		self.pending = deque()		# The submitted chunks as (index of the first item, future), in the order they were submitted
+		self.submitted = 0		# The number of items that have been submitted
+		self.cancelled = False
+
+	# Submits the next chunk of the input, returns False when the input has run out
+	def submitNext(self) -> bool:
+		items = list(islice(self.items, self.chunkSize))
+		if not items:
+			return False
+
+		chunk = items if self.task == "findIrreducible" else packChunk(items, self.modulus)
+		future = self.executor.submit(runChunk, self.task, chunk, self.modulus, self.method)
+		self.pending.append((self.submitted, future))
+		self.submitted += len(items)
+		return True
+
+	# Fills the pool up to maxInFlight chunks
+	def fill(self):
+		while not self.cancelled and len(self.pending) < self.maxInFlight and self.submitNext():
+			pass
+
+	def __iter__(self) -> Iterator:
+		if self.executor is None:
+			self.executor = ProcessPoolExecutor(self.workers)
+
+		try:
+			self.fill()
+			while self.pending and not self.cancelled:
+				if self.ordered:
+					_, future = self.pending.popleft()
+					results = future.result()
+					self.fill()
+					for result in results:
+						if self.cancelled:
+							break
+						yield result
+				else:
+					done, _ = wait([future for _, future in self.pending], return_when=FIRST_COMPLETED)
+					finished = [entry for entry in self.pending if entry[1] in done]
+					for entry in finished:
+						self.pending.remove(entry)
+					self.fill()
+					for start, future in finished:
+						for pair in enumerate(future.result(), start):
+							if self.cancelled:
+								break
+							yield pair
+		finally:
+			self.close()
+
+	# Stops the run, see the top of this file
+	def cancel(self):
+		self.cancelled = True
+
+	# Cancels the chunks that have not started yet and shuts the pool down if it was created by this run
+	def close(self):
+		for _, future in self.pending:
+			future.cancel()
+		self.pending.clear()
+		if self.ownsExecutor and self.executor is not None:
+			self.executor.shutdown(wait=True, cancel_futures=True)
+			self.executor = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exception):
+		self.cancel()
+		self.close()
+
+
+# Returns a BatchRun giving whether each polynomial is irreducible mod the prime m, see Irreducibility.isIrreducible
+def isIrreducible(polynomials : Iterable[List[int]], m : int, method : str = "rabin", **options) -> BatchRun:
+	return BatchRun("isIrreducible", polynomials, m, method, **options)
+
+
+# Returns a BatchRun giving the sorted zeros of each polynomial mod m, see Roots.zeros
+def zeros(polynomials : Iterable[List[int]], m : int, **options) -> BatchRun:
+	return BatchRun("zeros", polynomials, m, **options)
+
+
+# Returns a BatchRun giving the factorization of each polynomial mod the prime m as (factor, multiplicity) pairs, see Factorization.factor
+def factor(polynomials : Iterable[List[int]], m : int, **options) -> BatchRun:
+	return BatchRun("factor", polynomials, m, **options)
+
+
+# Returns a BatchRun giving an irreducible polynomial mod the prime m for each degree, see PolynomialArithmetic.findIrreducible
+def findIrreducible(degrees : Iterable[int], m : int, method : str = "lexicographic", **options) -> BatchRun:
+	return BatchRun("findIrreducible", degrees, m, method, **options)
@@ -0,0 +1,222 @@
+# Division of coefficient lists.
+# Like Multiplication.py, all functions in this file work on plain lists of coefficients in the same order as Polynomial.poly
+# (highest degree first) and return lists in that order. The modulus m has to be prime, as the leading coefficient of the divisor is inverted.
+import Multiplication
+import math
+from collections import OrderedDict
+from typing import List, Tuple
+
+# divide uses the Newton iteration (see Reducer) when both the divisor degree and the length of the quotient are at least this.
+# Below that the classic long division is faster, measured on CPython 3.11
+NEWTON_DIVISION_THRESHOLD = 48
+# The number of Reducers kept by cachedReducer
+REDUCER_CACHE_SIZE = 32
+
+# Cache of the Reducers for divisors that are used over and over, stored as {(modulus, m): Reducer}, least recently used first
+reducerCache : "OrderedDict[Tuple[Tuple[int, ...], int], Reducer]" = OrderedDict()
+
+
+# Returns the coefficients without the leading zeroes. The zero polynomial is returned as [0]
+def stripZeroes(coefficients : List[int]) -> List[int]:
+	for i, c in enumerate(coefficients):
+		if c != 0:
+			return coefficients[i:] if i > 0 else coefficients
+
+	return [0]
+
+
+# Returns, in a tuple (q, r), the quotient q and remainder r such that a = b*q + r mod m, with deg(r) < deg(b)
+# Picks between the classic long division and division with the Newton iteration, based on the degrees.
+# Can raise exception when dividing by zero.
+def divide(a : List[int], b : List[int], m : int) -> Tuple[List[int], List[int]]:
+	a = stripZeroes([c % m for c in a])
+	b = stripZeroes([c % m for c in b])
+	if prefersNewton(len(b) - 1, len(a) - len(b) + 1) and math.gcd(b[0], m) == 1:
+		return Reducer(b, m).divide(a)
+
+	return divideReduced(a, b, m)
+
+
+# Returns whether dividing by a divisor of the given degree, with a quotient of the given length, is faster with the Newton iteration
+def prefersNewton(divisorDegree : int, quotientLength : int) -> bool:
+	return divisorDegree >= NEWTON_DIVISION_THRESHOLD and quotientLength >= NEWTON_DIVISION_THRESHOLD
+
+
+# Returns, in a tuple (q, r), the quotient and remainder of a divided by b mod m, with the classic long division
+# Can raise exception when dividing by zero.
+def divideClassic(a : List[int], b : List[int], m : int) -> Tuple[List[int], List[int]]:
+	return divideReduced(stripZeroes([c % m for c in a]), stripZeroes([c % m for c in b]), m)
+
+
+# divideClassic for coefficients that are already reduced mod m and have no leading zeroes. a is modified
+def divideReduced(a : List[int], b : List[int], m : int) -> Tuple[List[int], List[int]]:
+	if b == [0]:
+		raise Exception("Division by 0")
+
+	if len(b) > len(a):
+		return [0], a
+
+	inverse = pow(b[0], -1, m)
+	tail = b[1:]
+	r = a		# The remainder
+	q = [0]*(len(a) - len(b) + 1)
+	for i in range(len(q)):
+		c = r[i]*inverse % m
+		if c == 0:
+			continue
+
+		q[i] = c
+		r[i + 1:i + len(b)] = [(x - c*y) % m for x, y in zip(r[i + 1:i + len(b)], tail)]
+
+	return q, stripZeroes(r[len(q):])
+
+
+# Returns the remainder of a divided by b mod m
+def remainder(a : List[int], b : List[int], m : int) -> List[int]:
+	return divide(a, b, m)[1]
+
+
+# Returns a + b mod m, where the lists are aligned at their constant terms
+def add(a : List[int], b : List[int], m : int) -> List[int]:
+	length = max(len(a), len(b))
+	a = [0]*(length - len(a)) + a
+	b = [0]*(length - len(b)) + b
+	return stripZeroes([(x + y) % m for x, y in zip(a, b)])
+
+
+# Returns a - b mod m, where the lists are aligned at their constant terms
+def subtract(a : List[int], b : List[int], m : int) -> List[int]:
+	length = max(len(a), len(b))
+	a = [0]*(length - len(a)) + a
+	b = [0]*(length - len(b)) + b
+	return stripZeroes([(x - y) % m for x, y in zip(a, b)])
+
+
+# Returns the power series inverse of a mod X^precision, where a is given as a list in ascending order (constant term first)
+# and a[0] has to be invertible mod m. Uses Newton iteration: g -> g*(2 - a*g) doubles the number of correct coefficients
+def inverseSeries(a : List[int], precision : int, m : int) -> List[int]:
+	g = [pow(a[0], -1, m)]
+	correct = 1
+	while correct < precision:
+		correct = min(2*correct, precision)
+		error = Multiplication.multiply(a[:correct], g, m)[:correct]		# a*g mod X^correct, which is 1 + (terms of degree >= correct/2)
+		error = [-c % m for c in error] + [0]*(correct - len(error))
+		error[0] = (error[0] + 2) % m
+		g = Multiplication.multiply(g, error, m)[:correct]
+
+	return g
+
+
+# Reduction modulo a fixed polynomial, with the reversed inverse of the modulus computed once.
+# If rev(p) is p with its coefficients reversed, then for a = q*modulus + r the quotient follows from rev(q) = rev(a)/rev(modulus) mod X^k,
+# with k the number of coefficients of q. So with the power series inverse of rev(modulus), a division costs two multiplications.
+# Usage: reducer = Reducer(h, m), then reducer.reduce(a) returns the remainder of a divided by h and reducer.divide(a) returns (q, r)
+class Reducer:
+	modulus : List[int]
+	mod : int
+	inverse : List[int]		# The power series inverse of rev(modulus), as far as it has been computed
+
+	def __init__(self, modulus : List[int], m : int):
+		self.modulus = stripZeroes([c % m for c in modulus])
+		if self.modulus == [0]:
+			raise Exception("Division by 0")
+
+		self.mod = m
+		# The descending list of the modulus is the ascending list of rev(modulus). Precompute enough to reduce a product of two remainders
+		self.inverse = []
+		self.inverseUpTo(len(self.modulus) - 1)
+
+	# Returns the inverse of rev(modulus) mod X^precision, extending the stored inverse if it is not precise enough yet
+	def inverseUpTo(self, precision : int) -> List[int]:
+		if len(self.inverse) < precision:
+			self.inverse = inverseSeries(self.modulus, max(precision, 2*len(self.inverse)), self.mod)
+
+		return self.inverse[:precision]
+
+	# Returns, in a tuple (q, r), the quotient and remainder of a divided by the modulus
+	def divide(self, a : List[int]) -> Tuple[List[int], List[int]]:
+		m = self.mod
+		a = stripZeroes(a)
+		n = len(self.modulus) - 1		# The degree of the modulus
+		if len(a) <= n:
+			return [0], a
+		if n == 0:
+			return divideClassic(a, self.modulus, m)
+
+		# The descending list of q is the ascending list of rev(q) = rev(a)*rev(modulus)^(-1) mod X^k
+		k = len(a) - n
+		q = Multiplication.multiply(a[:k], self.inverseUpTo(k), m)[:k]
+		q += [0]*(k - len(q))
+		# Only the n lowest coefficients of q*modulus are needed for the remainder, and those only depend on the lowest coefficients of both
+		low = Multiplication.multiply(q[-n:], self.modulus[-n:], m)[-n:]
+		return q, stripZeroes([(x - y) % m for x, y in zip(a[-n:], low)])
+
+	# Returns the remainder of a divided by the modulus
+	def reduce(self, a : List[int]) -> List[int]:
+		return self.divide(a)[1]
+
+
+# Returns the Reducer for the modulus, reusing the one from an earlier call if there is one.
+# Useful when reducing many polynomials by the same divisor, as the inverse of the divisor is computed only once
+def cachedReducer(modulus : List[int], m : int) -> Reducer:
+	key = (tuple(c % m for c in modulus), m)
+	if key in reducerCache:
+		reducerCache.move_to_end(key)
+		return reducerCache[key]
+
+	reducer = Reducer(modulus, m)
+	reducerCache[key] = reducer
+	if len(reducerCache) > REDUCER_CACHE_SIZE:
+		reducerCache.popitem(last=False)
+
+	return reducer
+
+
+# Returns the window size for sliding window exponentiation with an exponent of the given number of bits
+def windowSize(bits : int) -> int:
+	for size, maxBits in enumerate((8, 24, 80, 240, 672, 1792), 1):
+		if bits <= maxBits:
+			return size
+
+	return 7
+
+
+# Returns base^e mod (modulus, m), eg: the remainder of base^e divided by modulus, with sliding window exponentiation.
+# A Reducer for the modulus can be given if there already is one, otherwise it is created here
+def powmod(base : List[int], e : int, modulus : List[int], m : int, reducer : Reducer = None) -> List[int]:
+	if e < 0:
+		raise Exception("Only non-negative exponents are supported")
+
+	if reducer is None:
+		reducer = Reducer(modulus, m)
+
+	result = reducer.reduce([1])
+	if e == 0:
+		return result
+
+	# The odd powers base^1, base^3, ..., base^(2^w - 1), so that every window of w bits takes a single multiplication
+	w = windowSize(e.bit_length())
+	base = reducer.reduce([c % m for c in base])
+	baseSquared = reducer.reduce(Multiplication.square(base, m))
+	oddPowers = [base]
+	for _ in range(1, 1 << (w - 1)):
+		oddPowers.append(reducer.reduce(Multiplication.multiply(oddPowers[-1], baseSquared, m)))
+
+	i = e.bit_length() - 1
+	while i >= 0:
+		if not (e >> i) & 1:
+			result = reducer.reduce(Multiplication.square(result, m))
+			i -= 1
+			continue
+
+		# The window runs from bit i down to bit low, the lowest set bit within w bits
+		low = max(i - w + 1, 0)
+		while not (e >> low) & 1:
+			low += 1
+		for _ in range(i - low + 1):
+			result = reducer.reduce(Multiplication.square(result, m))
+		window = (e >> low) & ((1 << (i - low + 1)) - 1)
+		result = reducer.reduce(Multiplication.multiply(result, oddPowers[window >> 1], m))
+		i = low - 1
+
+	return result
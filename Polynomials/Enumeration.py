@@ -0,0 +1,113 @@
+# Going over all polynomials of a given degree mod m, as coefficient lists (highest degree first, like Polynomial.poly).
+# - generate(degree, m) yields every monic polynomial of the degree, monic=False every polynomial of exactly that degree.
+# 	To stay fast, the same list is yielded every time and changed in place between the steps: copy it to keep it, eg: Polynomial(c, m).
+# - The polynomials are numbered from 0 to count(degree, m) - 1. generate(..., start, stop) only goes over the numbers start <= i < stop,
+# 	so a search that was stopped after k polynomials can be resumed with start=k.
+# - shard(degree, m, k, shards) returns the (start, stop) of the k-th of 'shards' equal parts, so that every worker can go over its own part:
+# 	start, stop = shard(degree, m, k, shards), then generate(degree, m, start=start, stop=stop).
+# - The order: "lexicographic" counts the coefficients up like an odometer, the constant term fastest, eg: X^2, X^2 + 1, X^2 + 2, X^2 + X, ...
+# 	This is the order of PolynomialArithmetic.findIrreducible(d, m, "lexicographic") and polynomialAt(i, ...) is polynomial i in it.
+# 	"gray" is a reflected Gray code: every step changes a single coefficient by +1 or -1, eg: X^2, X^2 + 1, X^2 + 2, X^2 + X + 2, ...
+# 	grayChanges yields which coefficient changed by how much as well, so that eg: the value at a point can be updated with a single
+# 	term instead of evaluating the whole polynomial again.
+from typing import List, Iterator, Tuple
+
+
+# Returns the number of monic polynomials of the degree mod m, or with monic=False of all polynomials of exactly that degree
+def count(degree : int, m : int, monic : bool = True) -> int:
+	return m**degree if monic else (m - 1)*m**degree
+
+
+# Returns the (start, stop) numbers of part k (counting from 0) when the polynomials are split into 'shards' parts of (almost) equal size
+def shard(degree : int, m : int, k : int, shards : int, monic : bool = True) -> Tuple[int, int]:
+	if not 0 <= k < shards:
+		raise Exception("The shard has to be at least 0 and below the number of shards")
+
+	total = count(degree, m, monic)
+	return k*total//shards, (k + 1)*total//shards
+
+
+# Returns the digits of i (lowest first): 'degree' digits mod m for the coefficients of X^0 up to X^(degree - 1),
+# and for monic=False one more digit mod m - 1 for the leading coefficient minus 1
+def digits(i : int, degree : int, m : int, monic : bool) -> List[int]:
+	result = []
+	for _ in range(degree):
+		i, digit = divmod(i, m)
+		result.append(digit)
+	if not monic:
+		result.append(i)
+
+	return result
+
+
+# Returns the coefficient list of polynomial i in lexicographic order
+def polynomialAt(i : int, degree : int, m : int, monic : bool = True) -> List[int]:
+	lower = digits(i, degree, m, monic)
+	lead = 1 if monic else lower.pop() + 1
+	return [lead] + lower[::-1]
+
+
+# Returns the coefficient list of polynomial i in Gray code order
+def grayPolynomialAt(i : int, degree : int, m : int, monic : bool = True) -> List[int]:
+	lower = digits(i, degree, m, monic)
+	lead = 1 if monic else lower.pop() + 1
+	# A digit goes down instead of up when the number formed by the digits above it is odd
+	for k in range(degree):
+		if (i//m**(k + 1)) % 2 == 1:
+			lower[k] = m - 1 - lower[k]
+
+	return [lead] + lower[::-1]
+
+
+# Yields the polynomials start <= i < stop in the given order, see the top of this file
+def generate(degree : int, m : int, monic : bool = True, start : int = 0, stop : int = None, order : str = "lexicographic") -> Iterator[List[int]]:
+	if order == "gray":
+		for coefficients, _, _ in grayChanges(degree, m, monic, start, stop):
+			yield coefficients
+		return
+	if order != "lexicographic":
+		raise Exception("Unknown order: " + str(order))
+
+	total = count(degree, m, monic)
+	stop = total if stop is None else min(stop, total)
+	if start >= stop:
+		return
+
+	coefficients = polynomialAt(start, degree, m, monic)
+	for _ in range(start, stop - 1):
+		yield coefficients
+		# Count up, carrying only as far as needed
+		d = degree
+		coefficients[d] += 1
+		while coefficients[d] == m and d > 0:
+			coefficients[d] = 0
+			d -= 1
+			coefficients[d] += 1
+
+	yield coefficients
+
+
+# Yields (coefficients, d, difference) for the polynomials start <= i < stop in Gray code order, where the coefficient of X^d is the one
+# that changed since the previous polynomial, by difference (+1 or -1). For the first polynomial d and difference are None
+def grayChanges(degree : int, m : int, monic : bool = True, start : int = 0, stop : int = None) -> Iterator[Tuple[List[int], int, int]]:
+	total = count(degree, m, monic)
+	stop = total if stop is None else min(stop, total)
+	if start >= stop:
+		return
+
+	coefficients = grayPolynomialAt(start, degree, m, monic)
+	# The direction in which every coefficient moves, lowest degree first, and the range of values it moves through
+	directions = [-1 if (start//m**(k + 1)) % 2 == 1 else 1 for k in range(degree)] + [1]
+	lowest = [0]*degree + [1]
+	highest = [m - 1]*degree + [m - 1]
+	yield coefficients, None, None
+
+	for _ in range(start + 1, stop):
+		# The lowest coefficient that can still move in its direction moves, those below it turn around
+		k = 0
+		while not lowest[k] <= coefficients[degree - k] + directions[k] <= highest[k]:
+			directions[k] = -directions[k]
+			k += 1
+
+		coefficients[degree - k] += directions[k]
+		yield coefficients, k, directions[k]
@@ -0,0 +1,141 @@
+# Evaluation of coefficient lists (highest degree first, like Polynomial.poly) in one or many points mod m.
+# - horner(c, x, m): the value in a single point, with Horner's rule
+# - evaluate(c, points, m): the values in a list of points. Uses Horner's rule for a few points,
+# 	and the subproduct tree algorithm when there are at least MULTIPOINT_THRESHOLD points.
+# - evaluateAll(c, m): the values in all points 0, 1, ..., m - 1. For a prime m this is done in one pass with Bluestein's algorithm:
+# 	the nonzero points are the powers of a primitive root, so evaluating in all of them is a discrete fourier transform,
+# 	which Bluestein's algorithm turns into a single product that is done by the multiplication engine.
+from MathExtensions import Factoring
+import Multiplication
+import Division
+from typing import List, Dict, Optional
+
+# From this many points on, evaluate uses the subproduct tree instead of Horner's rule for every point
+MULTIPOINT_THRESHOLD = 256
+# Below this many points the subproduct tree is not split any further, and the remaining points are evaluated with Horner's rule
+MULTIPOINT_LEAF_SIZE = 16
+# Below this degree evaluateAll uses Horner's rule for every point, as that is faster than the transform for very small degrees
+EVALUATE_ALL_MIN_DEGREE = 8
+# The number of candidates tried by primitiveRoot before concluding the modulus is not prime
+PRIMITIVE_ROOT_ATTEMPTS = 1000
+
+# Cache of the primitive roots found by primitiveRoot, stored as {m: root}, or {m: None} if m is not prime
+primitiveRoots : Dict[int, Optional[int]] = {}
+
+
+# Returns the value of the polynomial with the given coefficients at x, mod m
+def horner(coefficients : List[int], x : int, m : int) -> int:
+	answer = 0
+	x %= m
+	for c in coefficients:
+		answer = (answer*x + c) % m
+
+	return answer
+
+
+# Returns the values of the polynomial with the given coefficients at each of the points, mod m
+def evaluate(coefficients : List[int], points : List[int], m : int) -> List[int]:
+	points = [x % m for x in points]
+	if len(points) < MULTIPOINT_THRESHOLD:
+		return [horner(coefficients, x, m) for x in points]
+
+	values = []
+	evaluateTree(coefficients, subproductTree(points, m), m, values)
+	return values
+
+
+# Returns the subproduct tree of the points, as nested tuples (product, points, left, right):
+# product is the product of (X - x) for all points x below this node, and left and right are the nodes for the two halves of the points.
+# Groups of at most MULTIPOINT_LEAF_SIZE points are not split any further, for those left and right are None
+def subproductTree(points : List[int], m : int) -> tuple:
+	if len(points) <= MULTIPOINT_LEAF_SIZE:
+		product = [1]
+		for x in points:
+			product = Multiplication.multiply(product, [1, -x % m], m)
+		return product, points, None, None
+
+	half = len(points)//2
+	left = subproductTree(points[:half], m)
+	right = subproductTree(points[half:], m)
+	return Multiplication.multiply(left[0], right[0], m), points, left, right
+
+
+# Appends the values of the polynomial at the points below the node of the subproduct tree to values, in order
+def evaluateTree(coefficients : List[int], node : tuple, m : int, values : List[int]):
+	product, points, left, right = node
+	# Reducing mod the product of (X - x) keeps the values at all those points x the same
+	coefficients = Division.remainder(coefficients, product, m)
+	if left is None:
+		values.extend(horner(coefficients, x, m) for x in points)
+		return
+
+	evaluateTree(coefficients, left, m, values)
+	evaluateTree(coefficients, right, m, values)
+
+
+# Returns a primitive root mod m, or None if m is not prime (or too large to find one within PRIMITIVE_ROOT_ATTEMPTS tries).
+# A root g with g^(m - 1) == 1 and g^((m - 1)/q) != 1 for all primes q dividing m - 1 has order m - 1, which proves that m is prime.
+def primitiveRoot(m : int) -> Optional[int]:
+	if m in primitiveRoots:
+		return primitiveRoots[m]
+
+	root = None
+	if m == 2:
+		root = 1
+	elif m > 2:
+		exponents = [(m - 1)//q for q in Factoring.primeFactorsUnique(m - 1)]
+		for g in range(2, min(m, PRIMITIVE_ROOT_ATTEMPTS + 2)):
+			if pow(g, m - 1, m) == 1 and all(pow(g, e, m) != 1 for e in exponents):
+				root = g
+				break
+
+	primitiveRoots[m] = root
+	return root
+
+
+# Returns the values of the polynomial with the given coefficients at all points 0, 1, ..., m - 1, mod m
+def evaluateAll(coefficients : List[int], m : int) -> List[int]:
+	if len(coefficients) <= EVALUATE_ALL_MIN_DEGREE:
+		return [horner(coefficients, x, m) for x in range(m)]
+
+	g = primitiveRoot(m)
+	if g is None:
+		return evaluate(coefficients, list(range(m)), m)
+
+	values = [0]*m
+	values[0] = coefficients[-1] % m
+	if m == 2:
+		values[1] = sum(coefficients) % m
+		return values
+
+	# For x != 0, x^(m - 1) == 1, so the degrees can be folded onto the degrees 0 to m - 2. Eg: bins[j] is the coefficient at degree j
+	n = m - 1
+	bins = [0]*n
+	for d, c in enumerate(reversed(coefficients)):
+		bins[d % n] += c
+
+	# The value at g^k is the sum of bins[j]*g^(jk). Because jk = C(j + k, 2) - C(j, 2) - C(k, 2), with C(t, 2) = t(t - 1)/2,
+	# this sum is g^(-C(k, 2)) times the sum of (bins[j]*g^(-C(j, 2)))*g^(C(j + k, 2)), which is a single correlation for all k at once.
+	chirp = chirpPowers(g, 2*n - 1, m)		# g^(C(t, 2)) for t = 0, 1, ..., 2n - 2
+	inverseChirp = chirpPowers(pow(g, -1, m), n, m)		# g^(-C(t, 2)) for t = 0, 1, ..., n - 1
+	weighted = [c*w % m for c, w in zip(bins, inverseChirp)]
+	weighted.reverse()
+	correlation = Multiplication.multiply(weighted, chirp, m)
+
+	x = 1
+	for k in range(n):
+		values[x] = correlation[n - 1 + k]*inverseChirp[k] % m
+		x = x*g % m
+
+	return values
+
+
+# Returns the list of g^(C(t, 2)) mod m for t = 0, 1, ..., length - 1
+def chirpPowers(g : int, length : int, m : int) -> List[int]:
+	powers = [1]*length
+	step = 1		# g^t, as C(t + 1, 2) = C(t, 2) + t
+	for t in range(1, length):
+		powers[t] = powers[t - 1]*step % m
+		step = step*g % m
+
+	return powers
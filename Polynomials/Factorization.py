@@ -0,0 +1,233 @@
+# Factorization of coefficient lists (highest degree first, like Polynomial.poly) into monic irreducible polynomials mod a prime p.
+# factor(c, p) runs three stages, which are also available on their own so that a caller can stop after any of them:
+# - squareFree(c, p): writes c as a product of powers g^e, with the g square-free and pairwise coprime. Uses gcd(c, c'), where c' is the
+# 	formal derivative. In characteristic p the derivative of h^p is 0, so the part that is left at the end is a p-th power.
+# - distinctDegree(g, p): splits a square-free g into the products of its irreducible factors of each degree d.
+# 	X^(p^d) - X is the product of all monic irreducible polynomials whose degree divides d, so gcd(g, X^(p^d) - X) for d = 1, 2, ...
+# 	takes out the factors of degree d, once those of lower degree have been removed.
+# - equalDegree(h, d, p): splits a product of distinct irreducible factors that all have degree d, with the algorithm of Cantor and
+# 	Zassenhaus: for a random a, a^((p^d - 1)/2) - 1 is zero modulo about half of the factors, so a gcd with it splits h most of the time.
+#
+# All stages need powers h^p mod g over and over. A FrobeniusMap computes X^(ip) mod g for i < deg(g) once, after which h^p is
+# the sum of h_i*X^(ip): a single pass over a matrix, which is much cheaper than a modular exponentiation for word-size primes.
+import Multiplication
+import Division
+import Gcd
+import random
+from typing import List, Tuple, Callable, Optional
+
+# Up to this degree FrobeniusMap stores the matrix of X^(ip) mod g, above it every power h^p is a modular exponentiation.
+# The matrix takes about degree^2*(2*log2(p) + log2(degree))/8 bytes, eg: 17MB for degree 1000 and a 61 bit prime
+FROBENIUS_MATRIX_MAX_DEGREE = 2000
+# Up to this prime the rows of the matrix are computed by multiplying with X p times, above it by multiplying with X^p mod g.
+# Shifting costs p passes per row and multiplying a fixed amount, measured for degree 600 on CPython 3.11 (shift / multiply):
+# 0.72s / 1.06s for p = 23, 1.03s / 0.65s for p = 31 and 7.7s / 1.2s for p = 251
+FROBENIUS_SHIFT_MAX_PRIME = 23
+# distinctDegree multiplies the candidates X^(p^d) - X of this many degrees d together before taking a single gcd with them
+DISTINCT_DEGREE_BLOCK_SIZE = 16
+
+
+# The map h -> h^p mod g, for a fixed monic g
+# Usage: frobenius = FrobeniusMap(g, p), then frobenius.apply(h) returns h^p mod g, for any h of degree below deg(g)
+class FrobeniusMap:
+	modulus : List[int]
+	p : int
+	reducer : Division.Reducer
+	rows : Optional[List[int]]		# X^(ip) mod g for every i below the degree, packed into one integer per i (see Multiplication.kroneckerPack)
+	width : int		# The number of bytes per coefficient in the packed rows
+
+	def __init__(self, modulus : List[int], p : int):
+		self.modulus = Gcd.monic(modulus, p)
+		self.p = p
+		self.reducer = Division.Reducer(self.modulus, p)
+		n = len(self.modulus) - 1
+		self.rows = None
+		if n < 1 or n > FROBENIUS_MATRIX_MAX_DEGREE:
+			return
+
+		# A coefficient of h^p is a sum of n products of two coefficients below p
+		self.width = max(1, ((n*(p - 1)**2).bit_length() + 7)//8)
+		row = [0]*(n - 1) + [1]		# X^0, with the degrees below n all present
+		xp = None if p <= FROBENIUS_SHIFT_MAX_PRIME else self.padded(Division.powmod([1, 0], p, self.modulus, p, self.reducer))
+		self.rows = []
+		for i in range(n):
+			self.rows.append(Multiplication.kroneckerPack(row, p, self.width))
+			if i == n - 1:
+				break
+			if xp is None:
+				for _ in range(p):
+					row = self.multiplyX(row)
+			else:
+				row = self.padded(self.reducer.reduce(Multiplication.multiply(row, xp, p)))
+
+	# Returns the remainder a mod g with leading zeroes added up to n coefficients
+	def padded(self, a : List[int]) -> List[int]:
+		return [0]*(len(self.modulus) - 1 - len(a)) + a
+
+	# Returns X*a mod g, for a list of exactly n coefficients
+	def multiplyX(self, a : List[int]) -> List[int]:
+		p = self.p
+		lead = a[0]
+		if lead == 0:
+			return a[1:] + [0]
+
+		return [(x - lead*y) % p for x, y in zip(a[1:] + [0], self.modulus[1:])]
+
+	# Returns h^p mod g
+	def apply(self, h : List[int]) -> List[int]:
+		p = self.p
+		if self.rows is None:
+			return Division.powmod(h, p, self.modulus, p, self.reducer)
+
+		n = len(self.modulus) - 1
+		h = self.reducer.reduce([c % p for c in h])
+		# h^p is the sum of h_i*X^(ip), as the coefficients of h are their own p-th powers
+		packed = 0
+		for row, c in zip(self.rows, reversed(h)):
+			if c != 0:
+				packed += c*row
+
+		data = packed.to_bytes(n*self.width, "big")
+		width = self.width
+		return Division.stripZeroes([int.from_bytes(data[i:i + width], "big") % p for i in range(0, n*width, width)])
+
+
+# Returns the factorization of the polynomial into monic irreducible polynomials mod the prime p, as a list of (factor, multiplicity) pairs
+# sorted by degree and then by coefficients. The leading coefficient is not included, eg: factor([2, 0, 2], 3) == [([1, 0], 2)]
+def factor(coefficients : List[int], p : int) -> List[Tuple[List[int], int]]:
+	factors = []
+	for g, e in squareFree(coefficients, p):
+		frobenius = FrobeniusMap(g, p)
+		for h, d in distinctDegree(g, p, frobenius):
+			factors.extend((f, e) for f in equalDegree(h, d, p, frobenius.apply))
+
+	return sorted(factors, key=lambda pair: (len(pair[0]), pair[0]))
+
+
+# Returns the square-free decomposition of the polynomial mod the prime p, as a list of (g, e) pairs with g monic, square-free,
+# of degree at least 1 and coprime to the others, such that the polynomial is its leading coefficient times the product of all g^e
+def squareFree(coefficients : List[int], p : int) -> List[Tuple[List[int], int]]:
+	f = Gcd.monic(coefficients, p)
+	if len(f) < 2:
+		return []
+
+	result = []
+	c = Gcd.gcd(f, derivative(f, p), p)		# The repeated part of f. If the derivative is 0, all of f
+	w = Division.divide(f, c, p)[0]		# The product of the distinct factors of f whose multiplicity is not a multiple of p
+	e = 1
+	# In every step, the factors of multiplicity exactly e drop out of w
+	while len(w) > 1:
+		y = Gcd.gcd(w, c, p)
+		z = Division.divide(w, y, p)[0]
+		if len(z) > 1:
+			result.append((z, e))
+
+		w = y
+		c = Division.divide(c, y, p)[0]
+		e += 1
+
+	# What is left only has multiplicities that are multiples of p, so it is a p-th power
+	if len(c) > 1:
+		result.extend((g, k*p) for g, k in squareFree(pthRoot(c, p), p))
+
+	return result
+
+
+# Returns the formal derivative of the polynomial mod p
+def derivative(coefficients : List[int], p : int) -> List[int]:
+	n = len(coefficients) - 1
+	return Division.stripZeroes([(n - i)*c % p for i, c in enumerate(coefficients[:-1])]) if n > 0 else [0]
+
+
+# Returns the p-th root of a polynomial in which only degrees that are multiples of p appear. Mod p every coefficient is its own p-th root
+def pthRoot(coefficients : List[int], p : int) -> List[int]:
+	return coefficients[::p]
+
+
+# Returns the distinct degree factorization of a monic square-free polynomial mod the prime p, as a list of (h, d) pairs:
+# h is the product of all irreducible factors of degree d, and only the h of degree at least 1 are listed.
+# A FrobeniusMap for the polynomial can be given if there already is one, otherwise it is created here
+def distinctDegree(coefficients : List[int], p : int, frobenius : FrobeniusMap = None) -> List[Tuple[List[int], int]]:
+	f = Gcd.monic(coefficients, p)
+	if frobenius is None:
+		frobenius = FrobeniusMap(f, p)
+
+	result = []
+	rest = f		# The part of f whose factors all have a degree above d
+	x = [1, 0]
+	power = x		# X^(p^d) mod f
+	d = 0
+	while 2*(d + 1) <= len(rest) - 1:
+		# Multiply the candidates for a block of degrees together, so that the gcd only has to be taken once for the whole block
+		block = []
+		product = [1]
+		reducer = Division.Reducer(rest, p)
+		while len(block) < DISTINCT_DEGREE_BLOCK_SIZE and 2*(d + 1) <= len(rest) - 1:
+			d += 1
+			power = frobenius.apply(power)
+			candidate = reducer.reduce(Division.subtract(power, x, p))
+			block.append((candidate, d))
+			product = reducer.reduce(Multiplication.multiply(product, candidate, p))
+
+		# All factors of the degrees in the block are in g, so the candidates only have to be compared with g instead of all of rest
+		g = Gcd.gcd(rest, product, p)
+		if len(g) == 1:
+			continue
+
+		rest = Division.divide(rest, g, p)[0]
+		for candidate, degree in block:
+			h = Gcd.gcd(g, Division.remainder(candidate, g, p), p)
+			if len(h) > 1:
+				result.append((h, degree))
+				g = Division.divide(g, h, p)[0]
+
+	# The part that is left has no factors of degree d or less, so it is irreducible
+	if len(rest) > 1:
+		result.append((rest, len(rest) - 1))
+
+	return result
+
+
+# Returns the irreducible factors of a monic polynomial mod the prime p that is a product of distinct irreducible factors of degree d.
+# frobenius(h) has to return h^p modulo the polynomial (or modulo a multiple of it), eg: FrobeniusMap.apply. If not given, it is
+# a modular exponentiation. The factors are returned in no particular order
+def equalDegree(coefficients : List[int], d : int, p : int, frobenius : Callable[[List[int]], List[int]] = None) -> List[List[int]]:
+	h = Gcd.monic(coefficients, p)
+	if frobenius is None:
+		reducer = Division.Reducer(h, p)
+		frobenius = lambda a: Division.powmod(a, p, h, p, reducer)
+
+	return splitEqualDegree(h, d, p, frobenius)
+
+
+# Splits h as described at equalDegree, recursively
+def splitEqualDegree(h : List[int], d : int, p : int, frobenius : Callable[[List[int]], List[int]]) -> List[List[int]]:
+	n = len(h) - 1
+	if n <= d:
+		return [h]
+
+	reducer = Division.Reducer(h, p)
+	while True:
+		a = Division.stripZeroes([random.randrange(p) for _ in range(n)])
+		if len(a) < 2:
+			continue
+
+		if p == 2:
+			# The trace a + a^2 + a^4 + ... + a^(2^(d - 1)) is 0 or 1 modulo every factor, each with a chance of a half
+			split = a
+			power = a
+			for _ in range(d - 1):
+				power = reducer.reduce(frobenius(power))
+				split = Division.add(split, power, p)
+		else:
+			# a^((p^d - 1)/2) is the norm a^(1 + p + ... + p^(d - 1)) to the power (p - 1)/2
+			norm = a
+			power = a
+			for _ in range(d - 1):
+				power = reducer.reduce(frobenius(power))
+				norm = reducer.reduce(Multiplication.multiply(norm, power, p))
+			split = Division.subtract(Division.powmod(norm, (p - 1)//2, h, p, reducer), [1], p)
+
+		g = Gcd.gcd(h, split, p)
+		if 0 < len(g) - 1 < n:
+			return splitEqualDegree(g, d, p, frobenius) + splitEqualDegree(Division.divide(h, g, p)[0], d, p, frobenius)
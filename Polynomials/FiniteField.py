@@ -0,0 +1,296 @@
+# Finite fields GF(p^n), as the polynomials mod p reduced modulo an irreducible polynomial of degree n.
+# - Creating a field: FiniteField(p, h) with h an irreducible Polynomial mod p, or FiniteField(p, degree=n),
+# 	which picks a sparse irreducible polynomial of degree n with PolynomialArithmetic.findIrreducible. It is cached,
+# 	so FiniteField(p, degree=n) gives the same field every time.
+# - Creating elements: F(c) with F the field and c a list of coefficients (highest degree first), a Polynomial or an integer.
+# 	F.zero(), F.one() and F.x() give the elements 0, 1 and X.
+# - Operations on elements: +, -, *, / and ** (also with integers after the element), -a, a.inverse(), a == b, hash(a), str(a)
+# 	a.polynomial() returns the element as a Polynomial again.
+#
+# All the work for the fixed modulus h is done once, when the field is created:
+# - If h has at most SPARSE_MAX_TERMS terms (a trinomial or pentanomial), a product is reduced with the rule X^n = (the other terms of h),
+# 	which takes a few operations per coefficient.
+# - Otherwise, for small degrees the remainders of X^n, ..., X^(2n - 2) modulo h are stored, and a product is reduced by adding multiples of those.
+# 	For large degrees the reversed inverse of h is stored instead (see Division.Reducer).
+# - For fields with at most LOG_TABLE_MAX_ORDER elements, the powers of a generator g are stored (the antilog table) with their exponents
+# 	(the log table), so multiplying, dividing and raising to a power become lookups: a*b = g^(log(a) + log(b)).
+# Inverses in larger fields come from the extended gcd with h.
+from Polynomial import Polynomial as Poly
+from MathExtensions import Factoring
+import PolynomialArithmetic
+import Irreducibility
+import Multiplication
+import Division
+import Gcd
+from typing import List, Optional
+
+# Moduli with at most this many nonzero terms are reduced with the sparse rule
+SPARSE_MAX_TERMS = 5
+# Fields with at most this many elements get log and antilog tables
+LOG_TABLE_MAX_ORDER = 1 << 16
+
+
+class FiniteField:
+	p : int
+	n : int
+	modulus : Poly
+	order : int		# The number of elements, p^n
+	reduction : str		# How products are reduced: "sparse", "table" or "newton"
+
+	# Constructor. Either give the modulus, an irreducible Polynomial mod p, or the degree to let the field pick one.
+	def __init__(self, p : int, modulus : Poly = None, degree : int = None):
+		if modulus is None:
+			if degree is None:
+				raise Exception("A finite field needs either a modulus or a degree")
+			modulus = PolynomialArithmetic.findIrreducible(degree, p, "sparse", True)
+
+		if modulus.mod() != p:
+			raise Exception("The modulus of the field has to be a polynomial mod p")
+
+		self.p = p
+		self.n = modulus.degreeMax()
+		self.order = p**self.n
+		if self.n < 1 or not Irreducibility.isIrreducible(modulus.polynomial(), p):
+			raise Exception("The modulus of a finite field has to be irreducible, with a degree of at least 1")
+
+		# Work with the monic version of the modulus, as that gives the same field
+		self.modulus = Poly(Gcd.monic(modulus.polynomial(), p), p)
+		self.precomputeReduction()
+
+		self.log : Optional[List[int]] = None
+		self.antilog : Optional[List[List[int]]] = None
+		if self.order <= LOG_TABLE_MAX_ORDER:
+			self.precomputeLogTables()
+
+	# Precomputes what is needed to reduce a product of two elements modulo the modulus
+	def precomputeReduction(self):
+		h = self.modulus.polynomial()
+		n, p = self.n, self.p
+		terms = [(n - i, c) for i, c in enumerate(h) if c != 0]
+		if len(terms) <= SPARSE_MAX_TERMS:
+			# X^n = -(the other terms), stored as (degree, coefficient) pairs
+			self.reduction = "sparse"
+			self.rule = [(d, -c % p) for d, c in terms[1:]]
+		elif n < Division.NEWTON_DIVISION_THRESHOLD:
+			# powers[i] is X^(n + i) mod h, for i = 0, 1, ..., n - 2
+			self.reduction = "table"
+			self.powers = [Division.remainder([1] + [0]*(n + i), h, p) for i in range(n - 1)]
+			self.powers = [[0]*(n - len(power)) + power for power in self.powers]
+		else:
+			self.reduction = "newton"
+			self.reducer = Division.Reducer(h, p)
+
+	# Precomputes the log and antilog tables, using the first generator of the multiplicative group that is found
+	def precomputeLogTables(self):
+		size = self.order - 1
+		exponents = [size//q for q in Factoring.primeFactorsUnique(size)] if size > 1 else []
+		for code in range(1, self.order):
+			g = self.decode(code)
+			if all(self.powerSquareMultiply(g, e) != [1] for e in exponents):
+				break
+
+		self.antilog = [[1]]
+		for _ in range(1, size):
+			self.antilog.append(self.multiplyReduce(self.antilog[-1], g))
+
+		self.log = [-1]*self.order
+		for k, power in enumerate(self.antilog):
+			self.log[self.encode(power)] = k
+
+	# Returns the element with the coefficients, a Polynomial or an integer
+	def __call__(self, value):
+		if isinstance(value, FieldElement):
+			if value.field != self:
+				raise Exception("The element belongs to a different field")
+			return value
+
+		if isinstance(value, int):
+			coefficients = [value]
+		elif isinstance(value, Poly):
+			if value.mod() != self.p:
+				raise Exception("The polynomial has a different modulus than the field")
+			coefficients = value.polynomial()
+		else:
+			coefficients = list(value)
+
+		return FieldElement(self, Division.remainder(coefficients, self.modulus.polynomial(), self.p))
+
+	def zero(self):
+		return FieldElement(self, [0])
+
+	def one(self):
+		return FieldElement(self, [1])
+
+	def x(self):
+		return self([1, 0])
+
+	def __eq__(self, other) -> bool:
+		return isinstance(other, FiniteField) and self.p == other.p and self.modulus == other.modulus
+
+	def __hash__(self) -> int:
+		return hash((self.p, tuple(self.modulus.polynomial())))
+
+	def __str__(self) -> str:
+		return "GF(" + str(self.p) + "^" + str(self.n) + ") = Z/" + str(self.p) + "[X]/(" + str(self.modulus) + ")"
+
+	# Returns the integer with the coefficients as digits in base p. Eg: the index of an element in the log table
+	def encode(self, coefficients : List[int]) -> int:
+		code = 0
+		for c in coefficients:
+			code = code*self.p + c
+
+		return code
+
+	# Returns the coefficients for an integer from encode
+	def decode(self, code : int) -> List[int]:
+		coefficients = []
+		while code > 0:
+			code, c = divmod(code, self.p)
+			coefficients.append(c)
+
+		coefficients.reverse()
+		return coefficients or [0]
+
+	# Returns the remainder of the coefficients (reduced mod p, of degree at most 2n - 2) modulo the modulus
+	def reduce(self, a : List[int]) -> List[int]:
+		n, p = self.n, self.p
+		if len(a) <= n:
+			return Division.stripZeroes(a)
+
+		if self.reduction == "sparse":
+			a = a.copy()
+			for i in range(len(a) - n):
+				c = a[i] % p
+				if c != 0:
+					for d, r in self.rule:
+						a[i + n - d] += c*r
+			return Division.stripZeroes([c % p for c in a[-n:]])
+
+		if self.reduction == "table":
+			high = len(a) - n		# The number of coefficients of degree n and up
+			result = a[-n:]
+			for i in range(high):
+				c = a[i]
+				if c != 0:
+					power = self.powers[high - 1 - i]
+					result = [x + c*y for x, y in zip(result, power)]
+			return Division.stripZeroes([c % p for c in result])
+
+		return self.reducer.reduce(a)
+
+	# Returns the product of two reduced coefficient lists, reduced again
+	def multiplyReduce(self, a : List[int], b : List[int]) -> List[int]:
+		return self.reduce(Multiplication.multiply(a, b, self.p))
+
+	# Returns a^e for a reduced coefficient list, with square and multiply
+	def powerSquareMultiply(self, a : List[int], e : int) -> List[int]:
+		result = [1]
+		for bit in bin(e)[2:]:
+			result = self.multiplyReduce(result, result)
+			if bit == "1":
+				result = self.multiplyReduce(result, a)
+
+		return result
+
+
+class FieldElement:
+	field : FiniteField
+	coefficients : List[int]		# Highest degree first, reduced modulo the modulus of the field
+
+	# Constructor, only meant to be used by FiniteField. Use F(c) to create elements of the field F
+	def __init__(self, field : FiniteField, coefficients : List[int]):
+		self.field = field
+		self.coefficients = coefficients
+		self.code : Optional[int] = None		# The index in the log table, computed when needed
+
+	# Returns the encoding of this element, see FiniteField.encode
+	def encoded(self) -> int:
+		if self.code is None:
+			self.code = self.field.encode(self.coefficients)
+
+		return self.code
+
+	# Returns the element as a Polynomial mod p
+	def polynomial(self) -> Poly:
+		return Poly(self.coefficients, self.field.p)
+
+	def isZero(self) -> bool:
+		return self.coefficients == [0]
+
+	def __str__(self) -> str:
+		return str(self.polynomial())
+
+	def __eq__(self, other) -> bool:
+		if isinstance(other, int):
+			other = self.field(other)
+		if not isinstance(other, FieldElement):
+			return NotImplemented
+
+		return self.field == other.field and self.coefficients == other.coefficients
+
+	def __hash__(self) -> int:
+		return hash((self.field.p, tuple(self.coefficients)))
+
+	# Returns other as an element of the same field, for operations with integers
+	def testOther(self, other):
+		if isinstance(other, int):
+			return self.field(other)
+		if not isinstance(other, FieldElement):
+			raise Exception("You can only do operations with elements of the same field or integers onto a field element")
+		if other.field != self.field:
+			raise Exception("You can only do operations on elements of the same field")
+
+		return other
+
+	def __neg__(self):
+		return FieldElement(self.field, Division.subtract([0], self.coefficients, self.field.p))
+
+	def __add__(self, other):
+		other = self.testOther(other)
+		return FieldElement(self.field, Division.add(self.coefficients, other.coefficients, self.field.p))
+
+	def __sub__(self, other):
+		other = self.testOther(other)
+		return FieldElement(self.field, Division.subtract(self.coefficients, other.coefficients, self.field.p))
+
+	def __mul__(self, other):
+		other = self.testOther(other)
+		field = self.field
+		if self.isZero() or other.isZero():
+			return field.zero()
+
+		if field.log is not None:
+			k = (field.log[self.encoded()] + field.log[other.encoded()]) % (field.order - 1)
+			return FieldElement(field, field.antilog[k])
+
+		return FieldElement(field, field.multiplyReduce(self.coefficients, other.coefficients))
+
+	# Returns the multiplicative inverse of this element. Can raise exception for the zero element
+	def inverse(self):
+		field = self.field
+		if self.isZero():
+			raise Exception("Division by 0")
+
+		if field.log is not None:
+			return FieldElement(field, field.antilog[-field.log[self.encoded()] % (field.order - 1)])
+
+		# x*a + y*h = 1, so x is the inverse of a modulo h
+		x, y, d = Gcd.extendedGcd(self.coefficients, field.modulus.polynomial(), field.p)
+		return FieldElement(field, x)
+
+	def __truediv__(self, other):
+		return self*self.testOther(other).inverse()
+
+	def __pow__(self, e : int):
+		field = self.field
+		if e < 0:
+			return self.inverse()**(-e)
+
+		if self.isZero():
+			return field.one() if e == 0 else field.zero()
+
+		if field.log is not None:
+			return FieldElement(field, field.antilog[field.log[self.encoded()]*e % (field.order - 1)])
+
+		# a^(p^n - 1) = 1 for every nonzero a, so the exponent can be reduced first
+		return FieldElement(field, field.powerSquareMultiply(self.coefficients, e % (field.order - 1)))
@@ -0,0 +1,92 @@
+# FrozenPolynomial: a Polynomial that can not be modified, and can therefore be hashed.
+# It supports the same functionality as Polynomial (see Polynomial.py), and can be used as a key in a dict, in a set or with functools.lru_cache.
+#
+# - Creating one: FrozenPolynomial(c, m), exactly like Polynomial, or FrozenPolynomial.freeze(p) for an existing polynomial p,
+# 	which returns p itself if it is frozen already. p.thaw() returns a normal Polynomial with the same coefficients that can be modified.
+#
+# - The hash is computed once, when the polynomial is created. Two polynomials that are equal have the same hash.
+#
+# - Comparing to something that is not a Polynomial returns False instead of raising an exception (p == None, p == "X" etc.),
+# 	so frozen polynomials can be mixed with other keys.
+#
+# - Operations with a FrozenPolynomial on the left (+, -, *, -p) return a FrozenPolynomial. In-place operations (p += q) create a new one,
+# 	like they do for tuples. Setting a coefficient (p[d] = z), p.axpy() and p.scale() raise an exception.
+# 	copy(p) returns a normal Polynomial (like p.thaw()), so functions that copy their arguments to work on them, like
+# 	PolynomialArithmetic.longDivision and euclidExtended, take frozen polynomials as well.
+from Polynomial import Polynomial
+
+
+class FrozenPolynomial(Polynomial):
+	__slots__ = ("hashValue",)
+
+	hashValue : int
+
+	# Constructor, see Polynomial.__init__. The leading zeroes are always removed, so that equal polynomials have the same hash
+	def __init__(self, coefficients : list, modulo : int, removeLeadingZeroes : bool = True):
+		super().__init__(coefficients, modulo)
+		self.hashValue = hash((tuple(self.poly), self.modulo))
+
+	# Returns the polynomial p as a FrozenPolynomial
+	@staticmethod
+	def freeze(p : Polynomial):
+		if isinstance(p, FrozenPolynomial):
+			return p
+
+		return FrozenPolynomial(p.polynomial(), p.mod())
+
+	# Returns a normal Polynomial with the same coefficients, which can be modified
+	def thaw(self) -> Polynomial:
+		return Polynomial(self.poly, self.mod())
+
+	def __hash__(self) -> int:
+		return self.hashValue
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, Polynomial):
+			return NotImplemented
+
+		if isinstance(other, FrozenPolynomial) and self.hashValue != other.hashValue:
+			return False
+
+		return self.mod() == other.mod() and self.poly == other.polynomial()
+
+	# Returns a copy of the list of coefficients, changing it does not change the polynomial
+	def polynomial(self) -> list:
+		return self.poly.copy()
+
+	# Returns a normal Polynomial with the same coefficients, like thaw(). Code that copies a polynomial does so to modify the copy
+	def __copy__(self):
+		return self.thaw()
+
+	# Raises an exception, a FrozenPolynomial can not be modified
+	def __setitem__(self, degree : int, value : int):
+		raise Exception("A FrozenPolynomial can not be modified, use p.thaw() to get a Polynomial that can")
+
+	# The coefficients are reduced when the polynomial is created, so there is nothing to do
+	def reduce(self):
+		pass
+
+	# Raises an exception, a FrozenPolynomial can not be modified
+	def axpy(self, c : int, k : int, g):
+		raise Exception("A FrozenPolynomial can not be modified, use p.thaw() to get a Polynomial that can")
+
+	# Raises an exception, a FrozenPolynomial can not be modified
+	def scale(self, c : int):
+		raise Exception("A FrozenPolynomial can not be modified, use p.thaw() to get a Polynomial that can")
+
+	def __neg__(self):
+		return FrozenPolynomial.freeze(-self.thaw())
+
+	def __add__(self, other):
+		return FrozenPolynomial.freeze(self.thaw() + other)
+
+	def __sub__(self, other):
+		return FrozenPolynomial.freeze(self.thaw() - other)
+
+	def __mul__(self, other):
+		return FrozenPolynomial.freeze(self.thaw()*other)
+
+	# In-place operations return a new FrozenPolynomial, eg: after p += q, p is a different object
+	__iadd__ = __add__
+	__isub__ = __sub__
+	__imul__ = __mul__
@@ -0,0 +1,146 @@
+# Greatest common divisors of coefficient lists (highest degree first, like Polynomial.poly) mod a prime m.
+# - gcd(a, b, m): the monic gcd
+# - extendedGcd(a, b, m): (x, y, d) such that x*a + y*b = d, with d the monic gcd
+# Both use the classic Euclidean algorithm for small degrees, and the half-gcd algorithm from HALF_GCD_THRESHOLD on.
+#
+# Half-gcd: the first quotients of the Euclidean algorithm on a and b only depend on the highest coefficients of a and b.
+# So the steps that bring the degree down from n to n/2 can be computed recursively from the top halves of a and b,
+# collected in a 2x2 matrix, and applied to a and b at once with fast multiplication. That makes the gcd subquadratic.
+# The matrices are tuples (m00, m01, m10, m11) of coefficient lists, which map (a, b) to (m00*a + m01*b, m10*a + m11*b).
+import Division
+import Multiplication
+from typing import List, Tuple, Optional
+
+# From this degree on the half-gcd algorithm is used, below it the classic Euclidean algorithm
+HALF_GCD_THRESHOLD = 64
+
+IDENTITY = ([1], [0], [0], [1])
+
+
+# Returns the coefficients divided by the leading coefficient, so that the leading coefficient becomes 1. The zero polynomial stays [0]
+def monic(coefficients : List[int], m : int) -> List[int]:
+	coefficients = Division.stripZeroes([c % m for c in coefficients])
+	if coefficients[0] in (0, 1):
+		return coefficients
+
+	inverse = pow(coefficients[0], -1, m)
+	return [c*inverse % m for c in coefficients]
+
+
+# Returns the degree of the polynomial, with -1 for the zero polynomial
+def degree(coefficients : List[int]) -> int:
+	return len(coefficients) - 1 if coefficients != [0] else -1
+
+
+# Returns the monic greatest common divisor of a and b mod m. gcd(0, 0) is returned as [0]
+def gcd(a : List[int], b : List[int], m : int) -> List[int]:
+	a = Division.stripZeroes([c % m for c in a])
+	b = Division.stripZeroes([c % m for c in b])
+	if max(len(a), len(b)) - 1 >= HALF_GCD_THRESHOLD:
+		return extendedGcd(a, b, m, False)[2]
+
+	while b != [0]:
+		a, b = b, Division.remainder(a, b, m)
+
+	return monic(a, m)
+
+
+# Returns, in a tuple (x, y, d), the polynomials such that x*a + y*b = d mod m, with d the monic gcd of a and b.
+# With bezout=False the coefficients x and y are not computed, and (None, None, d) is returned
+def extendedGcd(a : List[int], b : List[int], m : int, bezout : bool = True) -> Tuple[Optional[List[int]], Optional[List[int]], List[int]]:
+	a = Division.stripZeroes([c % m for c in a])
+	b = Division.stripZeroes([c % m for c in b])
+	swapped = degree(a) < degree(b)
+	if swapped:
+		a, b = b, a
+
+	matrix = IDENTITY
+	while b != [0]:
+		# The half-gcd only pays off when it can do more than a single division step
+		if degree(a) >= HALF_GCD_THRESHOLD and 2*degree(b) > degree(a):
+			step = halfGcd(a, b, m)
+			a, b = applyMatrix(step, a, b, m)
+			if bezout:
+				matrix = multiplyMatrices(step, matrix, m)
+		else:
+			q, r = Division.divide(a, b, m)
+			a, b = b, r
+			if bezout:
+				matrix = euclidStep(q, matrix, m)
+
+	if a == [0]:
+		return ([0], [0], [0]) if bezout else (None, None, [0])
+
+	inverse = pow(a[0], -1, m)
+	d = [c*inverse % m for c in a]
+	if not bezout:
+		return None, None, d
+
+	x = [c*inverse % m for c in matrix[0]]
+	y = [c*inverse % m for c in matrix[1]]
+	return (y, x, d) if swapped else (x, y, d)
+
+
+# Returns the matrix of the Euclidean steps on a and b (with deg(a) >= deg(b)) that bring the degree of b below half the degree of a.
+# Eg: if the matrix maps (a, b) to (c, d), then c and d are consecutive remainders of the Euclidean algorithm with deg(d) < ceil(deg(a)/2) <= deg(c)
+def halfGcd(a : List[int], b : List[int], m : int) -> tuple:
+	half = (degree(a) + 1)//2
+	if degree(b) < half:
+		return IDENTITY
+
+	if degree(a) < HALF_GCD_THRESHOLD:
+		matrix = IDENTITY
+		while degree(b) >= half:
+			q, r = Division.divide(a, b, m)
+			a, b = b, r
+			matrix = euclidStep(q, matrix, m)
+		return matrix
+
+	# The steps for the top halves of a and b are also the first steps for a and b themselves
+	first = halfGcd(shiftDown(a, half), shiftDown(b, half), m)
+	a, b = applyMatrix(first, a, b, m)
+	if degree(b) < half:
+		return first
+
+	q, r = Division.divide(a, b, m)
+	a, b = b, r
+	first = euclidStep(q, first, m)
+	if b == [0]:
+		return first
+
+	k = max(2*half - degree(a), 0)
+	second = halfGcd(shiftDown(a, k), shiftDown(b, k), m)
+	return multiplyMatrices(second, first, m)
+
+
+# Returns the polynomial divided by X^k, without the remainder. In the descending list that simply drops the k last coefficients
+def shiftDown(coefficients : List[int], k : int) -> List[int]:
+	if len(coefficients) <= k:
+		return [0]
+
+	return coefficients[:len(coefficients) - k]
+
+
+# Returns the matrix of one Euclidean step with quotient q, (a, b) -> (b, a - q*b), followed after the matrix
+def euclidStep(q : List[int], matrix : tuple, m : int) -> tuple:
+	m00, m01, m10, m11 = matrix
+	return (m10, m11,
+		Division.subtract(m00, Multiplication.multiply(q, m10, m), m),
+		Division.subtract(m01, Multiplication.multiply(q, m11, m), m))
+
+
+# Returns the pair (m00*a + m01*b, m10*a + m11*b)
+def applyMatrix(matrix : tuple, a : List[int], b : List[int], m : int) -> Tuple[List[int], List[int]]:
+	m00, m01, m10, m11 = matrix
+	return (Division.add(Multiplication.multiply(m00, a, m), Multiplication.multiply(m01, b, m), m),
+		Division.add(Multiplication.multiply(m10, a, m), Multiplication.multiply(m11, b, m), m))
+
+
+# Returns the matrix product s*t, the matrix that first applies t and then s
+def multiplyMatrices(s : tuple, t : tuple, m : int) -> tuple:
+	s00, s01, s10, s11 = s
+	t00, t01, t10, t11 = t
+	return (Division.add(Multiplication.multiply(s00, t00, m), Multiplication.multiply(s01, t10, m), m),
+		Division.add(Multiplication.multiply(s00, t01, m), Multiplication.multiply(s01, t11, m), m),
+		Division.add(Multiplication.multiply(s10, t00, m), Multiplication.multiply(s11, t10, m), m),
+		Division.add(Multiplication.multiply(s10, t01, m), Multiplication.multiply(s11, t11, m), m))
@@ -0,0 +1,216 @@
+# Counting where the time goes in polynomial arithmetic. Nothing is measured unless a Profile is active:
+# with Instrumentation.Profile() as profile:
+# 	PolynomialArithmetic.euclidExtended(f, g)
+# print(profile.report())
+#
+# - While a Profile is active, every method of Polynomial and every function of PolynomialArithmetic is replaced with a wrapper that counts,
+# 	per function: the calls, the wall time (total, and without the instrumented functions it called), the polynomials created
+# 	(calls of Polynomial.__init__) and the coefficient operations (see below). Other classes and modules can be instrumented as well,
+# 	eg: Profile([Polynomial, PolynomialArithmetic, Division]).
+# - The same numbers are kept per call site: the file, line and function from which the instrumented function was called.
+# 	So for a slow longDivision, the report shows which lines of longDivision create the polynomials, call findQ or do the axpy steps.
+# - When the Profile ends, the original functions are put back, so when no Profile is active there is no overhead at all.
+#
+# The coefficient operations are an estimate from the sizes of the polynomials: the number of coefficient additions or multiplications
+# the elementary operations (COEFFICIENT_OPERATIONS) would do with the schoolbook algorithms. The fast multiplication algorithms
+# do fewer. Operations done inside another elementary operation (eg: the axpy inside a subtraction) are only counted once.
+# All counts include those of the instrumented functions called, so the numbers of longDivision include its axpy steps.
+from Polynomial import Polynomial
+import PolynomialArithmetic
+from typing import List, Dict, Tuple, Callable
+import functools
+import inspect
+import sys
+import time
+
+
+# Returns the number of coefficients of p, or 1 for an integer
+def size(p) -> int:
+	return p.degreeMax() + 1 if isinstance(p, Polynomial) else 1
+
+
+# The estimated number of coefficient operations of the elementary operations, as a function of their arguments
+COEFFICIENT_OPERATIONS : Dict[str, Callable] = {
+	"__neg__": lambda f: size(f),
+	"__add__": lambda f, g: max(size(f), size(g)),
+	"__sub__": lambda f, g: max(size(f), size(g)),
+	"__iadd__": lambda f, g: max(size(f), size(g)),
+	"__isub__": lambda f, g: max(size(f), size(g)),
+	"__mul__": lambda f, g: size(f)*size(g),
+	"__imul__": lambda f, g: size(f)*size(g),
+	"addInt": lambda f, c: 1,
+	"mulInt": lambda f, c: size(f),
+	"scale": lambda f, c: size(f),
+	"axpy": lambda f, c, k, g: size(g),
+	"reduce": lambda f: size(f),
+	"compute": lambda f, x: size(f),
+	"evaluate": lambda f, points: size(f)*len(points),
+	"findQ": lambda a, b, m: 1,
+	"modInverse": lambda a, m: 1
+}
+
+
+# The counts of one function, or of one call site of a function
+class Statistics:
+	calls : int
+	time : float		# Seconds, including the time of the functions it called
+	selfTime : float		# Seconds, without the time of the instrumented functions it called
+	allocations : int
+	coefficientOperations : int
+
+	def __init__(self):
+		self.calls = 0
+		self.time = 0.0
+		self.selfTime = 0.0
+		self.allocations = 0
+		self.coefficientOperations = 0
+
+	# Adds the counts of one call
+	def add(self, time : float, selfTime : float, allocations : int, coefficientOperations : int):
+		self.calls += 1
+		self.time += time
+		self.selfTime += selfTime
+		self.allocations += allocations
+		self.coefficientOperations += coefficientOperations
+
+	# Returns the counts as a dictionary
+	def asDict(self) -> dict:
+		return {"calls": self.calls, "time": self.time, "selfTime": self.selfTime, "allocations": self.allocations,
+				"coefficientOperations": self.coefficientOperations}
+
+
+# Usage: see the top of this file. Only one Profile can be active at a time
+class Profile:
+	active = None		# The Profile that is active right now, if any
+
+	targets : list
+	functions : Dict[str, Statistics]		# By the name of the function, eg: "Polynomial.__mul__"
+	sites : Dict[Tuple[str, str], Statistics]		# By the name of the function and the call site, eg: "PolynomialArithmetic.py:74 longDivision"
+
+	# Constructor, targets are the classes and modules whose functions are instrumented
+	def __init__(self, targets : list = None):
+		self.targets = targets if targets is not None else [Polynomial, PolynomialArithmetic]
+		self.functions = {}
+		self.sites = {}
+		self.originals = []		# (target, attribute name, original value), to put back at the end
+		self.stack = []		# The time spent in called instrumented functions, per active call
+		self.allocations = 0
+		self.coefficientOperations = 0
+		self.elementaryDepth = 0		# The number of elementary operations that are running, see the top of this file
+		self.busy = False		# True while the profile itself calls instrumented functions, so that those are not counted
+
+	def __enter__(self):
+		if Profile.active is not None:
+			raise Exception("Another Profile is already active")
+
+		Profile.active = self
+		for target in self.targets:
+			for name, value in list(vars(target).items()):
+				wrapped = self.wrap(target, name, value)
+				if wrapped is not None:
+					self.originals.append((target, name, value))
+					setattr(target, name, wrapped)
+
+		return self
+
+	def __exit__(self, *exception):
+		for target, name, value in reversed(self.originals):
+			setattr(target, name, value)
+		self.originals.clear()
+		Profile.active = None
+
+	# Returns the instrumented version of an attribute of a class or module, or None if it is not a function that should be instrumented
+	def wrap(self, target, name : str, value):
+		if isinstance(value, staticmethod):
+			wrapped = self.wrap(target, name, value.__func__)
+			return None if wrapped is None else staticmethod(wrapped)
+
+		if not inspect.isfunction(value) or name in ("__str__", "__repr__", "__hash__", "__eq__"):
+			return None
+
+		# Functions that a module imported from elsewhere are counted where they are defined
+		if inspect.ismodule(target) and value.__module__ != target.__name__:
+			return None
+
+		label = target.__name__ + "." + name
+		cost = COEFFICIENT_OPERATIONS.get(name)
+		allocates = target is Polynomial and name == "__init__"
+		profile = self
+
+		@functools.wraps(value)
+		def instrumented(*arguments, **keywords):
+			if profile.busy:
+				return value(*arguments, **keywords)
+
+			caller = sys._getframe(1)
+			site = "%s:%d %s" % (caller.f_code.co_filename.rsplit("/", 1)[-1], caller.f_lineno, caller.f_code.co_name)
+			if allocates:
+				profile.allocations += 1
+
+			operations = 0
+			if cost is not None and profile.elementaryDepth == 0:
+				profile.busy = True
+				try:
+					operations = cost(*arguments, **keywords)
+				except Exception:
+					operations = 0
+				profile.busy = False
+				profile.coefficientOperations += operations
+
+			allocationsBefore = profile.allocations
+			operationsBefore = profile.coefficientOperations
+			if cost is not None:
+				profile.elementaryDepth += 1
+			profile.stack.append(0.0)
+			start = time.perf_counter()
+			try:
+				return value(*arguments, **keywords)
+			finally:
+				elapsed = time.perf_counter() - start
+				childTime = profile.stack.pop()
+				if profile.stack:
+					profile.stack[-1] += elapsed
+				if cost is not None:
+					profile.elementaryDepth -= 1
+				profile.record(label, site, elapsed, elapsed - childTime, profile.allocations - allocationsBefore + allocates,
+						profile.coefficientOperations - operationsBefore + operations)
+
+		return instrumented
+
+	# Adds the counts of one call to the function and to the call site
+	def record(self, label : str, site : str, elapsed : float, selfTime : float, allocations : int, coefficientOperations : int):
+		if label not in self.functions:
+			self.functions[label] = Statistics()
+		self.functions[label].add(elapsed, selfTime, allocations, coefficientOperations)
+
+		key = (label, site)
+		if key not in self.sites:
+			self.sites[key] = Statistics()
+		self.sites[key].add(elapsed, selfTime, allocations, coefficientOperations)
+
+	# Returns all counts as {"functions": {name: counts}, "sites": {name: {site: counts}}}, see Statistics.asDict
+	def statistics(self) -> dict:
+		sites = {}
+		for (label, site), statistics in self.sites.items():
+			sites.setdefault(label, {})[site] = statistics.asDict()
+
+		return {"functions": {label: statistics.asDict() for label, statistics in self.functions.items()}, "sites": sites}
+
+	# Returns a table of the functions sorted by their time without the called functions, with the call sites of each under it.
+	# Only the 'limit' most expensive functions are shown, and of every function the 'siteLimit' most expensive call sites
+	def report(self, limit : int = 20, siteLimit : int = 5) -> str:
+		lines = ["%-52s %10s %12s %12s %12s %16s" % ("function / call site", "calls", "time", "self time", "allocations", "coefficient ops")]
+		functions = sorted(self.functions.items(), key=lambda item: item[1].selfTime, reverse=True)
+		for label, statistics in functions[:limit]:
+			lines.append(self.reportLine(label, statistics))
+			sites = sorted(((site, s) for (name, site), s in self.sites.items() if name == label), key=lambda item: item[1].time, reverse=True)
+			for site, siteStatistics in sites[:siteLimit]:
+				lines.append(self.reportLine("  " + site, siteStatistics))
+
+		return "\n".join(lines)
+
+	# Returns one line of the report
+	@staticmethod
+	def reportLine(label : str, statistics : Statistics) -> str:
+		return "%-52s %10d %11.6fs %11.6fs %12d %16d" % (label[:52], statistics.calls, statistics.time, statistics.selfTime,
+				statistics.allocations, statistics.coefficientOperations)
@@ -0,0 +1,90 @@
+# Irreducibility tests for coefficient lists (highest degree first, like Polynomial.poly) mod a prime p.
+# Both tests use the Frobenius powers X^(p^i) mod f, which cost one modular exponentiation each, so they run in time polynomial in log(p).
+# - Rabin's test: f of degree n is irreducible exactly when X^(p^n) == X mod f and gcd(f, X^(p^(n/q)) - X) == 1 for every prime q dividing n
+# - Ben-Or's test: f is irreducible exactly when gcd(f, X^(p^i) - X) == 1 for all i <= n/2.
+# 	As this stops at the first i for which f has an irreducible factor of degree i, it is usually much faster for random polynomials,
+# 	most of which have a small factor.
+#
+# The Frobenius powers can be kept between calls with cache=True, which is useful when asking about the same f more than once.
+# Only the powers of the FROBENIUS_CACHE_SIZE polynomials used most recently are kept.
+from MathExtensions import Factoring
+import Division
+import Gcd
+from collections import OrderedDict
+from typing import List, Tuple
+
+# The number of polynomials whose Frobenius powers are kept with cache=True
+FROBENIUS_CACHE_SIZE = 32
+
+# Cache of the Frobenius powers per polynomial, stored as {(coefficients, p): [X, X^p, X^(p^2), ...] mod f}, least recently used first
+frobeniusCache : "OrderedDict[Tuple[Tuple[int, ...], int], List[List[int]]]" = OrderedDict()
+
+
+# Returns whether the polynomial is irreducible mod the prime p. method is either "rabin" or "benor", see the top of this file
+def isIrreducible(coefficients : List[int], p : int, method : str = "rabin", cache : bool = False) -> bool:
+	f = Gcd.monic(coefficients, p)
+	n = len(f) - 1
+	# Polynomials of degree 1 and 0 are always irreducible
+	if n < 2:
+		return True
+
+	if method == "rabin":
+		return rabin(f, p, cache)
+	if method == "benor":
+		return benOr(f, p, cache)
+
+	raise Exception("Unknown irreducibility test: " + str(method))
+
+
+# Rabin's test on the monic polynomial f of degree at least 2
+def rabin(f : List[int], p : int, cache : bool = False) -> bool:
+	n = len(f) - 1
+	powers = frobeniusPowers(f, p, n, cache)
+	if powers[n] != [1, 0]:
+		return False
+
+	for q in Factoring.primeFactorsUnique(n):
+		if Gcd.gcd(f, Division.subtract(powers[n//q], [1, 0], p), p) != [1]:
+			return False
+
+	return True
+
+
+# Ben-Or's test on the monic polynomial f of degree at least 2
+def benOr(f : List[int], p : int, cache : bool = False) -> bool:
+	n = len(f) - 1
+	powers = cachedPowers(f, p) if cache else [Division.remainder([1, 0], f, p)]
+	for i in range(1, n//2 + 1):
+		if i == len(powers):
+			powers.append(Division.powmod(powers[-1], p, f, p))
+
+		if Gcd.gcd(f, Division.subtract(powers[i], [1, 0], p), p) != [1]:
+			return False
+
+	return True
+
+
+# Returns the list [X, X^p, X^(p^2), ..., X^(p^count)] mod (f, p).
+# With cache=True the powers are stored in frobeniusCache, and the ones computed in earlier calls are reused
+def frobeniusPowers(f : List[int], p : int, count : int, cache : bool = False) -> List[List[int]]:
+	powers = cachedPowers(f, p) if cache else [Division.remainder([1, 0], f, p)]
+	while len(powers) <= count:
+		powers.append(Division.powmod(powers[-1], p, f, p))
+
+	return powers[:count + 1]
+
+
+# Returns the list of Frobenius powers of f stored in frobeniusCache, which the caller extends in place.
+# A new list starts with just X mod f, and the least recently used polynomial is dropped once there are more than FROBENIUS_CACHE_SIZE
+def cachedPowers(f : List[int], p : int) -> List[List[int]]:
+	key = (tuple(f), p)
+	if key in frobeniusCache:
+		frobeniusCache.move_to_end(key)
+		return frobeniusCache[key]
+
+	powers = [Division.remainder([1, 0], f, p)]
+	frobeniusCache[key] = powers
+	if len(frobeniusCache) > FROBENIUS_CACHE_SIZE:
+		frobeniusCache.popitem(last=False)
+
+	return powers
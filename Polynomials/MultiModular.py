@@ -0,0 +1,362 @@
+# Multi-modular arithmetic: working with huge coefficients as their residues mod several word-size primes (channels),
+# and rebuilding them with the Chinese remainder theorem (CRT).
+# - The channel primes are the primes p = c*2^CHANNEL_TWO_ADICITY + 1 just below 2^CHANNEL_BITS, found with Prime.MillerRabinTest
+# 	(which is exact below 2^64). The form allows Multiplication.ntt in every channel for long products.
+# 	channelPrimes(k) returns the first k of them, CRTBasis(primes) precomputes what is needed to rebuild numbers from their residues.
+# - multiplyExact(a, b) returns the exact product of two polynomials with integer coefficients (of any sign): it uses just enough
+# 	channels for the bound on the coefficients of the product, multiplies in every channel and rebuilds the coefficients.
+# - multiply(a, b, m) returns the product mod any modulus m, as the exact product of the reduced coefficients reduced mod m.
+# 	For huge moduli this replaces one product of enormous packed integers (or karatsuba on big integers) by many products of
+# 	word-size coefficients, Multiplication.multiply uses it from Multiplication.MULTI_MODULAR_MIN_BITS on.
+# 	Both take an optional executor (eg: a concurrent.futures.ProcessPoolExecutor), which then multiplies the channels in parallel.
+# - MultiModularPolynomial(c, m) is a Polynomial for a modulus that is a product of distinct primes of at most 63 bits.
+# 	Z/m is then the same as the product of all Z/p, so the polynomial is stored as one coefficient list per prime and
+# 	+, -, *, p.compute(x) and p.evaluate(points) are done in every channel on its own, without any big integers.
+# 	The coefficients are only rebuilt when they are asked for (p.poly, p.polynomial(), p[d], str(p)).
+from Polynomial import Polynomial
+from MathExtensions import Prime, Factoring
+import Multiplication
+import Evaluation
+from concurrent.futures import Executor
+from typing import List, Dict, Callable
+
+# The number of bits of the channel primes
+CHANNEL_BITS = 62
+# 2^CHANNEL_TWO_ADICITY divides p - 1 for every channel prime p, so the ntt can be used for products up to that length
+CHANNEL_TWO_ADICITY = 24
+# The largest prime that MultiModularPolynomial can use as a channel
+CHANNEL_MAX_PRIME = 1 << 63
+
+# The channel primes found so far, in descending order
+channels : List[int] = []
+# The CRT bases for the first k channel primes, stored as {k: basis}
+bases : Dict[int, "CRTBasis"] = {}
+
+
+# Returns the first k channel primes, see the top of this file
+def channelPrimes(k : int) -> List[int]:
+	c = (channels[-1] - 1 >> CHANNEL_TWO_ADICITY) - 1 if channels else ((1 << CHANNEL_BITS) - 1 >> CHANNEL_TWO_ADICITY)
+	while len(channels) < k:
+		if c < 1:
+			raise Exception("There are not enough channel primes")
+
+		p = (c << CHANNEL_TWO_ADICITY) + 1
+		if Prime.MillerRabinTest(p):
+			channels.append(p)
+		c -= 1
+
+	return channels[:k]
+
+
+# Returns the CRTBasis of the first channel primes whose product is above 2*bound, so that every integer of absolute value
+# at most bound can be rebuilt from its residues
+def basisForBound(bound : int) -> "CRTBasis":
+	k = max(1, -(-(2*bound + 1).bit_length()//(CHANNEL_BITS - 1)))
+	while True:
+		if k not in bases:
+			bases[k] = CRTBasis(channelPrimes(k))
+		if bases[k].modulus > 2*bound:
+			return bases[k]
+		k += 1
+
+
+# The precomputed values for rebuilding a number mod the product M of the primes from its residues mod each prime:
+# x = sum(((r_i*w_i) mod p_i)*(M/p_i)) mod M, with w_i = (M/p_i)^(-1) mod p_i
+# Usage: basis = CRTBasis(primes), then basis.split(coefficients) and basis.combine(channels)
+class CRTBasis:
+	primes : List[int]
+	modulus : int		# The product of the primes
+	cofactors : List[int]		# M/p_i
+	weights : List[int]		# (M/p_i)^(-1) mod p_i
+
+	def __init__(self, primes : List[int]):
+		self.primes = list(primes)
+		self.modulus = 1
+		for p in self.primes:
+			self.modulus *= p
+		self.cofactors = [self.modulus//p for p in self.primes]
+		self.weights = [pow(cofactor, -1, p) for cofactor, p in zip(self.cofactors, self.primes)]
+
+	# Returns the coefficients reduced mod every prime, one list per prime
+	def split(self, coefficients : List[int]) -> List[List[int]]:
+		return [[c % p for c in coefficients] for p in self.primes]
+
+	# Returns the coefficients rebuilt from their residues (one list per prime, all of the same length) mod the product of the primes.
+	# With signed=True they are returned in the range -M/2 < x <= M/2 instead, for rebuilding negative numbers
+	def combine(self, channels : List[List[int]], signed : bool = False) -> List[int]:
+		M = self.modulus
+		result = [0]*len(channels[0])
+		for residues, p, weight, cofactor in zip(channels, self.primes, self.weights, self.cofactors):
+			for i, r in enumerate(residues):
+				if r != 0:
+					result[i] += (r*weight % p)*cofactor
+
+		if signed:
+			half = M//2
+			return [x % M - M if x % M > half else x % M for x in result]
+
+		return [x % M for x in result]
+
+
+# Returns [function(*arguments) for arguments in zip(*iterables)], on the executor if one is given
+def mapChannels(function : Callable, *iterables, executor : Executor = None) -> list:
+	if executor is None:
+		return list(map(function, *iterables))
+
+	return list(executor.map(function, *iterables))
+
+
+# Returns the exact product of two polynomials with integer coefficients (of any sign), see the top of this file
+def multiplyExact(a : List[int], b : List[int], executor : Executor = None) -> List[int]:
+	if not a or not b:
+		return [0]
+
+	bound = min(len(a), len(b))*max(abs(c) for c in a)*max(abs(c) for c in b)
+	if bound == 0:
+		return [0]*(len(a) + len(b) - 1)
+
+	basis = basisForBound(bound)
+	products = mapChannels(Multiplication.multiply, basis.split(a), basis.split(b), basis.primes, executor=executor)
+	return basis.combine(products, True)
+
+
+# Returns the product of a and b mod m, through the exact product of their reduced coefficients
+def multiply(a : List[int], b : List[int], m : int, executor : Executor = None) -> List[int]:
+	return [c % m for c in multiplyExact([c % m for c in a], [c % m for c in b], executor)]
+
+
+# The CRT bases of the moduli of MultiModularPolynomials, stored as {m: basis}
+moduliBases : Dict[int, CRTBasis] = {}
+
+
+# Returns the CRTBasis of the primes of m, which has to be a product of distinct primes of at most CHANNEL_MAX_PRIME.
+# The primes can be given if they are known, otherwise m is factored
+def moduliBasis(m : int, primes : List[int] = None) -> CRTBasis:
+	if m in moduliBases:
+		return moduliBases[m]
+
+	if primes is None:
+		factorization = Factoring.factorization(m)
+		if any(e > 1 for e in factorization.values()):
+			raise Exception("A MultiModularPolynomial needs a modulus without repeated prime factors")
+		primes = list(factorization)
+
+	product = 1
+	for p in primes:
+		product *= p
+	if product != m or len(set(primes)) != len(primes) or not all(p <= CHANNEL_MAX_PRIME and Prime.prime(p) for p in primes):
+		raise Exception("A MultiModularPolynomial needs a modulus that is a product of distinct primes of at most 63 bits")
+
+	moduliBases[m] = CRTBasis(primes)
+	return moduliBases[m]
+
+
+class MultiModularPolynomial(Polynomial):
+	__slots__ = ("channels", "basis")
+
+	channels : List[List[int]]		# The coefficients (highest degree first) mod every prime of the basis, all of the same length
+	basis : CRTBasis
+
+	# Constructor, see Polynomial.__init__. The primes of the modulus can be given, otherwise the modulus is factored (once per modulus)
+	def __init__(self, coefficients : list, modulo : int, removeLeadingZeroes : bool = True, primes : List[int] = None):
+		self.modulo = modulo
+		self.basis = moduliBasis(modulo, primes)
+		self.channels = self.basis.split(list(coefficients) or [0])
+		if removeLeadingZeroes:
+			self.stripZeroes()
+
+	# Returns a MultiModularPolynomial with the same modulus around channels that are reduced and of the same length, without copying them
+	def wrap(self, channels : List[List[int]], removeLeadingZeroes : bool = True):
+		result = MultiModularPolynomial.__new__(MultiModularPolynomial)
+		result.modulo = self.modulo
+		result.basis = self.basis
+		result.channels = channels
+		if removeLeadingZeroes:
+			result.stripZeroes()
+
+		return result
+
+	# Returns a MultiModularPolynomial with the same coefficients as the Polynomial p
+	@staticmethod
+	def fromPolynomial(p : Polynomial):
+		return MultiModularPolynomial(p.polynomial(), p.mod())
+
+	# Returns a normal Polynomial with the same coefficients as this one
+	def toPolynomial(self) -> Polynomial:
+		return Polynomial(self.polynomial(), self.mod())
+
+	# Returns the coefficients highest degree first, rebuilt from the channels. This is a new list, changing it does not change the polynomial
+	@property
+	def poly(self) -> list:
+		return self.basis.combine(self.channels)
+
+	# Returns the channels of other, which has to have the same modulus
+	def channelsOf(self, other) -> List[List[int]]:
+		if isinstance(other, MultiModularPolynomial):
+			return other.channels
+
+		return self.basis.split(other.polynomial())
+
+	# Returns the coefficient at degree 'degree'
+	def __getitem__(self, degree : int) -> int:
+		if degree > self.degreeMax():
+			return 0
+
+		i = self.degreeIndex(degree)
+		return self.basis.combine([[residues[i]] for residues in self.channels])[0]
+
+	# Functionality for saying p[i] = something. Like for Polynomial, nothing happens for degrees above the max degree,
+	# and a leading coefficient set to 0 is kept until stripZeroes() is called
+	def __setitem__(self, degree : int, value : int):
+		if degree > self.degreeMax():
+			return
+
+		i = self.degreeIndex(degree)
+		for residues, p in zip(self.channels, self.basis.primes):
+			residues[i] = value % p
+
+	# Reduces the current polynomial with the modulus. The channels are always reduced already
+	def reduce(self):
+		pass
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, Polynomial):
+			raise Exception("You can only compare Polynomials to other Polynomials")
+
+		if self.mod() != other.mod() or self.degreeMax() != other.degreeMax():
+			return False
+
+		return self.channels == self.channelsOf(other)
+
+	# Returns the max degree of the polynomial
+	def degreeMax(self) -> int:
+		return len(self.channels[0]) - 1
+
+	# Returns whether the polynomial represents 0
+	def isZero(self) -> bool:
+		return not any(any(residues) for residues in self.channels)
+
+	# Modifies the polynomial to get rid of the leading zero terms, which are the ones that are zero in every channel
+	def stripZeroes(self):
+		length = len(self.channels[0])
+		start = 0
+		while start < length - 1 and not any(residues[start] for residues in self.channels):
+			start += 1
+		if start > 0:
+			for residues in self.channels:
+				del residues[:start]
+
+	# Returns a copy of this polynomial with zeroes added up to degree 'degree'
+	def extendedZeros(self, degree : int):
+		padding = [0]*max(0, degree - self.degreeMax())
+		return self.wrap([padding + residues for residues in self.channels], False)
+
+	# Returns the list of coefficients of this polynomial, highest degree first
+	def polynomial(self) -> list:
+		return self.poly
+
+	# Returns a new polynomial that is a copy of this one
+	def __copy__(self):
+		return self.wrap([residues.copy() for residues in self.channels], False)
+
+	# Negation operation, eg: -a
+	def __neg__(self):
+		return self.wrap([[-c % p for c in residues] for residues, p in zip(self.channels, self.basis.primes)], False)
+
+	# Addition operation, eg: a + b
+	def __add__(self, other):
+		if isinstance(other, int):
+			return self.addInt(other)
+
+		self.testOther(other)
+		return self.__copy__().axpy(1, 0, other)
+
+	# Addition with a normal Polynomial on the left, eg: p + a. Python tries this before Polynomial.__add__, as this is a subclass
+	def __radd__(self, other):
+		return self + other
+
+	# Adds an integer to a polynomial
+	def addInt(self, other):
+		result = self.__copy__()
+		for residues, p in zip(result.channels, self.basis.primes):
+			residues[-1] = (residues[-1] + other) % p
+		result.stripZeroes()
+		return result
+
+	# Subtraction operation, eg: a - b
+	def __sub__(self, other):
+		if isinstance(other, int):
+			return self.addInt(-other)
+
+		self.testOther(other)
+		return self.__copy__().axpy(-1, 0, other)
+
+	# Subtraction with a normal Polynomial on the left, eg: p - a
+	def __rsub__(self, other):
+		self.testOther(other)
+		return MultiModularPolynomial.fromPolynomial(other).axpy(-1, 0, self)
+
+	# Multiplication operation, eg: a*b. Every channel is multiplied on its own
+	def __mul__(self, other):
+		if isinstance(other, int):
+			return self.mulInt(other)
+
+		self.testOther(other)
+		products = [Multiplication.multiply(a, b, p) for a, b, p in zip(self.channels, self.channelsOf(other), self.basis.primes)]
+		return self.wrap(products)
+
+	# Multiplication with a normal Polynomial on the left, eg: p*a
+	def __rmul__(self, other):
+		return self*other
+
+	# Multiplies the polynomial with an integer
+	def mulInt(self, other):
+		return self.__copy__().scale(other)
+
+	# In-place multiplication, eg: a *= b or a *= i
+	def __imul__(self, other):
+		if isinstance(other, int):
+			return self.scale(other)
+
+		self.channels = (self*other).channels
+		return self
+
+	# Adds c*X^k*g to this polynomial (modifies the polynomial), see Polynomial.axpy
+	def axpy(self, c : int, k : int, g):
+		if c % self.mod() == 0 or g.isZero():
+			return self
+
+		gChannels = self.channelsOf(g)
+		degree = g.degreeMax() + k
+		if degree > self.degreeMax():
+			padding = [0]*(degree - self.degreeMax())
+			for residues in self.channels:
+				residues[0:0] = padding
+
+		offset = self.degreeMax() - degree
+		end = offset + len(gChannels[0])
+		for residues, gResidues, p in zip(self.channels, gChannels, self.basis.primes):
+			cp = c % p
+			residues[offset:end] = [(x + cp*y) % p for x, y in zip(residues[offset:end], gResidues)]
+		self.stripZeroes()
+		return self
+
+	# Multiplies this polynomial with an integer (modifies the polynomial)
+	def scale(self, c : int):
+		for residues, p in zip(self.channels, self.basis.primes):
+			cp = c % p
+			residues[:] = [x*cp % p for x in residues]
+		self.stripZeroes()
+		return self
+
+	# Returns the value of the polynomial with a given input for X, computed in every channel and then rebuilt
+	def compute(self, x):
+		values = [[Evaluation.horner(residues, x, p)] for residues, p in zip(self.channels, self.basis.primes)]
+		return self.basis.combine(values)[0]
+
+	# Returns the list of values of the polynomial for every input in the list points, computed in every channel and then rebuilt
+	def evaluate(self, points : list) -> list:
+		if not points:
+			return []
+
+		return self.basis.combine([Evaluation.evaluate(residues, points, p) for residues, p in zip(self.channels, self.basis.primes)])
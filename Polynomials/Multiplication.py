@@ -0,0 +1,243 @@
+# Multiplication engine for coefficient lists.
+# All functions in this file work on plain lists of coefficients, in the same order as Polynomial.poly (highest degree first),
+# and return the list of coefficients of the product reduced mod m. Eg: multiply([1, 1], [1, 6], 7) returns [1, 0, 6]
+# Because a product of coefficient lists is a convolution, the same functions work for lists in ascending order as well.
+#
+# The function to use is multiply(a, b, m), which picks an algorithm based on the lengths of a and b and on the modulus m:
+# - schoolbook: the O(n*m) algorithm, fastest for small polynomials
+# - karatsuba: the O(n^1.58) divide and conquer algorithm, used for moduli so large that packing them into one integer gets expensive
+# - kronecker: packs both polynomials into one Python integer, multiplies those and unpacks the result.
+# 	Python's integer multiplication runs in C, so for word-size moduli this is the fastest algorithm by far
+# - ntt: the number theoretic transform, only possible if m is a prime such that 2^k divides m - 1 for a big enough k
+# - multi-modular: for huge moduli, the exact product is computed mod many word-size primes and rebuilt with the CRT, see MultiModular.py
+#
+# The thresholds below decide which algorithm is used and can be tuned (eg. Multiplication.SCHOOLBOOK_THRESHOLD = 64)
+from MathExtensions import Prime
+from typing import List, Dict, Tuple
+
+# The defaults were measured on CPython 3.11, see the comments for the crossover points.
+# Below this length (of the shortest of the two lists) the schoolbook algorithm is used. Kronecker wins from about 24 coefficients on
+SCHOOLBOOK_THRESHOLD = 24
+# Below this length the recursion in karatsuba switches over to the schoolbook algorithm
+KARATSUBA_THRESHOLD = 32
+# For moduli with more bits than this, karatsuba is used instead of kronecker.
+# Around 1024 bits both are equally fast, above that the packed integers get huge while karatsuba keeps using less memory
+KRONECKER_MAX_BITS = 2048
+# From this size of the modulus in bits and this length (of the shortest list) on, the multi-modular product is used.
+# Measured on CPython 3.11 (kronecker / multi-modular): 1.06s / 0.66s for length 1000 and 5.9s / 3.6s for length 3000 at 2048 bits,
+# 9.5s / 7.7s for length 1000 at 8192 bits. For lengths of a few hundred and below both are about as fast. None disables it
+MULTI_MODULAR_MIN_BITS = 2048
+MULTI_MODULAR_MIN_LENGTH = 512
+# From this length of the product on the ntt is used if the modulus allows for it. None disables the ntt
+# For a 30 bit prime like 998244353 the ntt is as fast as kronecker at a length of 2^18 and faster above that
+NTT_THRESHOLD = 1 << 18
+
+# Cache of the roots of unity found for the ntt, stored as {(m, size): root}
+nttRoots : Dict[Tuple[int, int], int] = {}
+# Cache of the primality of the moduli that passed the cheap checks for the ntt, stored as {m: whether m is prime}
+nttModuli : Dict[int, bool] = {}
+
+
+# Returns the coefficients of the product of a and b mod m, using the algorithm best suited to the size of a, b and m
+def multiply(a : List[int], b : List[int], m : int) -> List[int]:
+	shortest = min(len(a), len(b))
+	if shortest == 0:
+		return [0]
+
+	if shortest < SCHOOLBOOK_THRESHOLD:
+		return schoolbook(a, b, m)
+
+	if MULTI_MODULAR_MIN_BITS is not None and m.bit_length() >= MULTI_MODULAR_MIN_BITS and shortest >= MULTI_MODULAR_MIN_LENGTH:
+		# Imported here, as MultiModular itself imports this file
+		import MultiModular
+		return MultiModular.multiply(a, b, m)
+
+	if m.bit_length() > KRONECKER_MAX_BITS:
+		return karatsuba(a, b, m)
+
+	size = len(a) + len(b) - 1
+	if NTT_THRESHOLD is not None and size >= NTT_THRESHOLD and nttSupported(m, size):
+		return ntt(a, b, m)
+
+	return kronecker(a, b, m)
+
+
+# Returns the coefficients of a*a mod m. Same as multiply(a, a, m), but kronecker can use the faster squaring of Python integers
+def square(a : List[int], m : int) -> List[int]:
+	return multiply(a, a, m)
+
+
+# Returns the convolution of a and b mod m with the O(n*m) algorithm
+def schoolbook(a : List[int], b : List[int], m : int) -> List[int]:
+	return [c % m for c in convolution(a, b)]
+
+
+# Returns the convolution of a and b without any reduction
+def convolution(a : List[int], b : List[int]) -> List[int]:
+	# Loop over the shortest list, so that the inner loop does the most work
+	if len(a) < len(b):
+		a, b = b, a
+
+	result = [0]*(len(a) + len(b) - 1)
+	for j, cb in enumerate(b):
+		if cb == 0:
+			continue
+
+		for i, ca in enumerate(a, j):
+			result[i] += ca*cb
+
+	return result
+
+
+# Returns the convolution of a and b mod m with the Karatsuba algorithm
+def karatsuba(a : List[int], b : List[int], m : int) -> List[int]:
+	a = [c % m for c in a]
+	b = [c % m for c in b]
+	return [c % m for c in karatsubaConvolution(a, b)]
+
+
+# Returns the convolution of a and b without any reduction, with the Karatsuba algorithm
+def karatsubaConvolution(a : List[int], b : List[int]) -> List[int]:
+	if len(a) < len(b):
+		a, b = b, a
+
+	n, k = len(a), len(b)
+	if k < KARATSUBA_THRESHOLD:
+		return convolution(a, b)
+
+	# Unbalanced case: split a into blocks with the length of b and add up the products of the blocks with b
+	if n >= 2*k:
+		result = [0]*(n + k - 1)
+		for start in range(0, n, k):
+			block = karatsubaConvolution(a[start:start + k], b)
+			for i, c in enumerate(block, start):
+				result[i] += c
+
+		return result
+
+	# Balanced case: a = a0 + a1*X^h and b = b0 + b1*X^h (as sequences), so that the product takes 3 products of half the size
+	h = n//2
+	a0, a1 = a[:h], a[h:]
+	b0, b1 = b[:h], b[h:]
+	low = karatsubaConvolution(a0, b0)
+	high = karatsubaConvolution(a1, b1)
+	aSum = addLists(a0, a1)
+	bSum = addLists(b0, b1)
+	middle = karatsubaConvolution(aSum, bSum)
+
+	result = [0]*(n + k - 1)
+	for i, c in enumerate(low):
+		result[i] += c
+		middle[i] -= c
+	for i, c in enumerate(high):
+		result[i + 2*h] += c
+		middle[i] -= c
+	for i, c in enumerate(middle, h):
+		if c != 0:
+			result[i] += c
+
+	return result
+
+
+# Returns the elementwise sum of two sequences of possibly different lengths
+def addLists(a : List[int], b : List[int]) -> List[int]:
+	if len(a) < len(b):
+		a, b = b, a
+
+	return [x + y for x, y in zip(a, b)] + a[len(b):]
+
+
+# Returns the convolution of a and b mod m with Kronecker substitution:
+# both lists are packed into one integer with enough bits per coefficient that the coefficients of the product can not overlap.
+def kronecker(a : List[int], b : List[int], m : int) -> List[int]:
+	size = len(a) + len(b) - 1
+	bound = min(len(a), len(b))*(m - 1)**2		# The largest value a coefficient of the product can have
+	width = max(1, (bound.bit_length() + 7)//8)		# The number of bytes per coefficient
+
+	packedA = kroneckerPack(a, m, width)
+	if a is b:
+		packedProduct = packedA*packedA
+	else:
+		packedProduct = packedA*kroneckerPack(b, m, width)
+
+	data = packedProduct.to_bytes(size*width, "big")
+	return [int.from_bytes(data[i:i + width], "big") % m for i in range(0, size*width, width)]
+
+
+# Returns the list of coefficients packed into a single integer with 'width' bytes per coefficient (first coefficient most significant)
+def kroneckerPack(coefficients : List[int], m : int, width : int) -> int:
+	return int.from_bytes(b"".join((c % m).to_bytes(width, "big") for c in coefficients), "big")
+
+
+# Returns whether the ntt can be used mod m for a product of length 'size'
+def nttSupported(m : int, size : int) -> bool:
+	twos = ((m - 1) & -(m - 1)).bit_length() - 1 if m > 2 else 0
+	# The cheap check comes first, so that most moduli never need a primality test
+	if (1 << twos) < size:
+		return False
+
+	if m not in nttModuli:
+		nttModuli[m] = Prime.prime(m)
+
+	return nttModuli[m]
+
+
+# Returns an element of order exactly 'size' mod the prime m, where size is a power of 2 that divides m - 1
+def nttRoot(m : int, size : int) -> int:
+	if (m, size) not in nttRoots:
+		# For a random g, g^((m - 1)/size) has order size exactly when its (size/2)th power is not 1, which holds for half of all g
+		for g in range(2, m):
+			root = pow(g, (m - 1)//size, m)
+			if pow(root, size//2, m) != 1:
+				nttRoots[(m, size)] = root
+				break
+
+	return nttRoots[(m, size)]
+
+
+# Returns the convolution of a and b mod m with the number theoretic transform. Only possible if nttSupported(m, len(a) + len(b) - 1)
+def ntt(a : List[int], b : List[int], m : int) -> List[int]:
+	size = len(a) + len(b) - 1
+	# A transform of size 1 has no root of unity to speak of, and the product of two constants needs none
+	if size <= 1:
+		return [a[0]*b[0] % m] if size == 1 else [0]
+
+	n = 1 << (size - 1).bit_length()
+	root = nttRoot(m, n)
+
+	transformA = nttTransform([c % m for c in a] + [0]*(n - len(a)), nttTwiddles(root, n, m), m)
+	if a is b:
+		transformB = transformA
+	else:
+		transformB = nttTransform([c % m for c in b] + [0]*(n - len(b)), nttTwiddles(root, n, m), m)
+
+	pointwise = [x*y % m for x, y in zip(transformA, transformB)]
+	result = nttTransform(pointwise, nttTwiddles(pow(root, -1, m), n, m), m)
+	nInverse = pow(n, -1, m)
+	return [c*nInverse % m for c in result[:size]]
+
+
+# Returns the powers root^0, root^1, ..., root^(n/2 - 1) mod m
+def nttTwiddles(root : int, n : int, m : int) -> List[int]:
+	twiddles = [1]*(n//2)
+	for i in range(1, n//2):
+		twiddles[i] = twiddles[i - 1]*root % m
+
+	return twiddles
+
+
+# Returns the discrete fourier transform of the values mod m, where twiddles are the first n/2 powers of a root of unity of order n
+# Recursive radix 2 algorithm, every level works on whole lists at once
+def nttTransform(values : List[int], twiddles : List[int], m : int) -> List[int]:
+	n = len(values)
+	if n == 1:
+		return values
+	if n == 2:
+		x, y = values
+		return [(x + y) % m, (x - y) % m]
+
+	step = len(twiddles)*2//n		# The twiddles for a transform of size n are every step'th twiddle of the full transform
+	even = nttTransform(values[0::2], twiddles, m)
+	odd = nttTransform(values[1::2], twiddles, m)
+	odd = [x*w % m for x, w in zip(odd, twiddles[0::step])]
+	return [(x + y) % m for x, y in zip(even, odd)] + [(x - y) % m for x, y in zip(even, odd)]
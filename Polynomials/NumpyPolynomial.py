@@ -0,0 +1,225 @@
+# NumpyPolynomial: a Polynomial that stores its coefficients in a NumPy array instead of a list.
+# It supports the same functionality as Polynomial (see Polynomial.py), but addition, subtraction, negation, multiplication with an integer,
+# reducing and comparing are done on the whole array at once instead of per coefficient.
+#
+# - Creating one: NumpyPolynomial(c, m), exactly like Polynomial. c can be a list or a NumPy array.
+# 	Converting an existing polynomial: NumpyPolynomial.fromPolynomial(p), and back again: p.toPolynomial()
+#
+# - The coefficients are stored as int64 if the modulus is small enough that the product of two coefficients still fits in 64 bits,
+# 	so for moduli up to about 3*10^9. For larger moduli the array has dtype object, which still holds Python integers.
+#
+# - Operations with a normal Polynomial are allowed (on either side), the result is then a NumpyPolynomial.
+#
+# NumPy is optional for this repository, creating a NumpyPolynomial without NumPy installed raises an exception.
+from Polynomial import Polynomial
+import Multiplication
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+# The largest modulus for which the coefficients are stored as int64: (m - 1)^2 has to fit in an int64
+INT64_MAX_MODULUS = 3037000500
+
+
+class NumpyPolynomial(Polynomial):
+	# Constructor, see Polynomial.__init__
+	def __init__(self, coefficients, modulo : int, removeLeadingZeroes : bool = True):
+		if np is None:
+			raise Exception("NumpyPolynomial needs NumPy to be installed")
+
+		self.modulo = modulo
+		self.poly = np.mod(self.toArray(coefficients, modulo), modulo)
+		if removeLeadingZeroes:
+			self.stripZeroes()
+
+	# Returns the coefficients as an array with the right dtype for the modulus, without reducing them
+	@staticmethod
+	def toArray(coefficients, modulo : int):
+		if len(coefficients) == 0:
+			coefficients = [0]
+
+		if modulo <= INT64_MAX_MODULUS:
+			try:
+				return np.array(coefficients, dtype=np.int64)
+			except OverflowError:
+				# Coefficients that don't fit in an int64 have to be reduced as Python integers first
+				return np.array([int(c) % modulo for c in coefficients], dtype=np.int64)
+
+		return np.array([int(c) for c in coefficients], dtype=object)
+
+	# Returns a NumpyPolynomial around an array that is already reduced, without copying or reducing it again
+	def wrap(self, array, removeLeadingZeroes : bool = True):
+		result = NumpyPolynomial.__new__(NumpyPolynomial)
+		result.modulo = self.modulo
+		result.poly = array
+		if removeLeadingZeroes:
+			result.stripZeroes()
+
+		return result
+
+	# Returns a NumpyPolynomial with the same coefficients as the Polynomial p
+	@staticmethod
+	def fromPolynomial(p : Polynomial):
+		return NumpyPolynomial(p.polynomial(), p.mod())
+
+	# Returns a normal Polynomial with the same coefficients as this one
+	def toPolynomial(self) -> Polynomial:
+		return Polynomial(self.polynomial(), self.mod())
+
+	# Returns the coefficient at degree 'degree' as a Python integer
+	def __getitem__(self, degree : int) -> int:
+		if degree > self.degreeMax():
+			return 0
+
+		return int(self.poly[self.degreeIndex(degree)])
+
+	# Reduces the current polynomial with the modulus (modifies the polynomial)
+	def reduce(self):
+		np.mod(self.poly, self.mod(), out=self.poly)
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, Polynomial):
+			raise Exception("You can only compare Polynomials to other Polynomials")
+
+		other = self.coerce(other)
+		return self.mod() == other.mod() and self.degreeMax() == other.degreeMax() and bool(np.array_equal(self.poly, other.poly))
+
+	# Returns whether the polynomial represents 0
+	def isZero(self) -> bool:
+		return not self.poly.any()
+
+	# Modifies the polynomial to get rid of the leading zero terms
+	def stripZeroes(self):
+		nonZero = np.flatnonzero(self.poly)
+		start = nonZero[0] if len(nonZero) > 0 else len(self.poly) - 1
+		if start > 0:
+			self.poly = self.poly[start:]
+
+	# Returns a copy of this polynomial with zeroes added up to degree 'degree'
+	def extendedZeros(self, degree : int):
+		padding = np.zeros(max(0, degree - self.degreeMax()), dtype=self.poly.dtype)
+		return self.wrap(np.concatenate((padding, self.poly)), False)
+
+	# Returns the list of coefficients of this polynomial. This is a copy, the internal array is self.poly
+	def polynomial(self) -> list:
+		return self.poly.tolist()
+
+	# Returns a new polynomial that is a copy of this one
+	def __copy__(self):
+		return self.wrap(self.poly.copy(), False)
+
+	# Returns other as a NumpyPolynomial, so that operations with normal Polynomials are possible
+	def coerce(self, other):
+		if isinstance(other, Polynomial) and not isinstance(other, NumpyPolynomial):
+			return NumpyPolynomial.fromPolynomial(other)
+
+		return other
+
+	# Tests if the other object is valid for +-*/ operations
+	def testOther(self, other):
+		if not isinstance(other, Polynomial):
+			raise Exception("You can only do operations with the Polynomial class or integers onto a Polynomial")
+
+		if self.mod() != other.mod():
+			raise Exception("You can only do operations on Polynomials of the same modulo")
+
+	# Returns the arrays of self and other, where the shortest one is padded with zeroes at the front so they have the same length
+	def alignedArrays(self, other):
+		length = max(len(self.poly), len(other.poly))
+		a, b = self.poly, other.poly
+		if len(a) < length:
+			a = np.concatenate((np.zeros(length - len(a), dtype=a.dtype), a))
+		if len(b) < length:
+			b = np.concatenate((np.zeros(length - len(b), dtype=b.dtype), b))
+
+		return a, b
+
+	# Negation operation, eg: -a
+	def __neg__(self):
+		return self.wrap(np.mod(-self.poly, self.mod()), False)
+
+	# Addition operation, eg: a + b
+	def __add__(self, other):
+		if isinstance(other, int):
+			return self.addInt(other)
+
+		self.testOther(other)
+		a, b = self.alignedArrays(self.coerce(other))
+		return self.wrap(np.mod(a + b, self.mod()))
+
+	# Adds an integer to a polynomial
+	def addInt(self, other):
+		result = self.poly.copy()
+		result[-1] = (int(result[-1]) + other) % self.mod()
+		return self.wrap(result)
+
+	# Addition with a normal Polynomial on the left, eg: p + a. Python tries this before Polynomial.__add__, as this is a subclass
+	def __radd__(self, other):
+		return self + other
+
+	# Subtraction operation, eg: a - b
+	def __sub__(self, other):
+		if isinstance(other, int):
+			return self.addInt(-other)
+
+		self.testOther(other)
+		a, b = self.alignedArrays(self.coerce(other))
+		return self.wrap(np.mod(a - b, self.mod()))
+
+	# Subtraction with a normal Polynomial on the left, eg: p - a
+	def __rsub__(self, other):
+		return self.coerce(other) - self
+
+	# Multiplication operation, eg: a*b. The product itself is done by the multiplication engine on Python integers
+	def __mul__(self, other):
+		if isinstance(other, int):
+			return self.mulInt(other)
+
+		self.testOther(other)
+		other = self.coerce(other)
+		product = Multiplication.multiply(self.poly.tolist(), other.poly.tolist(), self.mod())
+		return self.wrap(self.toArray(product, self.mod()))
+
+	# Multiplication with a normal Polynomial on the left, eg: p*a
+	def __rmul__(self, other):
+		return self*other
+
+	# Multiplies the polynomial with an integer
+	def mulInt(self, other):
+		return self.wrap(np.mod(self.poly*(other % self.mod()), self.mod()))
+
+	# Adds c*X^k*g to this polynomial (modifies the polynomial), see Polynomial.axpy
+	def axpy(self, c : int, k : int, g):
+		m = self.mod()
+		c %= m
+		if c == 0 or g.isZero():
+			return self
+
+		g = self.coerce(g)
+		degree = g.degreeMax() + k
+		if degree > self.degreeMax():
+			self.poly = np.concatenate((np.zeros(degree - self.degreeMax(), dtype=self.poly.dtype), self.poly))
+
+		# A view on the coefficients that c*X^k*g changes. Both terms are below m before adding them, so the sum fits in an int64
+		offset = self.degreeMax() - degree
+		section = self.poly[offset:offset + len(g.poly)]
+		section += np.mod(g.poly*c, m)
+		np.mod(section, m, out=section)
+		self.stripZeroes()
+		return self
+
+	# Multiplies this polynomial with an integer (modifies the polynomial)
+	def scale(self, c : int):
+		np.mod(self.poly*(c % self.mod()), self.mod(), out=self.poly)
+		self.stripZeroes()
+		return self
+
+	# In-place multiplication, eg: a *= b or a *= i
+	def __imul__(self, other):
+		if isinstance(other, int):
+			return self.scale(other)
+
+		self.poly = (self*other).poly
+		return self
@@ -17,14 +17,21 @@
 #
 # - Boolean statements about the polynomial: p.isZero(), p.isIrreducible()
 # 	- p.isZero() returns true if p represents {0}
-# 	- p.isIrreducible() returns true if p is irreducible
+# 	- p.isIrreducible() returns true if p is irreducible. The modulus has to be prime.
+# 		p.isIrreducible("benor") uses Ben-Or's test, which is faster for random polynomials, and
+# 		p.isIrreducible(cache=True) keeps the powers X^(p^i) mod p between calls. See Irreducibility.py
 #
 # - Arithmetic operations on polynomials: +, -, *
+# 	Multiplication uses the engine in Multiplication.py, which picks the fastest algorithm for the degrees and modulus.
 # 	Support for both polynomials (q) and integers (i). !!!For operations with integers the integer always has to come after p.!!!
 # 	- + : p + q or p + i
 # 	- - : p - q or p - i
 # 	- * : p*q   or p*i
 #
+# - In-place arithmetic: p += q, p -= q, p *= q (and the same with integers), which modify p itself instead of creating a new polynomial
+# 	- p.axpy(c, k, q): adds c*X^k*q to p, without creating c*X^k*q. Eg: a step of long division
+# 	- p.scale(c): multiplies p with the integer c
+#
 # - Unary operations of the polynomial: -p
 # 	- -p : Returns a new polynomial that is the negated version of p. Eg: -{3x + 1} returns {4x + 6} mod 7
 #
@@ -44,24 +51,60 @@
 # - Setting a coefficient: p[d] = z
 # 	Allows you to set individual coefficients of the polynomial p.
 # 	This functionality should only really be used in the case of manipulating a polynomial without much care for the polynomial itself
-# 	but instead inspecting different polynomials like in PolynomialArithmetic.findIrreducible(). Otherwise, constructing a new polynomial is
+# 	but instead inspecting different polynomials (to go over all of them, see Enumeration.py). Otherwise, constructing a new polynomial is
 # 	better. Usually after setting however many coefficients in p it is useful to call p.reduce(), so that all coefficients are modded again.
 # 	Note: if d > p.degreeMax() then nothing will happen. This functionality does not support modifying the polynomial to a higher degree.
 #
+# - Computing the values of the polynomial at many values of x at once: p.evaluate(values)
+# 	Eg: with p representing {2x^3 + x + 6} and p.mod() == 7, p.evaluate([0, 6]) returns [6, 3]. See Evaluation.py for the algorithms.
+#
 # - Getting the values for which p.compute(value) == 0: p.zeros()
+# 	For small moduli this evaluates p at all values 0, 1, ..., p.mod() - 1 in one pass, see Evaluation.evaluateAll.
+# 	For large prime moduli the roots are found with gcd's instead, in time polynomial in log(p.mod()), see Roots.py.
+# 	Composite moduli are always evaluated at every value.
+#
+# - Factoring the polynomial into irreducible polynomials: PolynomialArithmetic.factor(p), which returns (factor, multiplicity) pairs.
+# 	The modulus has to be prime. See Factorization.py for the algorithm and its stages.
 #
 # - Two static methods: Poly.getX(d, mod), Poly.degreeIndexGen(max, d)
 # 	- getX(degree, mod): for when you need a polynomial that is simply {x^d}. The mod parameter is necessary for the constructor.
+# 		For degrees of at least SparsePolynomial.SPARSE_MIN_DEGREE this returns a SparsePolynomial, which only stores the nonzero terms.
 # 	- degreeIndexGen(max, degree): tells you what index in a polynomial list degree d would appear at
 # 		if that polynomial had max degree 'max'. This is useful when constructing a coefficient list that will become a polynomial.
 # 		Small example on that: 'coefficients = [0]*(someDegree + 1)
 # 								for d in p.degrees(): coefficients[Poly.degreeIndexGen(someDegree, d)] = p[d]*q[d]'
 #
+# - Polynomials with a high degree and few terms: SparsePolynomial(c, m) or SparsePolynomial.fromTerms({d: c}, m), see SparsePolynomial.py
+# 	They can be used together with normal polynomials, and results are converted between the two based on how many terms are nonzero.
+#
+# - Keeping many polynomials in memory: CompactPolynomial(c, m), which stores the coefficients in a typed array, see CompactPolynomial.py
+#
+# - Polynomials as dict or set keys: FrozenPolynomial(c, m) or FrozenPolynomial.freeze(p), which can not be modified and can be hashed.
+# 	See FrozenPolynomial.py, and ResultCache.py for caches of the results of p.isIrreducible(), p.zeros() and others.
+#
+# - Storing polynomials: Serialization.dumps(p) and Serialization.loads(data) for a single one, Serialization.writeAll(path, polynomials)
+# 	and Serialization.Archive(path) or Serialization.readAll(path) for files with many of them. See Serialization.py
+#
+# - Going over all (monic) polynomials of a degree: Enumeration.generate(d, mod), optionally in parts (shards), from an offset
+# 	or in Gray code order. See Enumeration.py
+#
+# - Moduli that are a product of distinct word-size primes: MultiModularPolynomial(c, m) works in every prime on its own, and
+# 	MultiModular.multiplyExact(a, b) multiplies polynomials with integer coefficients exactly. See MultiModular.py
+#
 # UNSUPPORTED FUNCTIONALITY:
 # - "for i in poly:" where poly is a Polynomial. This class does not implement iterability
 # 	Instead: do "for d in poly.degrees():" and access the term at degree d with "poly[d]"
 #
+import Multiplication
+import Evaluation
+import Roots
+import Irreducibility
+
+
 class Polynomial:
+	# No __dict__ per object, as many polynomials can be alive at the same time. Subclasses without __slots__ still get one
+	__slots__ = ("poly", "modulo")
+
 	poly : list
 	modulo : int
 
@@ -185,19 +228,19 @@ class Polynomial:
 
 	# Returns whether the polynomial represents 0
 	def isZero(self) -> bool:
-		result = True
-		for d in self.degrees():
-			c = self[d]
-			if c != 0:
-				result = False
-				break
-
-		return result
+		return not any(self.poly)
 
 	# Modifies the polynomial to get rid of the leading zero terms
 	def stripZeroes(self):
-		while self[self.degreeMax()] == 0 and len(self.poly) > 1:
-			self.poly.remove(0)
+		# Find the first nonzero coefficient, and remove everything before it at once
+		for i, c in enumerate(self.poly):
+			if c != 0 or i == len(self.poly) - 1:
+				if i > 0:
+					del self.poly[:i]
+				return
+
+		# An empty list of coefficients is the zero polynomial
+		self.poly.append(0)
 
 	# Returns a copy of this polynomial with zeroes added up to degree 0
 	# Returns a polynomial
@@ -226,7 +269,7 @@ class Polynomial:
 
 	# Tests if the other object is valid for +-*/ operations
 	def testOther(self, other):
-		if type(other) != type(self):
+		if not isinstance(other, Polynomial):
 			raise Exception("You can only do operations with the Polynomial class or integers onto a Polynomial")
 
 		if self.mod() != other.mod():
@@ -272,21 +315,22 @@ class Polynomial:
 	# Adds an integer to a polynomial
 	# Returns a Polynomial
 	def addInt(self, other):
-		intPoly = Polynomial([other], self.mod())
-		return self + intPoly
+		coefficients = self.poly.copy()
+		coefficients[-1] += other
+		return Polynomial(coefficients, self.mod())
 
 	# Subtraction operation, eg: a - b
 	# Returns a Polynomial
 	def __sub__(self, other):
 		# Special case where other is simply an integer that is being subtracted
 		if isinstance(other, int):
-			return self + (-other)
+			return self.addInt(-other)
 
 		# Exceptions
 		self.testOther(other)
 
-		# The subtraction
-		return self + (-other)
+		# The subtraction, on a copy of this polynomial
+		return self.__copy__().axpy(-1, 0, other)
 
 	# Multiplication operation, eg: a*b
 	# Returns a Polynomial
@@ -298,15 +342,8 @@ class Polynomial:
 		# Exceptions
 		self.testOther(other)
 
-		# The multiplication
-		resultMaxDegree = self.degreeMax() + other.degreeMax()
-		resultCoefficients = [0]*(resultMaxDegree + 1)
-
-		for dSelf in self.degrees():
-			for dOther in other.degrees():
-				dResult = dSelf + dOther
-				index = self.degreeIndexGen(resultMaxDegree, dResult)
-				resultCoefficients[index] += self[dSelf]*other[dOther]
+		# The multiplication, the coefficient lists are both in descending order so the product is as well
+		resultCoefficients = Multiplication.multiply(self.poly, other.polynomial(), self.mod())
 
 		resultPoly = Polynomial(resultCoefficients, self.mod())
 		return resultPoly
@@ -314,48 +351,104 @@ class Polynomial:
 	# Multiplies the polynomial with an integer
 	# Returns a polynomial
 	def mulInt(self, other):
-		intPoly = Polynomial([other], self.mod())
-		return self*intPoly
+		return Polynomial([c*other for c in self.poly], self.mod())
+
+	# In-place addition, eg: a += b or a += i. Modifies a itself instead of creating a new polynomial
+	# Returns the polynomial itself
+	def __iadd__(self, other):
+		if isinstance(other, int):
+			self[0] = (self[0] + other) % self.mod()
+			self.stripZeroes()
+			return self
+
+		self.testOther(other)
+		return self.axpy(1, 0, other)
+
+	# In-place subtraction, eg: a -= b or a -= i
+	# Returns the polynomial itself
+	def __isub__(self, other):
+		if isinstance(other, int):
+			return self.__iadd__(-other)
+
+		self.testOther(other)
+		return self.axpy(-1, 0, other)
+
+	# In-place multiplication, eg: a *= b or a *= i. A product with a polynomial needs a new list of coefficients, which replaces the old one
+	# Returns the polynomial itself
+	def __imul__(self, other):
+		if isinstance(other, int):
+			return self.scale(other)
+
+		self.testOther(other)
+		self.poly = Multiplication.multiply(self.poly, other.polynomial(), self.mod())
+		self.stripZeroes()
+		return self
+
+	# Adds c*X^k*g to this polynomial (modifies the polynomial), without creating c*X^k*g itself. Eg: a step of long division is
+	# f.axpy(-c, k, g). The coefficients are only extended when the result has a higher degree than this polynomial.
+	# Returns the polynomial itself
+	def axpy(self, c : int, k : int, g):
+		m = self.mod()
+		c %= m
+		gCoefficients = g.polynomial()
+		if c == 0 or g.isZero():
+			return self
+
+		# Make room for the terms of c*X^k*g above the current degree
+		degree = g.degreeMax() + k
+		if degree > self.degreeMax():
+			self.poly[0:0] = [0]*(degree - self.degreeMax())
+
+		# The term of degree e in g lands at degree e + k, which is at index offset + (the index of e in g)
+		offset = self.degreeMax() - degree
+		end = offset + len(gCoefficients)
+		self.poly[offset:end] = [(x + c*y) % m for x, y in zip(self.poly[offset:end], gCoefficients)]
+		self.stripZeroes()
+		return self
+
+	# Multiplies this polynomial with an integer (modifies the polynomial)
+	# Returns the polynomial itself
+	def scale(self, c : int):
+		m = self.mod()
+		self.poly[:] = [x*c % m for x in self.poly]
+		self.stripZeroes()
+		return self
 
 	# Returns a polynomial that is X^degree, and just that
 	# Returns a polynomial
 	@staticmethod
 	def getX(degree, mod):
+		# Imported here, as SparsePolynomial itself imports this file
+		import SparsePolynomial
+		# For high degrees, the sparse representation does not have to store the degree zeroes
+		if degree >= SparsePolynomial.SPARSE_MIN_DEGREE:
+			return SparsePolynomial.SparsePolynomial.getX(degree, mod)
+
 		coefficients = [1] + [0]*degree
 		return Polynomial(coefficients, mod)
 
 	# Returns the value of the polynomial with a given input for X
 	def compute(self, x):
-		answer = 0
-		for d in self.degreeList():
-			answer += (self[d]*pow(x, d, self.mod())) % self.mod()
+		return Evaluation.horner(self.polynomial(), x, self.mod())
 
-		return answer % self.mod()
+	# Returns the list of values of the polynomial for every input in the list points
+	def evaluate(self, points : list) -> list:
+		return Evaluation.evaluate(self.polynomial(), points, self.mod())
 
-	# TODO: find and implement more rigorous algorithm that actually works.
-	# Returns whether or not the polynomial is irreducible
-	def isIrreducible(self) -> bool:
+	# Returns whether or not the polynomial is irreducible, with Rabin's test or Ben-Or's test (method "rabin" or "benor")
+	def isIrreducible(self, method : str = "rabin", cache : bool = False) -> bool:
 		# Polynomials of degree 1 and 0 are always irreducible
 		if self.degreeMax() < 2:
 			return True
 
-		return len(self.zeros()) == 0
+		return Irreducibility.isIrreducible(self.polynomial(), self.mod(), method, cache)
 
 	# Returns the zeros of this polynomial
 	def zeros(self) -> list:
-		zeros = []
-		for i in range(self.mod()):
-			if self.compute(i) == 0:
-				zeros.append(i)
-
-		return zeros
+		return Roots.zeros(self.polynomial(), self.mod())
 
 
 # Testing... Can be ignored and has to be removed in the end product
-# def generatePolynomials(degree : int, mod : int):
-# 	polynomials = []
-# 	def generateRecursive
-
 # p = Polynomial([0, 1, 10, -1, 0, 2, 3], 7)
 # print(p.degreeList())
 # print(p.degreeListAsc())
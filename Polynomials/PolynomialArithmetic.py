@@ -1,6 +1,16 @@
 from Polynomial import Polynomial as Poly
+import Irreducibility
+import Division
+import Gcd
+import Factorization
+import Enumeration
+import SparsePolynomial
+from MathExtensions import Prime
 from copy import copy
-from typing import Tuple
+import math
+from typing import Tuple, List, Dict
+import random
+import json
 
 
 # Returns whether or not a function like those below can be performed on the two polynomials in general
@@ -15,7 +25,10 @@ def testValidity(f : Poly, g : Poly):
 # Can raise exception when dividing by zero.
 # Therefore, when executing, please put inside of a try/except bit and handle that edge case where you want to use it.
 # Limitation, the modulo has to be prime, for this function to return a correct result.
-def longDivision(f : Poly, g : Poly) -> Tuple[Poly, Poly]:
+# For large degrees the quotient is computed with Newton iteration instead (see Division.Reducer).
+# With cache=True that is always done, and the inverse of g is kept for later divisions by the same g. Useful when reducing many things mod g
+# When f or g is a SparsePolynomial, only their nonzero terms are worked with (see SparsePolynomial.longDivision)
+def longDivision(f : Poly, g : Poly, cache : bool = False) -> Tuple[Poly, Poly]:
 	# Check for invalidity of the usage of this function
 	testValidity(f, g)
 
@@ -26,10 +39,22 @@ def longDivision(f : Poly, g : Poly) -> Tuple[Poly, Poly]:
 	if g.degreeMax() > f.degreeMax():
 		return Poly([0], f.mod()), f
 
+	# Sparse polynomials are divided term by term, without going over all the degrees
+	if isinstance(f, SparsePolynomial.SparsePolynomial) or isinstance(g, SparsePolynomial.SparsePolynomial):
+		return SparsePolynomial.longDivision(f, g)
+
 	# Normal long division case
 	m = f.mod()		# The modulus
 	degreeDiff = f.degreeMax() - g.degreeMax()
-	q = Poly([0], m)
+
+	# Large degrees or a reused divisor: divide using the inverse of g. That needs an invertible leading coefficient,
+	# otherwise the loop below divides as far as findQ allows, like it does for every degree
+	if (cache or Division.prefersNewton(g.degreeMax(), degreeDiff + 1)) and math.gcd(g.lc(), m) == 1:
+		reducer = Division.cachedReducer(g.polynomial(), m) if cache else Division.Reducer(g.polynomial(), m)
+		q, r = reducer.divide(f.polynomial())
+		return Poly(q, m), Poly(r, m)
+
+	q = Poly([0]*(degreeDiff + 1), m, False)		# Every coefficient of q is set once, in place
 	stepPoly : Poly = copy(f)
 	# Go over every degree that g is missing compared to f
 	for d in f.degrees()[0:degreeDiff + 1]:
@@ -47,43 +72,107 @@ def longDivision(f : Poly, g : Poly) -> Tuple[Poly, Poly]:
 		if coeffStepQ == -1:
 			break
 
-		stepTerm = Poly.getX(d - g.degreeMax(), m)*coeffStepQ		# Eg, if the stepQ = 4 and we multiplied by X^2 then 4X^2 will be added to Q
-		q += stepTerm
-		stepPoly -= g*stepTerm
+		# Eg, if the stepQ = 4 and we multiplied by X^2 then 4X^2 is added to Q, and 4X^2*g is subtracted from F
+		q[d - g.degreeMax()] = coeffStepQ
+		stepPoly.axpy(-coeffStepQ, d - g.degreeMax(), g)
 
+	q.stripZeroes()
 	r = stepPoly		# After the for loop, the stepPoly variable will hold the remainder
 
 	return q, r
 
 
+# The largest modulus for which inverseTable builds a table
+INVERSE_TABLE_MAX_MODULUS = 1 << 20
+
+# The tables built by inverseTable, stored as {m: [inverse of 0, inverse of 1, ..., inverse of m - 1]} with -1 where there is no inverse
+# When there is a table for m, modInverse looks the inverse up instead of computing it
+inverseTables : Dict[int, List[int]] = {}
+
+
 # Finds the q such that a = q*b mod m
+# When b has no inverse mod m, a solution can still exist: with g = gcd(b, m) dividing a, q = (a/g)*(b/g)^(-1) mod m/g.
+# In both cases the smallest such q is returned.
 # !!!If such a q does not exist, then this function returns -1!!!
 def findQ(a, b, m) -> int:
-	for q in range(m):
-		if a == (q*b) % m:
-			return q
+	a, b = a % m, b % m
+	g = math.gcd(b, m)
+	if a % g != 0:
+		return -1
 
-	return -1
+	reducedMod = m//g
+	return (a//g)*modInverse(b//g, reducedMod) % reducedMod
 
 
 # Find the modular inverse of a mod m
 # !!!If such an inverse does not exist, then this function returns -1!!!
 def modInverse(a, m) -> int:
-	for q in range(m):
-		if 1 == (q*a) % m:
-			return q
+	if m in inverseTables:
+		return inverseTables[m][a % m]
+
+	# Mod 1 nothing is equal to 1, so there are no inverses
+	if m == 1:
+		return -1
+
+	try:
+		return pow(a, -1, m)
+	except ValueError:
+		return -1
+
+
+# Returns the list of inverses of all values mod m, with -1 for the values that have no inverse (like modInverse)
+# Uses Montgomery's trick: only the product of all values is inverted, after which every single inverse takes two multiplications
+def batchInverse(values : List[int], m : int) -> List[int]:
+	values = [v % m for v in values]
+	invertible = [math.gcd(v, m) == 1 and m > 1 for v in values]
+
+	# prefix[i] is the product of the invertible values before index i
+	prefix = [1]*len(values)
+	product = 1
+	for i, v in enumerate(values):
+		prefix[i] = product
+		if invertible[i]:
+			product = product*v % m
+
+	inverses = [-1]*len(values)
+	productInverse = modInverse(product, m)		# The inverse of the product of the invertible values from index i on
+	for i in range(len(values) - 1, -1, -1):
+		if invertible[i]:
+			inverses[i] = productInverse*prefix[i] % m
+			productInverse = productInverse*values[i] % m
+
+	return inverses
 
-	return -1
+
+# Returns the table of inverses mod m, [inverse of 0, inverse of 1, ..., inverse of m - 1] with -1 where there is no inverse,
+# and keeps it in inverseTables so that modInverse uses it from then on. Only for moduli up to INVERSE_TABLE_MAX_MODULUS
+def inverseTable(m : int) -> List[int]:
+	if m > INVERSE_TABLE_MAX_MODULUS:
+		raise Exception("Inverse tables are only supported for moduli up to " + str(INVERSE_TABLE_MAX_MODULUS))
+
+	if m not in inverseTables:
+		inverseTables[m] = batchInverse(list(range(m)), m)
+
+	return inverseTables[m]
 
 
 # Returns, in a tuple (x, y, d), such that x*f + y*g = d mod ... with d = gcd(f, g)
-def euclidExtended(f : Poly, g : Poly) -> Tuple[Poly, Poly, Poly]:
+# From degree Gcd.HALF_GCD_THRESHOLD on the subquadratic half-gcd algorithm is used (see Gcd.py), which returns the same triple.
+# With bezout=False, x and y are not computed and (None, None, d) is returned, which is faster when only the gcd is needed.
+def euclidExtended(f : Poly, g : Poly, bezout : bool = True) -> Tuple[Poly, Poly, Poly]:
 	# Check for invalidity of the usage of this function
 	testValidity(f, g)
 
+	m = f.mod()
+	# The half-gcd inverts the leading coefficients of the remainders, which is only always possible mod a prime
+	if max(f.degreeMax(), g.degreeMax()) >= Gcd.HALF_GCD_THRESHOLD and not (f.isZero() and g.isZero()) and Prime.prime(m):
+		x, y, d = Gcd.extendedGcd(f.polynomial(), g.polynomial(), m, bezout)
+		if not bezout:
+			return None, None, Poly(d, m)
+		return Poly(x, m), Poly(y, m), Poly(d, m)
+
 	a : Poly = copy(f)
 	b : Poly = copy(g)
-	m = f.mod()
 	x, v = Poly([1], m), Poly([1], m)
 	y, u = Poly([0], m), Poly([0], m)
 
@@ -94,8 +183,14 @@ def euclidExtended(f : Poly, g : Poly) -> Tuple[Poly, Poly, Poly]:
 		a, b = b, r
 		x1, y1 = x, y
 		x, y = u, v
-		u = x1 - q*u
-		v = y1 - q*v
+		if bezout:
+			# x1 and y1 are not used anymore, so they become the new u and v
+			x1 -= q*u
+			y1 -= q*v
+			u, v = x1, y1
+
+	if not bezout:
+		return None, None, a*modInverse(a.lc(), m)
 
 	xFinal : Poly = x*modInverse(a.lc(), m)
 	yFinal : Poly = y*modInverse(a.lc(), m)
@@ -103,6 +198,11 @@ def euclidExtended(f : Poly, g : Poly) -> Tuple[Poly, Poly, Poly]:
 	return xFinal, yFinal, xFinal*f + yFinal*g
 
 
+# Returns the monic greatest common divisor of f and g. Same as euclidExtended(f, g, False)[2]
+def gcd(f : Poly, g : Poly) -> Poly:
+	return euclidExtended(f, g, False)[2]
+
+
 # Returns whether f and g are congruent, eg: f === g mod h
 def congruence(f : Poly, g : Poly, h : Poly) -> bool:
 	# Check for invalidity of the usage of this function
@@ -118,28 +218,157 @@ def congruence(f : Poly, g : Poly, h : Poly) -> bool:
 	return r.isZero()
 
 
-# Returns a polynomial mod 'mod' of degree 'degree' that is irreducible
-def findIrreducible(degree : int, mod : int) -> Poly:
-	testedPoly = Poly([1] + [0]*degree, mod)
-	# Special case where the requested degree is 1, where all polynomials are irreducible
-	if degree == 1:
-		return testedPoly
-
-	checkedAll = False
-	while not checkedAll:
-		if testedPoly.isIrreducible():
-			return testedPoly
-
-		# Iterate over the coefficients
-		testedPoly[0] += 1
-		for d in testedPoly.degreeListAsc():
-			if testedPoly[d] == mod:
-				testedPoly[d + 1] += 1
-		testedPoly.reduce()
-
-		# Check if all options have been looked at
-		if testedPoly.lc() == 0:
-			checkedAll = True
+# Returns f^e mod h, eg: the polynomial r with deg(r) < deg(h) such that f^e === r mod h. The modulus has to be prime.
+# Uses sliding window exponentiation, and every step reduces with the inverse of h computed once, instead of a new longDivision (see Division.py)
+# Can raise exception when h is zero.
+def powmod(f : Poly, e : int, h : Poly) -> Poly:
+	# Check for invalidity of the usage of this function
+	testValidity(f, h)
+
+	if h.isZero():
+		raise Exception("Division by 0")
+
+	return Poly(Division.powmod(f.polynomial(), e, h.polynomial(), f.mod()), f.mod())
+
+
+# Returns the factorization of f into monic irreducible polynomials, as a list of (factor, multiplicity) pairs sorted by degree.
+# f is f.lc() times the product of factor^multiplicity over all pairs. The modulus has to be prime.
+# The three stages below can also be used on their own, see Factorization.py for how they work
+def factor(f : Poly) -> List[Tuple[Poly, int]]:
+	m = f.mod()
+	return [(Poly(g, m), e) for g, e in Factorization.factor(f.polynomial(), m)]
+
+
+# Returns the square-free decomposition of f, as a list of (g, e) pairs: the g are monic, square-free and coprime,
+# and f is f.lc() times the product of g^e over all pairs. The modulus has to be prime.
+def squareFree(f : Poly) -> List[Tuple[Poly, int]]:
+	m = f.mod()
+	return [(Poly(g, m), e) for g, e in Factorization.squareFree(f.polynomial(), m)]
+
+
+# Returns the distinct degree factorization of a square-free f, as a list of (h, d) pairs: h is the monic product of all
+# irreducible factors of f of degree d. The modulus has to be prime.
+def distinctDegree(f : Poly) -> List[Tuple[Poly, int]]:
+	m = f.mod()
+	return [(Poly(h, m), d) for h, d in Factorization.distinctDegree(f.polynomial(), m)]
+
+
+# Returns the monic irreducible factors of f, where f is a product of distinct irreducible polynomials that all have degree d
+# (eg: an h from distinctDegree). The modulus has to be prime.
+def equalDegree(f : Poly, d : int) -> List[Poly]:
+	m = f.mod()
+	return [Poly(g, m) for g in Factorization.equalDegree(f.polynomial(), d, m)]
+
+
+# Cache of the irreducible polynomials found by findIrreducible with cache=True, stored as {(degree, mod, method): coefficients}
+# Can be written to and read from a file with saveIrreducibleCache(path) and loadIrreducibleCache(path)
+irreducibleCache : Dict[Tuple[int, int, str], List[int]] = {}
+
+# The number of random trinomials tried per position of the middle term by findIrreducible with method "sparse"
+SPARSE_TRINOMIAL_ATTEMPTS = 4
+# The number of random pentanomials tried by findIrreducible with method "sparse" when no trinomial was found
+SPARSE_PENTANOMIAL_ATTEMPTS = 2000
+
+
+# Returns a polynomial mod 'mod' of degree 'degree' that is irreducible. The modulus has to be prime.
+# The method decides which polynomials are tried:
+# - "lexicographic": the monic polynomials in order, starting from X^degree. Always returns the same polynomial
+# - "random": random monic polynomials. About 1 in every 'degree' polynomials is irreducible, so this takes about 'degree' tries
+# - "sparse": trinomials X^degree + aX^k + b with k as small as possible first, then pentanomials, then random polynomials.
+# 	Reducing modulo a sparse polynomial is cheap, which makes these the best choice for building finite fields
+# With cache=True, the result is stored in irreducibleCache and a later call with cache=True for the same degree, modulus and method
+# returns it without searching. So the methods "random" and "sparse" then return the same polynomial every time as well
+def findIrreducible(degree : int, mod : int, method : str = "lexicographic", cache : bool = False) -> Poly:
+	key = (degree, mod, method)
+	if cache and key in irreducibleCache:
+		return Poly(irreducibleCache[key], mod)
+
+	if method == "lexicographic":
+		result = findIrreducibleLexicographic(degree, mod)
+	elif method == "random":
+		result = findIrreducibleRandom(degree, mod)
+	elif method == "sparse":
+		result = findIrreducibleSparse(degree, mod)
+	else:
+		raise Exception("Unknown search method: " + str(method))
+
+	if cache and result is not None:
+		irreducibleCache[key] = result.polynomial().copy()
+
+	return result
+
+
+# Returns the first irreducible polynomial of degree 'degree' mod 'mod' in lexicographic order (see Enumeration.generate)
+def findIrreducibleLexicographic(degree : int, mod : int) -> Poly:
+	# Polynomials of degree 1 and 0 are always irreducible
+	if degree < 2:
+		return Poly([1] + [0]*degree, mod)
+
+	for coefficients in Enumeration.generate(degree, mod):
+		if Irreducibility.isIrreducible(coefficients, mod, "benor"):
+			return Poly(coefficients, mod)
+
+
+# Returns a random monic irreducible polynomial of degree 'degree' mod 'mod'
+def findIrreducibleRandom(degree : int, mod : int) -> Poly:
+	while True:
+		coefficients = [1] + [random.randrange(mod) for _ in range(degree)]
+		# A constant term of 0 means X is a factor
+		if degree > 1 and coefficients[-1] == 0:
+			continue
+
+		if Irreducibility.isIrreducible(coefficients, mod, "benor"):
+			return Poly(coefficients, mod)
+
+
+# Returns a monic irreducible polynomial of degree 'degree' mod 'mod' with as few terms as possible, see findIrreducible
+def findIrreducibleSparse(degree : int, mod : int) -> Poly:
+	if degree < 3:
+		return findIrreducibleLexicographic(degree, mod)
+
+	# Trinomials X^degree + aX^k + b, mod 2 there is only one per k
+	attempts = 1 if mod == 2 else SPARSE_TRINOMIAL_ATTEMPTS
+	for k in range(1, degree):
+		for _ in range(attempts):
+			coefficients = sparseCoefficients(degree, {k: random.randrange(1, mod), 0: random.randrange(1, mod)})
+			if Irreducibility.isIrreducible(coefficients, mod, "benor"):
+				return Poly(coefficients, mod)
+
+	# Pentanomials X^degree + aX^k3 + bX^k2 + cX^k1 + d
+	if degree >= 4:
+		for _ in range(SPARSE_PENTANOMIAL_ATTEMPTS):
+			terms = {k: random.randrange(1, mod) for k in random.sample(range(1, degree), 3)}
+			terms[0] = random.randrange(1, mod)
+			coefficients = sparseCoefficients(degree, terms)
+			if Irreducibility.isIrreducible(coefficients, mod, "benor"):
+				return Poly(coefficients, mod)
+
+	return findIrreducibleRandom(degree, mod)
+
+
+# Returns the coefficient list of X^degree plus the terms, which are given as {degree: coefficient}
+def sparseCoefficients(degree : int, terms : Dict[int, int]) -> List[int]:
+	coefficients = [1] + [0]*degree
+	for d, c in terms.items():
+		coefficients[degree - d] = c
+
+	return coefficients
+
+
+# Writes irreducibleCache to a JSON file, so that a later run can read it back with loadIrreducibleCache
+def saveIrreducibleCache(path : str):
+	entries = [[degree, mod, method, coefficients] for (degree, mod, method), coefficients in sorted(irreducibleCache.items())]
+	with open(path, "w") as file:
+		json.dump(entries, file)
+
+
+# Adds the polynomials in a file written by saveIrreducibleCache to irreducibleCache
+def loadIrreducibleCache(path : str):
+	with open(path) as file:
+		entries = json.load(file)
+
+	for degree, mod, method, coefficients in entries:
+		irreducibleCache[(degree, mod, method)] = coefficients
 
 
 # Testing... Can be ignored and has to be removed in the end product
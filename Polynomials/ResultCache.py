@@ -0,0 +1,127 @@
+# Caches for the results of expensive questions about polynomials and integers, for workloads that ask the same questions over and over.
+# - isIrreducible(f, method), zeros(f), euclidExtended(f, g, bezout), factor(f) and factorization(n) give the same answers as
+# 	Polynomial.isIrreducible, Polynomial.zeros, PolynomialArithmetic.euclidExtended, PolynomialArithmetic.factor and Factoring.factorization,
+# 	but remember the answer for the same arguments. The polynomials are stored as FrozenPolynomials (see FrozenPolynomial.py),
+# 	whose hash is computed once, so passing in FrozenPolynomials makes looking them up cheaper as well.
+# - Every function has its own LRUCache in 'caches', which holds at most DEFAULT_CACHE_SIZE results unless configured otherwise:
+# 	configure("zeros", 100000) changes the size of one cache, configure("zeros", 0) turns it off.
+# - statistics() returns the hits, misses and size of every cache, clear() empties all of them.
+from FrozenPolynomial import FrozenPolynomial as Frozen
+from Polynomial import Polynomial as Poly
+from MathExtensions import Factoring
+import PolynomialArithmetic
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+# The number of results each cache keeps, unless it is configured otherwise
+DEFAULT_CACHE_SIZE = 4096
+
+
+# A dictionary that keeps at most maxSize entries, dropping the least recently used one when it is full.
+# Usage: cache.lookup(key, compute) returns the stored value for key, or calls compute() and stores its result
+class LRUCache:
+	maxSize : int
+	hits : int
+	misses : int
+
+	def __init__(self, maxSize : int = DEFAULT_CACHE_SIZE):
+		self.maxSize = maxSize
+		self.hits = 0
+		self.misses = 0
+		self.entries = OrderedDict()
+
+	# Returns the value stored for key, computing it with compute() when it is not stored
+	def lookup(self, key, compute):
+		if key in self.entries:
+			self.hits += 1
+			self.entries.move_to_end(key)
+			return self.entries[key]
+
+		self.misses += 1
+		value = compute()
+		if self.maxSize > 0:
+			self.entries[key] = value
+			if len(self.entries) > self.maxSize:
+				self.entries.popitem(last=False)
+
+		return value
+
+	# Changes the number of entries that are kept, dropping the least recently used ones if there are too many
+	def resize(self, maxSize : int):
+		self.maxSize = maxSize
+		while len(self.entries) > max(maxSize, 0):
+			self.entries.popitem(last=False)
+
+	# Removes all entries and resets the statistics
+	def clear(self):
+		self.entries.clear()
+		self.hits = 0
+		self.misses = 0
+
+	# Returns the statistics of this cache as {"hits": ..., "misses": ..., "size": ..., "maxSize": ...}
+	def statistics(self) -> Dict[str, int]:
+		return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "maxSize": self.maxSize}
+
+
+# The cache per function, by the name of the function
+caches : Dict[str, LRUCache] = {
+	"isIrreducible": LRUCache(),
+	"zeros": LRUCache(),
+	"euclidExtended": LRUCache(),
+	"factor": LRUCache(),
+	"factorization": LRUCache()
+}
+
+
+# Sets the number of results kept for the function with the given name. A size of 0 turns the cache off
+def configure(name : str, maxSize : int):
+	if name not in caches:
+		raise Exception("There is no cache for " + str(name))
+
+	caches[name].resize(maxSize)
+
+
+# Returns the statistics of all caches, as {name: {"hits": ..., "misses": ..., "size": ..., "maxSize": ...}}
+def statistics() -> Dict[str, Dict[str, int]]:
+	return {name: cache.statistics() for name, cache in caches.items()}
+
+
+# Empties all caches
+def clear():
+	for cache in caches.values():
+		cache.clear()
+
+
+# Returns whether f is irreducible, like f.isIrreducible(method)
+def isIrreducible(f : Poly, method : str = "rabin") -> bool:
+	f = Frozen.freeze(f)
+	return caches["isIrreducible"].lookup((f, method), lambda: f.isIrreducible(method))
+
+
+# Returns the zeros of f, like f.zeros()
+def zeros(f : Poly) -> List[int]:
+	f = Frozen.freeze(f)
+	return list(caches["zeros"].lookup(f, lambda: tuple(f.zeros())))
+
+
+# Returns (x, y, d) with x*f + y*g = d = gcd(f, g), like PolynomialArithmetic.euclidExtended. The results are FrozenPolynomials
+def euclidExtended(f : Poly, g : Poly, bezout : bool = True) -> Tuple[Poly, Poly, Poly]:
+	f, g = Frozen.freeze(f), Frozen.freeze(g)
+
+	def compute():
+		x, y, d = PolynomialArithmetic.euclidExtended(f.thaw(), g.thaw(), bezout)
+		return tuple(None if p is None else Frozen.freeze(p) for p in (x, y, d))
+
+	return caches["euclidExtended"].lookup((f, g, bezout), compute)
+
+
+# Returns the factorization of f into monic irreducible polynomials, like PolynomialArithmetic.factor. The factors are FrozenPolynomials
+def factor(f : Poly) -> List[Tuple[Poly, int]]:
+	f = Frozen.freeze(f)
+	factors = caches["factor"].lookup(f, lambda: tuple((Frozen.freeze(g), e) for g, e in PolynomialArithmetic.factor(f.thaw())))
+	return list(factors)
+
+
+# Returns the prime factorization of n as {prime: exponent}, like Factoring.factorization
+def factorization(n : int) -> Dict[int, int]:
+	return dict(caches["factorization"].lookup(n, lambda: tuple(Factoring.factorization(n).items())))
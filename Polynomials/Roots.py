@@ -0,0 +1,71 @@
+# Root finding for coefficient lists (highest degree first, like Polynomial.poly) mod a prime p, in time polynomial in log(p).
+# - The roots of f are the roots of g = gcd(f, X^p - X), as X^p - X is the product of (X - x) for all x mod p.
+# 	So g is the product of the distinct linear factors of f, found with a single modular exponentiation.
+# - g is split with the equal degree splitting of Cantor and Zassenhaus: for a random a, (X + a)^((p - 1)/2) - 1 is zero exactly for
+# 	the x where x + a is a nonzero square, which is about half of them. So gcd(g, (X + a)^((p - 1)/2) - 1) splits g in two most of the time.
+#
+# zeros(c, m) picks between this and evaluating the polynomial at every value (Evaluation.evaluateAll), which is faster for small moduli.
+# The root finding only works for a prime modulus, so for composite moduli zeros always evaluates at every value.
+from MathExtensions import Prime
+import Division
+import Evaluation
+import Gcd
+import random
+from typing import List
+
+# Up to this modulus zeros always evaluates at every value, without testing whether the modulus is prime
+EVALUATE_ALL_MAX_MODULUS = 1 << 10
+# Above EVALUATE_ALL_MAX_MODULUS zeros evaluates at every value while m < EVALUATE_ALL_FACTOR*degree^2*log2(m).
+# Evaluating costs about m steps and the root finding about degree^2*log2(m), the factor is measured on CPython 3.11
+EVALUATE_ALL_FACTOR = 0.003
+
+
+# Returns the sorted list of values x for which the polynomial is zero mod m. Like Polynomial.zeros(), but picks the fastest algorithm
+# that works for the modulus
+def zeros(coefficients : List[int], m : int) -> List[int]:
+	degree = len(Division.stripZeroes([c % m for c in coefficients])) - 1
+	# The cheap checks come first, so that the primality test is only done when the root finding would be faster
+	if m <= EVALUATE_ALL_MAX_MODULUS or m < EVALUATE_ALL_FACTOR*degree*degree*m.bit_length() or not Prime.prime(m):
+		values = Evaluation.evaluateAll(coefficients, m)
+		return [x for x, value in enumerate(values) if value == 0]
+
+	return roots(coefficients, m)
+
+
+# Returns the sorted list of distinct roots of the polynomial mod the prime p. The zero polynomial is zero everywhere, so it returns every value
+def roots(coefficients : List[int], p : int) -> List[int]:
+	f = Gcd.monic(coefficients, p)
+	if f == [0]:
+		return list(range(p))
+
+	return sorted(splitLinear(linearPart(f, p), p))
+
+
+# Returns the product of the distinct linear factors of f mod the prime p, as a monic polynomial. Eg: gcd(f, X^p - X)
+def linearPart(f : List[int], p : int) -> List[int]:
+	if len(f) <= 1:
+		return [1]
+
+	xp = Division.powmod([1, 0], p, f, p)		# X^p mod f
+	return Gcd.gcd(f, Division.subtract(xp, [1, 0], p), p)
+
+
+# Returns the roots of g mod the prime p, where g is monic and the product of distinct linear factors
+def splitLinear(g : List[int], p : int) -> List[int]:
+	degree = len(g) - 1
+	if degree == 0:
+		return []
+
+	if degree == 1:
+		return [-g[1] % p]
+
+	# For p == 2 the exponent below is 0, but then g can only be X*(X + 1)
+	if p == 2:
+		return [0, 1]
+
+	while True:
+		a = random.randrange(p)
+		split = Division.powmod([1, a], (p - 1)//2, g, p)
+		h = Gcd.gcd(g, Division.subtract(split, [1], p), p)
+		if 0 < len(h) - 1 < degree:
+			return splitLinear(h, p) + splitLinear(Division.divide(g, h, p)[0], p)
@@ -0,0 +1,334 @@
+# Storing polynomials in a compact binary format, one at a time or many in a single file.
+# - dumps(p) returns the bytes of one polynomial, loads(data) the polynomial back.
+# - Files with many polynomials:
+# 	- writeAll(path, polynomials) writes them all, from any iterable (eg: a generator), without keeping them in memory.
+# 		Writer(path) does the same one polynomial at a time: with Writer(path) as writer: writer.write(p)
+# 	- readAll(path) is a generator that reads them back in order, also without keeping them in memory.
+# 	- Archive(path) maps the file into memory (mmap) and gives random access: archive[i], len(archive), for p in archive.
+# 		The file is not read up front: archive[i] looks up where polynomial i starts in the index and returns a PolynomialView on
+# 		the mapped bytes, which only decodes the coefficients when they are needed.
+#
+# Every coefficient is stored with the minimal number of bits for the modulus: width = (m - 1).bit_length(), at least 1.
+# So a polynomial mod 2 takes 1 bit per coefficient, mod 10007 14 bits and mod 2^61 - 1 61 bits, instead of ~36 bytes as a Python list.
+#
+# The format. All integers in the header and the index are unsigned 64 bit little endian, 'varint' is an unsigned LEB128 integer
+# - A polynomial: varint modulus, varint number of coefficients n, then the n coefficients (highest degree first) at 'width' bits each,
+# 	as one big endian number of ceil(n*width/8) bytes (so the padding bits are at the start).
+# - A file: MAGIC, the number of polynomials, the offset of the index, the polynomials one after another and then the index,
+# 	which is the offset of every polynomial. The index is written at the end, so a file can be written without knowing the count first.
+from Polynomial import Polynomial
+from array import array
+from typing import List, Iterable, Iterator, Tuple, BinaryIO
+import mmap
+import struct
+import sys
+
+# The first bytes of a file with polynomials: the name of the format and its version
+MAGIC = b"POLY\x01\x00\x00\x00"
+# The header: MAGIC, the number of polynomials and the offset of the index
+HEADER = struct.Struct("<8sQQ")
+
+
+# Returns the number of bits per coefficient for the modulus
+def coefficientWidth(m : int) -> int:
+	return max(1, (m - 1).bit_length())
+
+
+# Returns the bytes of the unsigned LEB128 encoding of n
+def encodeVarint(n : int) -> bytes:
+	result = bytearray()
+	while n >= 0x80:
+		result.append((n & 0x7F) | 0x80)
+		n >>= 7
+	result.append(n)
+	return bytes(result)
+
+
+# Returns the integer encoded at position 'offset' of data, and the position after it
+def decodeVarint(data, offset : int) -> Tuple[int, int]:
+	n = 0
+	shift = 0
+	while True:
+		byte = data[offset]
+		offset += 1
+		n |= (byte & 0x7F) << shift
+		if byte < 0x80:
+			return n, offset
+		shift += 7
+
+
+# Returns the integer encoded at the current position of a file, or None at the end of the file
+def readVarint(file : BinaryIO) -> int:
+	n = 0
+	shift = 0
+	while True:
+		byte = file.read(1)
+		if not byte:
+			if shift == 0:
+				return None
+			raise Exception("The file ends in the middle of a number")
+		n |= (byte[0] & 0x7F) << shift
+		if byte[0] < 0x80:
+			return n
+		shift += 7
+
+
+# Returns the coefficients (reduced, so below 2^width) packed at 'width' bits each, see the top of this file
+def packCoefficients(coefficients : List[int], width : int) -> bytes:
+	if width % 8 == 0:
+		size = width//8
+		return b"".join(c.to_bytes(size, "big") for c in coefficients)
+
+	bits = "".join(format(c, "0%db" % width) for c in coefficients)
+	return int(bits, 2).to_bytes((len(bits) + 7)//8, "big") if bits else b""
+
+
+# Returns the n coefficients packed by packCoefficients
+def unpackCoefficients(data, n : int, width : int) -> List[int]:
+	if width == 8:
+		return list(data)
+
+	if width % 8 == 0:
+		size = width//8
+		return [int.from_bytes(data[i:i + size], "big") for i in range(0, n*size, size)]
+
+	bits = format(int.from_bytes(data, "big"), "0%db" % (n*width))
+	if width == 1:
+		return [1 if b == "1" else 0 for b in bits]
+
+	return [int(bits[i:i + width], 2) for i in range(0, n*width, width)]
+
+
+# Returns the packed size in bytes of n coefficients of 'width' bits
+def packedSize(n : int, width : int) -> int:
+	return (n*width + 7)//8
+
+
+# Returns the bytes of the polynomial, see the top of this file
+def dumps(p : Polynomial) -> bytes:
+	m = p.mod()
+	coefficients = p.polynomial()
+	return encodeVarint(m) + encodeVarint(len(coefficients)) + packCoefficients(coefficients, coefficientWidth(m))
+
+
+# Returns the polynomial stored in data by dumps
+def loads(data) -> Polynomial:
+	m, offset = decodeVarint(data, 0)
+	n, offset = decodeVarint(data, offset)
+	width = coefficientWidth(m)
+	return Polynomial(unpackCoefficients(data[offset:offset + packedSize(n, width)], n, width), m)
+
+
+# Writes polynomials to a file, see the top of this file
+# Usage: with Writer(path) as writer: writer.write(p) for every p
+class Writer:
+	count : int
+
+	def __init__(self, path : str):
+		self.file = open(path, "wb")
+		self.file.write(HEADER.pack(MAGIC, 0, 0))
+		self.offsets = array("Q")		# 8 bytes per polynomial, the only thing that is kept in memory
+		self.count = 0
+
+	# Appends the polynomial to the file
+	def write(self, p : Polynomial):
+		self.offsets.append(self.file.tell())
+		self.file.write(dumps(p))
+		self.count += 1
+
+	# Writes the index and the header, and closes the file
+	def close(self):
+		if self.file.closed:
+			return
+
+		indexOffset = self.file.tell()
+		if sys.byteorder != "little":
+			self.offsets.byteswap()
+		self.offsets.tofile(self.file)
+		self.file.seek(0)
+		self.file.write(HEADER.pack(MAGIC, self.count, indexOffset))
+		self.file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exception):
+		self.close()
+
+
+# Writes all polynomials to the file at path, returns how many there were
+def writeAll(path : str, polynomials : Iterable[Polynomial]) -> int:
+	with Writer(path) as writer:
+		for p in polynomials:
+			writer.write(p)
+
+	return writer.count
+
+
+# Returns the number of polynomials and the offset of the index from the header of a file
+def readHeader(data : bytes) -> Tuple[int, int]:
+	if len(data) < HEADER.size:
+		raise Exception("The file is too short to hold polynomials")
+
+	magic, count, indexOffset = HEADER.unpack(data[:HEADER.size])
+	if magic != MAGIC:
+		raise Exception("The file does not hold polynomials in this format")
+
+	return count, indexOffset
+
+
+# Generates the polynomials in the file at path in order, reading the file from start to end
+def readAll(path : str) -> Iterator[Polynomial]:
+	with open(path, "rb") as file:
+		count, _ = readHeader(file.read(HEADER.size))
+		for _ in range(count):
+			m = readVarint(file)
+			n = readVarint(file)
+			width = coefficientWidth(m)
+			yield Polynomial(unpackCoefficients(file.read(packedSize(n, width)), n, width), m)
+
+
+# A polynomial stored in packed bytes, eg: in a memory mapped file. Only the bytes are kept, the coefficients are decoded
+# when they are needed: p[d], p.degreeMax() and p.lc() read them directly, the first operation that needs all of them decodes them once.
+# A view can not be modified, operations on it return normal Polynomials. p.toPolynomial() returns a normal Polynomial with the same coefficients
+class PolynomialView(Polynomial):
+	__slots__ = ("data", "count", "width", "decoded")
+
+	data : memoryview
+	count : int
+	width : int
+
+	# Constructor, data holds the count coefficients of width bits packed as described at the top of this file. They are not copied
+	def __init__(self, data, count : int, modulo : int):
+		self.data = data
+		self.count = count
+		self.modulo = modulo
+		self.width = coefficientWidth(modulo)
+		self.decoded = None
+
+	# Returns the coefficients highest degree first, decoding them the first time
+	@property
+	def poly(self) -> list:
+		if self.decoded is None:
+			self.decoded = Polynomial(unpackCoefficients(self.data, self.count, self.width), self.modulo).poly
+		return self.decoded
+
+	# Returns a normal Polynomial with the same coefficients
+	def toPolynomial(self) -> Polynomial:
+		return Polynomial(self.poly, self.modulo)
+
+	# Returns the coefficient at degree 'degree', reading only the bytes it is stored in
+	def __getitem__(self, degree : int) -> int:
+		if self.decoded is not None:
+			return super().__getitem__(degree)
+		if degree >= self.count:
+			return 0
+
+		width = self.width
+		padding = 8*len(self.data) - self.count*width
+		start = padding + (self.count - 1 - degree)*width
+		end = start + width
+		value = int.from_bytes(self.data[start//8:(end + 7)//8], "big")
+		return (value >> (-end % 8)) & ((1 << width) - 1)
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, Polynomial):
+			raise Exception("You can only compare Polynomials to other Polynomials")
+
+		if self.mod() != other.mod() or self.degreeMax() != other.degreeMax():
+			return False
+
+		return self.poly == other.polynomial()
+
+	# Returns the max degree of the polynomial. Stored polynomials never have leading zeroes, unless they are 0
+	def degreeMax(self) -> int:
+		return max(self.count - 1, 0)
+
+	# Returns the leading coefficient
+	def leadingCoeff(self) -> int:
+		return self[self.degreeMax()]
+
+	# Returns the list of coefficients, highest degree first
+	def polynomial(self) -> list:
+		return self.poly
+
+	# Returns a normal Polynomial with the same coefficients, which can be modified
+	def __copy__(self):
+		return self.toPolynomial()
+
+	# Raises an exception, a view can not be modified
+	def __setitem__(self, degree : int, value : int):
+		raise Exception("A PolynomialView can not be modified, use p.toPolynomial() to get a Polynomial that can")
+
+	# The coefficients are stored reduced, so there is nothing to do
+	def reduce(self):
+		pass
+
+	# Stored polynomials have no leading zeroes, so there is nothing to do
+	def stripZeroes(self):
+		pass
+
+	# Raises an exception, a view can not be modified
+	def axpy(self, c : int, k : int, g):
+		raise Exception("A PolynomialView can not be modified, use p.toPolynomial() to get a Polynomial that can")
+
+	# Raises an exception, a view can not be modified
+	def scale(self, c : int):
+		raise Exception("A PolynomialView can not be modified, use p.toPolynomial() to get a Polynomial that can")
+
+	# In-place operations return a new Polynomial, like for FrozenPolynomial
+	def __iadd__(self, other):
+		return self + other
+
+	def __isub__(self, other):
+		return self - other
+
+	def __imul__(self, other):
+		return self*other
+
+
+# Random access to the polynomials in a file written by Writer or writeAll, see the top of this file
+# Usage: with Archive(path) as archive: archive[i], len(archive), for p in archive
+class Archive:
+	def __init__(self, path : str):
+		self.file = open(path, "rb")
+		self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+		self.data = memoryview(self.map)
+		count, indexOffset = readHeader(self.data[:HEADER.size])
+		index = self.data[indexOffset:indexOffset + 8*count]
+		if sys.byteorder == "little":
+			self.offsets = index.cast("Q")
+		else:
+			self.offsets = array("Q", index)
+			self.offsets.byteswap()
+
+	def __len__(self) -> int:
+		return len(self.offsets)
+
+	# Returns polynomial i as a PolynomialView on the mapped file
+	def __getitem__(self, i : int) -> PolynomialView:
+		offset = self.offsets[i]
+		m, offset = decodeVarint(self.data, offset)
+		n, offset = decodeVarint(self.data, offset)
+		return PolynomialView(self.data[offset:offset + packedSize(n, coefficientWidth(m))], n, m)
+
+	def __iter__(self) -> Iterator[PolynomialView]:
+		for i in range(len(self)):
+			yield self[i]
+
+	# Closes the file. The mapping itself stays until the last PolynomialView on it is gone
+	def close(self):
+		if isinstance(self.offsets, memoryview):
+			self.offsets.release()
+		self.data.release()
+		try:
+			self.map.close()
+		except BufferError:
+			pass
+		self.file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exception):
+		self.close()
@@ -0,0 +1,366 @@
+# SparsePolynomial: a Polynomial that only stores its nonzero terms, for polynomials of a high degree with few terms, like X^(10^7) + 1.
+# It supports the same functionality as Polynomial (see Polynomial.py), and every operation takes time in the number of terms
+# instead of the degree. Eg: p[d] is a binary search, p.degrees() only lists the degrees of the nonzero terms,
+# and p.compute(x) raises x to the power of every degree with pow.
+#
+# - Creating one: SparsePolynomial(c, m), exactly like Polynomial, or SparsePolynomial.fromTerms({degree: coefficient}, m),
+# 	which never builds the dense list of coefficients. SparsePolynomial.getX(d, m) gives X^d.
+# 	Converting an existing polynomial: SparsePolynomial.fromPolynomial(p), and back again: p.toPolynomial()
+#
+# - The terms are stored in two lists, the degrees in ascending order and the coefficients at those degrees (all nonzero).
+#
+# - The result of an operation is sparse only if it is worth it: for degrees of at least SPARSE_MIN_DEGREE with at most
+# 	SPARSE_MAX_FILL*(degree + 1) nonzero terms. Otherwise the result is a normal Polynomial. adapt(p) does the same for any polynomial.
+#
+# - Operations with a normal Polynomial are allowed (on either side), and use the sparse versions of the operations.
+# 	Polynomial.getX(d, m) returns a SparsePolynomial for degrees of at least SPARSE_MIN_DEGREE.
+#
+# Note: p.polynomial() (and p.poly) build the dense list of coefficients, so functionality without a sparse version
+# (eg: p.zeros() and p.isIrreducible()) takes time in the degree, like it does for a normal Polynomial.
+from Polynomial import Polynomial
+import Multiplication
+from bisect import bisect_left
+from typing import List, Dict, Tuple
+import heapq
+
+# Below this degree, results of operations are always normal Polynomials
+SPARSE_MIN_DEGREE = 64
+# Results with at most this fraction of their coefficients nonzero are SparsePolynomials
+SPARSE_MAX_FILL = 1/16
+
+
+class SparsePolynomial(Polynomial):
+	exponents : List[int]		# The degrees of the nonzero terms, in ascending order
+	coefficients : List[int]		# The coefficients at those degrees, all nonzero and reduced
+	modulo : int
+
+	# Constructor, see Polynomial.__init__. The zeroes in the coefficients are never stored, so removeLeadingZeroes is ignored
+	def __init__(self, coefficients : list, modulo : int, removeLeadingZeroes : bool = True):
+		self.modulo = modulo
+		self.exponents = []
+		self.coefficients = []
+		for d, c in enumerate(reversed(coefficients)):
+			c %= modulo
+			if c != 0:
+				self.exponents.append(d)
+				self.coefficients.append(c)
+
+	# Returns a SparsePolynomial with the terms, given as a dictionary {degree: coefficient} or as a list of (degree, coefficient) pairs
+	@staticmethod
+	def fromTerms(terms, modulo : int):
+		if isinstance(terms, dict):
+			terms = terms.items()
+
+		collected : Dict[int, int] = {}
+		for d, c in terms:
+			collected[d] = collected.get(d, 0) + c
+
+		return SparsePolynomial.wrap(*sortedTerms(collected, modulo), modulo)
+
+	# Returns a SparsePolynomial around lists of exponents and coefficients that are already sorted and reduced, without copying them
+	@staticmethod
+	def wrap(exponents : List[int], coefficients : List[int], modulo : int):
+		result = SparsePolynomial.__new__(SparsePolynomial)
+		result.modulo = modulo
+		result.exponents = exponents
+		result.coefficients = coefficients
+		return result
+
+	# Returns a SparsePolynomial with the same coefficients as the Polynomial p
+	@staticmethod
+	def fromPolynomial(p : Polynomial):
+		if isinstance(p, SparsePolynomial):
+			return p.__copy__()
+
+		return SparsePolynomial(p.polynomial(), p.mod())
+
+	# Returns a normal Polynomial with the same coefficients as this one
+	def toPolynomial(self) -> Polynomial:
+		return Polynomial(self.polynomial(), self.mod())
+
+	# Returns the dense list of coefficients, highest degree first. This is a new list, changing it does not change the polynomial
+	@property
+	def poly(self) -> list:
+		return self.polynomial()
+
+	# Returns the coefficient at degree 'degree'
+	def __getitem__(self, degree : int) -> int:
+		i = bisect_left(self.exponents, degree)
+		if i < len(self.exponents) and self.exponents[i] == degree:
+			return self.coefficients[i]
+
+		return 0
+
+	# Functionality for saying p[i] = something. Like for Polynomial, nothing happens for degrees above the max degree
+	def __setitem__(self, degree : int, value : int):
+		if degree > self.degreeMax():
+			return
+
+		value %= self.mod()
+		i = bisect_left(self.exponents, degree)
+		if i < len(self.exponents) and self.exponents[i] == degree:
+			if value != 0:
+				self.coefficients[i] = value
+			else:
+				del self.exponents[i]
+				del self.coefficients[i]
+		elif value != 0:
+			self.exponents.insert(i, degree)
+			self.coefficients.insert(i, value)
+
+	# Reduces the current polynomial with the modulus (modifies the polynomial)
+	def reduce(self):
+		self.exponents, self.coefficients = sortedTerms(dict(zip(self.exponents, self.coefficients)), self.mod())
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, Polynomial):
+			raise Exception("You can only compare Polynomials to other Polynomials")
+
+		exponents, coefficients = terms(other)
+		return self.mod() == other.mod() and self.exponents == exponents and self.coefficients == coefficients
+
+	# Returns the degrees of the nonzero terms in descending order. Eg: if p represents {x^6 + 1} then p.degrees() returns [6, 0]
+	def degreeList(self) -> list:
+		return self.exponents[::-1]
+
+	# The degree list but in ascending order
+	def degreeListAsc(self) -> list:
+		return self.exponents.copy()
+
+	# Returns the max degree of the polynomial
+	def degreeMax(self) -> int:
+		return self.exponents[-1] if self.exponents else 0
+
+	# Returns whether the polynomial represents 0
+	def isZero(self) -> bool:
+		return not self.exponents
+
+	# Returns the number of nonzero terms
+	def termCount(self) -> int:
+		return len(self.exponents)
+
+	# There are no leading zeroes to strip, as zeroes are never stored
+	def stripZeroes(self):
+		pass
+
+	# Returns a copy of this polynomial. Zeroes are not stored, so there is nothing to add
+	def extendedZeros(self, degree : int):
+		return self.__copy__()
+
+	# Returns the dense list of coefficients of this polynomial, highest degree first
+	def polynomial(self) -> list:
+		coefficients = [0]*(self.degreeMax() + 1)
+		for d, c in zip(self.exponents, self.coefficients):
+			coefficients[-1 - d] = c
+
+		return coefficients
+
+	# Returns a new polynomial that is a copy of this one
+	def __copy__(self):
+		return SparsePolynomial.wrap(self.exponents.copy(), self.coefficients.copy(), self.mod())
+
+	# Tests if the other object is valid for +-*/ operations
+	def testOther(self, other):
+		if not isinstance(other, Polynomial):
+			raise Exception("You can only do operations with the Polynomial class or integers onto a Polynomial")
+
+		if self.mod() != other.mod():
+			raise Exception("You can only do operations on Polynomials of the same modulo")
+
+	# Negation operation, eg: -a
+	def __neg__(self):
+		m = self.mod()
+		return SparsePolynomial.wrap(self.exponents.copy(), [m - c for c in self.coefficients], m)
+
+	# Addition operation, eg: a + b
+	def __add__(self, other):
+		if isinstance(other, int):
+			return self.addInt(other)
+
+		self.testOther(other)
+		return self.combine(other, 1)
+
+	# Addition with a normal Polynomial on the left, eg: p + a. Python tries this before Polynomial.__add__, as this is a subclass
+	def __radd__(self, other):
+		return self + other
+
+	# Adds an integer to a polynomial
+	def addInt(self, other):
+		return self.combine(SparsePolynomial.fromTerms([(0, other)], self.mod()), 1)
+
+	# Subtraction operation, eg: a - b
+	def __sub__(self, other):
+		if isinstance(other, int):
+			return self.addInt(-other)
+
+		self.testOther(other)
+		return self.combine(other, -1)
+
+	# Subtraction with a normal Polynomial on the left, eg: p - a
+	def __rsub__(self, other):
+		self.testOther(other)
+		return SparsePolynomial.fromPolynomial(other).combine(self, -1)
+
+	# Returns self + sign*other, in the representation that fits the result
+	def combine(self, other, sign : int):
+		m = self.mod()
+		collected = dict(zip(self.exponents, self.coefficients))
+		for d, c in zip(*terms(other)):
+			collected[d] = collected.get(d, 0) + sign*c
+
+		return fromSortedTerms(*sortedTerms(collected, m), m)
+
+	# Multiplication operation, eg: a*b
+	def __mul__(self, other):
+		if isinstance(other, int):
+			return self.mulInt(other)
+
+		self.testOther(other)
+		m = self.mod()
+		exponents, coefficients = terms(other)
+		if not exponents or not self.exponents:
+			return Polynomial([0], m)
+
+		# With many terms on both sides, the product is (nearly) dense and the multiplication engine is faster
+		degree = self.degreeMax() + exponents[-1]
+		if len(self.exponents)*len(exponents) > degree + 1:
+			return adapt(Polynomial(Multiplication.multiply(self.polynomial(), other.polynomial(), m), m))
+
+		collected : Dict[int, int] = {}
+		for d1, c1 in zip(self.exponents, self.coefficients):
+			for d2, c2 in zip(exponents, coefficients):
+				collected[d1 + d2] = collected.get(d1 + d2, 0) + c1*c2
+
+		return fromSortedTerms(*sortedTerms(collected, m), m)
+
+	# Multiplication with a normal Polynomial on the left, eg: p*a
+	def __rmul__(self, other):
+		return self*other
+
+	# Multiplies the polynomial with an integer
+	def mulInt(self, other):
+		m = self.mod()
+		return SparsePolynomial.fromTerms(zip(self.exponents, [c*other for c in self.coefficients]), m)
+
+	# Adds c*X^k*g to this polynomial (modifies the polynomial), see Polynomial.axpy. The result stays a SparsePolynomial
+	def axpy(self, c : int, k : int, g):
+		collected = dict(zip(self.exponents, self.coefficients))
+		for d, b in zip(*terms(g)):
+			collected[d + k] = collected.get(d + k, 0) + c*b
+
+		self.exponents, self.coefficients = sortedTerms(collected, self.mod())
+		return self
+
+	# Multiplies this polynomial with an integer (modifies the polynomial)
+	def scale(self, c : int):
+		self.exponents, self.coefficients = sortedTerms(dict(zip(self.exponents, [x*c for x in self.coefficients])), self.mod())
+		return self
+
+	# In-place multiplication, eg: a *= b or a *= i. The product with a polynomial can be a normal Polynomial, so a is replaced by it
+	def __imul__(self, other):
+		if isinstance(other, int):
+			return self.scale(other)
+
+		return self*other
+
+	# Returns a polynomial that is X^degree, and just that
+	@staticmethod
+	def getX(degree, mod):
+		return SparsePolynomial.fromTerms([(degree, 1)], mod)
+
+	# Returns the value of the polynomial with a given input for X
+	def compute(self, x):
+		m = self.mod()
+		return sum(c*pow(x, d, m) for d, c in zip(self.exponents, self.coefficients)) % m
+
+	# Returns the list of values of the polynomial for every input in the list points
+	def evaluate(self, points : list) -> list:
+		return [self.compute(x) for x in points]
+
+
+# Returns the terms of a polynomial as two lists, the degrees of the nonzero terms in ascending order and the coefficients at those degrees
+def terms(p : Polynomial) -> Tuple[List[int], List[int]]:
+	if isinstance(p, SparsePolynomial):
+		return p.exponents, p.coefficients
+
+	exponents, coefficients = [], []
+	for d, c in enumerate(reversed(p.polynomial())):
+		if c != 0:
+			exponents.append(d)
+			coefficients.append(c)
+
+	return exponents, coefficients
+
+
+# Returns the terms of the dictionary {degree: coefficient} as sorted lists like terms() does, with the coefficients reduced mod m
+def sortedTerms(collected : Dict[int, int], m : int) -> Tuple[List[int], List[int]]:
+	exponents, coefficients = [], []
+	for d in sorted(collected):
+		c = collected[d] % m
+		if c != 0:
+			exponents.append(d)
+			coefficients.append(c)
+
+	return exponents, coefficients
+
+
+# Returns whether a polynomial with this many nonzero terms up to this degree should be stored as a SparsePolynomial
+def prefersSparse(termCount : int, degree : int) -> bool:
+	return degree >= SPARSE_MIN_DEGREE and termCount <= SPARSE_MAX_FILL*(degree + 1)
+
+
+# Returns the polynomial with the sorted and reduced terms, as a SparsePolynomial or a Polynomial depending on how many terms there are
+def fromSortedTerms(exponents : List[int], coefficients : List[int], m : int) -> Polynomial:
+	degree = exponents[-1] if exponents else 0
+	if prefersSparse(len(exponents), degree):
+		return SparsePolynomial.wrap(exponents, coefficients, m)
+
+	dense = [0]*(degree + 1)
+	for d, c in zip(exponents, coefficients):
+		dense[-1 - d] = c
+
+	return Polynomial(dense, m)
+
+
+# Returns the polynomial p as a SparsePolynomial or a Polynomial, depending on how many of its terms are nonzero
+def adapt(p : Polynomial) -> Polynomial:
+	exponents, coefficients = terms(p)
+	if isinstance(p, SparsePolynomial) != prefersSparse(len(exponents), p.degreeMax()):
+		return fromSortedTerms(exponents.copy(), coefficients.copy(), p.mod())
+
+	return p
+
+
+# Returns, in a tuple (q, r), the quotient and remainder of f divided by g, where either can be sparse. The modulus has to be prime.
+# Long division on the terms only: the highest term of the remainder is removed by subtracting c*X^k*g, until its degree is below that of g.
+# This takes time in the number of terms of g times the number of terms of the quotient, instead of in the degrees.
+# Can raise exception when dividing by zero.
+def longDivision(f : Polynomial, g : Polynomial) -> Tuple[Polynomial, Polynomial]:
+	m = f.mod()
+	divisorExponents, divisorCoefficients = terms(g)
+	if not divisorExponents:
+		raise Exception("Division by 0")
+
+	n = divisorExponents[-1]
+	inverse = pow(divisorCoefficients[-1], -1, m)
+	lower = list(zip(divisorExponents[:-1], divisorCoefficients[:-1]))		# The terms of g below the leading one
+
+	remainder = dict(zip(*terms(f)))
+	heap = [-d for d in remainder if d >= n]		# The degrees of the remainder that still have to be removed, as a max heap
+	heapq.heapify(heap)
+	quotient : Dict[int, int] = {}
+	while heap:
+		d = -heapq.heappop(heap)
+		c = remainder.pop(d, 0) % m
+		if c == 0:
+			continue
+
+		k = d - n
+		factor = c*inverse % m
+		quotient[k] = factor
+		for e, b in lower:
+			if k + e not in remainder and k + e >= n:
+				heapq.heappush(heap, -(k + e))
+			remainder[k + e] = remainder.get(k + e, 0) - factor*b
+
+	return fromSortedTerms(*sortedTerms(quotient, m), m), fromSortedTerms(*sortedTerms(remainder, m), m)
@@ -0,0 +1,7 @@
+# Makes the modules importable the same way they import each other: MathExtensions from the root of the repository,
+# the polynomial modules from the Polynomials folder
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "Polynomials")]
@@ -0,0 +1,69 @@
+# Random inputs shared by the tests. Every test seeds its own random.Random, so a failure can be reproduced
+import random
+from typing import List
+
+# Prime moduli: the smallest, a small one, a word-size one and a 61 bit Mersenne prime
+PRIMES = [2, 3, 7, 10007, 2**31 - 1, 2**61 - 1]
+# Composite moduli: with repeated factors, squarefree and a large squarefree one
+COMPOSITES = [4, 12, 1024, 10000, 1025, 2**64 + 1]
+# Huge moduli, above Multiplication.KRONECKER_MAX_BITS: a Mersenne prime and a composite
+HUGE = [2**2203 - 1, 2**2100 + 12345]
+# A prime with a large power of 2 in p - 1, so that the ntt can be used
+NTT_PRIME = 998244353
+
+
+# Returns a list of n random coefficients mod m
+def randomList(rng : random.Random, n : int, m : int) -> List[int]:
+	return [rng.randrange(m) for _ in range(n)]
+
+
+# Returns a random coefficient list (highest degree first) of the given degree mod m, with a nonzero leading coefficient
+def randomCoefficients(rng : random.Random, degree : int, m : int) -> List[int]:
+	return [rng.randrange(1, m)] + randomList(rng, degree, m)
+
+
+# Returns a random monic coefficient list of the given degree mod m
+def randomMonic(rng : random.Random, degree : int, m : int) -> List[int]:
+	return [1] + randomList(rng, degree, m)
+
+
+# Returns a short name for a modulus, for the test ids
+def modulusId(m : int) -> str:
+	return str(m) if m.bit_length() <= 64 else "%dbit" % m.bit_length()
+
+
+# Returns the remainder of a divided by b mod the prime m with the textbook long division, without leading zeroes ([] for 0)
+def naiveRemainder(a : List[int], b : List[int], m : int) -> List[int]:
+	a = [c % m for c in a]
+	inverse = pow(b[0], -1, m)
+	while len(a) >= len(b):
+		q = a[0]*inverse % m
+		for i, c in enumerate(b):
+			a[i] = (a[i] - q*c) % m
+		a.pop(0)
+	while a and a[0] == 0:
+		a.pop(0)
+	return a
+
+
+# Returns every monic coefficient list of the given degree mod m
+def allMonic(degree : int, m : int) -> List[List[int]]:
+	result = [[1]]
+	for _ in range(degree):
+		result = [c + [x] for c in result for x in range(m)]
+	return result
+
+
+# Returns whether the monic polynomial is irreducible mod the prime m, by trying to divide it by every monic polynomial of at most half its degree
+def naiveIrreducible(coefficients : List[int], m : int) -> bool:
+	degree = len(coefficients) - 1
+	return all(naiveRemainder(coefficients, d, m) for k in range(1, degree//2 + 1) for d in allMonic(k, m))
+
+
+# Returns the product of a and b mod m with the double loop
+def naiveProduct(a : List[int], b : List[int], m : int) -> List[int]:
+	result = [0]*(len(a) + len(b) - 1)
+	for i, x in enumerate(a):
+		for j, y in enumerate(b):
+			result[i + j] += x*y
+	return [c % m for c in result]
@@ -0,0 +1,77 @@
+# Checks the batch runs against the serial functions, with a thread pool and with a real process pool
+import itertools
+import random
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import Batch
+import Irreducibility
+import Roots
+import Factorization
+import PolynomialArithmetic
+from tests.helpers import PRIMES, randomCoefficients, randomMonic, modulusId
+
+
+# Returns random coefficient lists of degree 0 to 12
+def polynomials(rng, m, count):
+	return [randomCoefficients(rng, rng.randint(0, 12), m) for _ in range(count)]
+
+
+@pytest.mark.parametrize("m", PRIMES + [2**64 + 13, 2**127 - 1], ids=modulusId)
+def test_chunks(m):
+	rng = random.Random(m)
+	chunk = polynomials(rng, m, 20) + [[]] + [[m - 1, 0, 1]]
+	assert Batch.unpackChunk(Batch.packChunk(chunk, m), m) == chunk
+	assert Batch.runChunk("zeros", Batch.packChunk(chunk[:-2], m), m, None) == [Roots.zeros(c, m) for c in chunk[:-2]]
+
+
+@pytest.mark.parametrize("m", [2, 7, 10007, 2**61 - 1, 2**89 - 1], ids=modulusId)
+def test_serial(m):
+	rng = random.Random(m)
+	inputs = [randomMonic(rng, rng.randint(1, 12), m) for _ in range(40)]
+	with ThreadPoolExecutor(3) as executor:
+		options = dict(chunkSize=7, maxInFlight=2, executor=executor)
+		assert list(Batch.isIrreducible(inputs, m, **options)) == [Irreducibility.isIrreducible(c, m) for c in inputs]
+		assert list(Batch.isIrreducible(inputs, m, "benor", **options)) == [Irreducibility.isIrreducible(c, m, "benor") for c in inputs]
+		assert list(Batch.zeros(iter(inputs), m, **options)) == [Roots.zeros(c, m) for c in inputs]
+		assert list(Batch.factor(inputs, m, **options)) == [Factorization.factor(c, m) for c in inputs]
+		unordered = sorted(Batch.zeros(inputs, m, ordered=False, **options))
+		assert unordered == list(enumerate(Roots.zeros(c, m) for c in inputs))
+		# The lexicographic search tries many polynomials for larger moduli, the sparse one returns random polynomials
+		if m < 100:
+			degrees = [1, 2, 3, 5, 8]
+			expected = [PolynomialArithmetic.findIrreducible(d, m).polynomial() for d in degrees]
+			assert list(Batch.findIrreducible(degrees, m, **options)) == expected
+		found = list(Batch.findIrreducible([2, 3, 5], m, "sparse", **options))
+		assert [len(c) - 1 for c in found] == [2, 3, 5] and all(Irreducibility.isIrreducible(c, m) for c in found)
+
+
+# An endless input is only read as far as the chunks in flight, and breaking out of the loop stops the run
+def test_endless_input():
+	read = []
+	def endless():
+		for i in itertools.count():
+			read.append(i)
+			yield [1, i % 7]
+
+	with ThreadPoolExecutor(2) as executor:
+		run = Batch.zeros(endless(), 7, chunkSize=10, maxInFlight=3, executor=executor)
+		for i, result in enumerate(run):
+			assert result == [-i % 7]
+			if i == 25:
+				break
+		assert len(read) <= 60
+
+		with Batch.zeros(endless(), 7, chunkSize=10, executor=executor) as run:
+			results = []
+			for result in run:
+				results.append(result)
+				if len(results) == 5:
+					run.cancel()
+		assert len(results) == 5
+
+
+def test_processes():
+	rng = random.Random(1)
+	m = 10007
+	inputs = polynomials(rng, m, 100)
+	assert list(Batch.zeros(inputs, m, chunkSize=16, workers=2)) == [Roots.zeros(c, m) for c in inputs]
@@ -0,0 +1,50 @@
+# Checks CompactPolynomial against the same operations on Polynomials
+import random
+import pytest
+from CompactPolynomial import CompactPolynomial, footprint
+from Polynomial import Polynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, randomCoefficients, modulusId
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE[:1], ids=modulusId)
+def test_operations(m):
+	rng = random.Random(m)
+	for _ in range(20):
+		a, b = randomCoefficients(rng, rng.randint(0, 60), m), randomCoefficients(rng, rng.randint(0, 60), m)
+		c, k, x = rng.randrange(-m, m), rng.randint(0, 10), rng.randrange(m)
+		f, g = Polynomial(a, m), Polynomial(b, m)
+		cf, cg = CompactPolynomial(a, m), CompactPolynomial(b, m)
+		assert cf.polynomial() == f.polynomial() and cf == f
+		assert (cf + cg).polynomial() == (f + g).polynomial()
+		assert (cf - cg).polynomial() == (f - g).polynomial()
+		assert (cf*cg).polynomial() == (f*g).polynomial()
+		assert (-cf).polynomial() == (-f).polynomial()
+		assert (cf + c).polynomial() == (f + c).polynomial()
+		assert (cf*c).polynomial() == (f*c).polynomial()
+		# Mixed with normal polynomials, on either side
+		assert (f - cg).polynomial() == (cf - g).polynomial() == (f - g).polynomial()
+		assert (f*cg).polynomial() == (f*g).polynomial()
+		assert cf.compute(x) == f.compute(x)
+		assert (cf.degreeMax(), cf.lc(), cf.isZero()) == (f.degreeMax(), f.lc(), f.isZero())
+		h, ch = Polynomial(a, m), CompactPolynomial(a, m)
+		h.axpy(c, k, g)
+		ch.axpy(c, k, cg)
+		assert ch.polynomial() == h.polynomial()
+		assert (cf - cf).isZero() and (cf - cf).polynomial() == [0]
+
+
+# With removeLeadingZeroes=False the leading zeroes are kept, like they are for Polynomial
+def test_leading_zeroes():
+	for coefficients in [[0, 5], [0, 0], [0], [3, 0, 1], [0, 0, 1, 0]]:
+		f, cf = Polynomial(coefficients, 7, False), CompactPolynomial(coefficients, 7, False)
+		assert cf.polynomial() == f.polynomial()
+		assert (cf.isZero(), cf.degreeMax(), cf.lc()) == (f.isZero(), f.degreeMax(), f.lc())
+		cf.stripZeroes()
+		f.stripZeroes()
+		assert cf.polynomial() == f.polynomial() and (cf.isZero(), cf.degreeMax()) == (f.isZero(), f.degreeMax())
+
+
+def test_footprint():
+	coefficients = list(range(1000, 2001))
+	assert footprint(CompactPolynomial(coefficients, 10007)) < footprint(Polynomial(coefficients, 10007))/3
+	assert not hasattr(CompactPolynomial([1], 7), "__dict__")
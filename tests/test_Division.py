@@ -0,0 +1,102 @@
+# Checks the Newton iteration division, the Reducer and powmod against the textbook long division
+import random
+import pytest
+import Division
+import PolynomialArithmetic
+from Polynomial import Polynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, randomCoefficients, randomMonic, randomList, naiveRemainder, naiveProduct, modulusId
+
+
+# Returns the quotient and remainder of a divided by b with the textbook long division, both as [0] when they are 0
+def naiveDivide(a, b, m):
+	a = [c % m for c in a]
+	inverse = pow(b[0], -1, m)
+	quotient = []
+	while len(a) >= len(b):
+		q = a[0]*inverse % m
+		quotient.append(q)
+		for i, c in enumerate(b):
+			a[i] = (a[i] - q*c) % m
+		a.pop(0)
+	return Division.stripZeroes(quotient or [0]), Division.stripZeroes(a or [0])
+
+
+# Returns base^e mod (modulus, m) by multiplying e times
+def naivePowmod(base, e, modulus, m):
+	result = naiveRemainder([1], modulus, m)
+	for _ in range(e):
+		result = naiveRemainder(naiveProduct(result or [0], base, m), modulus, m)
+	return result or [0]
+
+
+# Returns a random divisor of the given degree whose leading coefficient can be inverted mod m
+def randomDivisor(rng, degree, m):
+	return randomMonic(rng, degree, m) if rng.random() < 0.5 or m in COMPOSITES else randomCoefficients(rng, degree, m)
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE[:1], ids=modulusId)
+def test_divide(m):
+	rng = random.Random(m)
+	# Degrees on both sides of NEWTON_DIVISION_THRESHOLD
+	cases = [(0, 0), (5, 0), (5, 7), (20, 3), (150, 60), (200, 100), (300, 49)]
+	for degreeA, degreeB in cases if m.bit_length() <= 64 else cases[:5]:
+		a, b = randomCoefficients(rng, degreeA, m), randomDivisor(rng, degreeB, m)
+		expected = naiveDivide(a, b, m)
+		assert Division.divide(a, b, m) == expected
+		assert Division.divideClassic(a, b, m) == expected
+		assert Division.Reducer(b, m).divide(a) == expected
+		assert Division.remainder(a, b, m) == expected[1]
+
+
+@pytest.mark.parametrize("m", [2, 7, 10007, 2**61 - 1, 1024, 10000], ids=modulusId)
+def test_powmod(m):
+	rng = random.Random(m)
+	for degree in [1, 3, 10]:
+		modulus, base = randomMonic(rng, degree, m), randomList(rng, rng.randint(1, 2*degree), m)
+		for e in [0, 1, 2, 3, 31, 64, 255, rng.randrange(300)]:
+			assert Division.powmod(base, e, modulus, m) == naivePowmod(base, e, modulus, m)
+
+
+@pytest.mark.parametrize("m", [10007, 2**127 - 1], ids=modulusId)
+def test_powmod_large(m):
+	# With a prime modulus and an irreducible polynomial, the multiplicative group has m^n - 1 elements
+	rng = random.Random(m)
+	h = PolynomialArithmetic.findIrreducible(3, m, "random")
+	base = randomList(rng, 3, m)
+	order = m**3 - 1
+	assert Division.powmod(base, order, h.polynomial(), m) == [1]
+	e = rng.randrange(order)
+	assert Division.powmod(base, e + order, h.polynomial(), m) == Division.powmod(base, e, h.polynomial(), m)
+	assert PolynomialArithmetic.powmod(Polynomial(base, m), order, h).polynomial() == [1]
+
+
+def test_powmod_negative_exponent():
+	with pytest.raises(Exception):
+		Division.powmod([1, 0], -1, [1, 0, 1], 7)
+
+
+@pytest.mark.parametrize("m", [7, 10007, 1024], ids=modulusId)
+def test_longDivision(m):
+	rng = random.Random(m)
+	for degreeA, degreeB in [(3, 5), (10, 4), (200, 60), (500, 100)]:
+		a, b = randomCoefficients(rng, degreeA, m), randomMonic(rng, degreeB, m)
+		quotient, remainder = naiveDivide(a, b, m)
+		for cache in [False, True]:
+			q, r = PolynomialArithmetic.longDivision(Polynomial(a, m), Polynomial(b, m), cache)
+			assert (q.polynomial(), r.polynomial()) == (quotient, remainder)
+
+
+# A leading coefficient without an inverse takes the classic loop at every degree, instead of failing above the threshold
+@pytest.mark.parametrize("m", [10, 1024], ids=modulusId)
+def test_longDivision_not_invertible(m, monkeypatch):
+	rng = random.Random(m)
+	for degreeA, degreeB in [(10, 4), (200, 60)]:
+		a, b = randomCoefficients(rng, degreeA, m), [2] + randomList(rng, degreeB, m)
+		results = []
+		for threshold in [Division.NEWTON_DIVISION_THRESHOLD, 10**9]:
+			monkeypatch.setattr(Division, "NEWTON_DIVISION_THRESHOLD", threshold)
+			for cache in [False, True]:
+				q, r = PolynomialArithmetic.longDivision(Polynomial(a, m), Polynomial(b, m), cache)
+				assert (q*Polynomial(b, m) + r).polynomial() == Polynomial(a, m).polynomial()
+				results.append((q.polynomial(), r.polynomial()))
+		assert all(result == results[0] for result in results)
@@ -0,0 +1,71 @@
+# Checks the enumeration orders against polynomialAt, the single changes of the Gray code, and that shards and resumed runs cover everything
+import random
+import pytest
+import Enumeration
+from tests.helpers import allMonic
+
+CASES = [(0, 2), (1, 2), (4, 2), (2, 3), (3, 5), (2, 7), (1, 101)]
+
+
+@pytest.mark.parametrize("degree, m", CASES)
+@pytest.mark.parametrize("monic", [True, False])
+def test_lexicographic(degree, m, monic):
+	total = Enumeration.count(degree, m, monic)
+	result = [c[:] for c in Enumeration.generate(degree, m, monic)]
+	assert result == [Enumeration.polynomialAt(i, degree, m, monic) for i in range(total)]
+	assert result == sorted(result) and len(set(map(tuple, result))) == total
+	assert all(len(c) == degree + 1 and 0 < c[0] < m for c in result)
+	if monic:
+		assert result == allMonic(degree, m)
+
+
+@pytest.mark.parametrize("degree, m", CASES)
+@pytest.mark.parametrize("monic", [True, False])
+def test_gray(degree, m, monic):
+	total = Enumeration.count(degree, m, monic)
+	result = []
+	previous = None
+	for coefficients, d, difference in Enumeration.grayChanges(degree, m, monic):
+		if previous is None:
+			assert d is None and difference is None
+		else:
+			changed = [k for k in range(degree + 1) if coefficients[degree - k] != previous[degree - k]]
+			assert changed == [d] and coefficients[degree - d] - previous[degree - d] == difference in (1, -1)
+		previous = coefficients[:]
+		result.append(previous)
+	assert result == [Enumeration.grayPolynomialAt(i, degree, m, monic) for i in range(total)]
+	assert sorted(result) == [c[:] for c in Enumeration.generate(degree, m, monic)]
+	assert [c[:] for c in Enumeration.generate(degree, m, monic, order="gray")] == result
+
+
+@pytest.mark.parametrize("degree, m", CASES)
+@pytest.mark.parametrize("order", ["lexicographic", "gray"])
+def test_shards(degree, m, order):
+	whole = [c[:] for c in Enumeration.generate(degree, m, order=order)]
+	for shards in [1, 2, 3, 7]:
+		parts = [Enumeration.shard(degree, m, k, shards) for k in range(shards)]
+		assert parts[0][0] == 0 and parts[-1][1] == len(whole)
+		assert all(a[1] == b[0] for a, b in zip(parts, parts[1:]))
+		result = []
+		for start, stop in parts:
+			result += [c[:] for c in Enumeration.generate(degree, m, start=start, stop=stop, order=order)]
+		assert result == whole
+	with pytest.raises(Exception):
+		Enumeration.shard(degree, m, 3, 3)
+
+
+# Resuming somewhere in the middle for moduli too large to enumerate
+@pytest.mark.parametrize("m", [10007, 2**61 - 1])
+@pytest.mark.parametrize("monic", [True, False])
+def test_resume(m, monic):
+	rng = random.Random(m)
+	degree = 3
+	total = Enumeration.count(degree, m, monic)
+	for _ in range(10):
+		start = rng.randrange(total - 100)
+		stop = start + rng.randint(0, 100)
+		lexicographic = [c[:] for c in Enumeration.generate(degree, m, monic, start, stop)]
+		assert lexicographic == [Enumeration.polynomialAt(i, degree, m, monic) for i in range(start, stop)]
+		gray = [c[:] for c in Enumeration.generate(degree, m, monic, start, stop, "gray")]
+		assert gray == [Enumeration.grayPolynomialAt(i, degree, m, monic) for i in range(start, stop)]
+	assert list(Enumeration.generate(degree, m, monic, total - 1, total + 5))[0] == Enumeration.polynomialAt(total - 1, degree, m, monic)
@@ -0,0 +1,54 @@
+# Checks Horner's rule, the subproduct tree and Bluestein's algorithm against evaluating every term on its own
+import random
+import pytest
+import Evaluation
+from Polynomial import Polynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, randomCoefficients, randomList, modulusId
+
+
+# Returns the value of the polynomial at x, term by term
+def naive(coefficients, x, m):
+	value, power = 0, 1
+	for c in reversed(coefficients):
+		value += c*power
+		power = power*x % m
+	return value % m
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE[:1], ids=modulusId)
+def test_evaluate(m):
+	rng = random.Random(m)
+	for degree in [0, 1, 5, 40, 300] if m.bit_length() <= 64 else [0, 5, 40]:
+		coefficients = randomCoefficients(rng, degree, m)
+		x = rng.randrange(m)
+		assert Evaluation.horner(coefficients, x, m) == naive(coefficients, x, m)
+		# Enough points for the subproduct tree, with repeated ones, and a few for Horner's rule
+		points = randomList(rng, Evaluation.MULTIPOINT_THRESHOLD + 37, m) + [0, m - 1, 0]
+		assert Evaluation.evaluate(coefficients, points, m) == [naive(coefficients, x, m) for x in points]
+		assert Evaluation.evaluate(coefficients, points[:5], m) == [naive(coefficients, x, m) for x in points[:5]]
+
+
+@pytest.mark.parametrize("m", [2, 3, 5, 7, 101, 1009, 10007, 4, 12, 1024, 1025], ids=modulusId)
+def test_evaluateAll(m):
+	rng = random.Random(m)
+	# Degrees above m - 1 are folded onto the lower ones, so the largest degree is above m where that is cheap to check
+	for degree in [0, 3, Evaluation.EVALUATE_ALL_MIN_DEGREE, 50, 3*m if m < 2000 else 400]:
+		coefficients = randomCoefficients(rng, degree, m)
+		assert Evaluation.evaluateAll(coefficients, m) == [naive(coefficients, x, m) for x in range(m)]
+
+
+def test_primitiveRoot():
+	for m in [2, 3, 7, 10007, 998244353]:
+		g = Evaluation.primitiveRoot(m)
+		assert len({pow(g, k, m) for k in range(m - 1)}) == m - 1 if m < 20000 else pow(g, (m - 1)//2, m) != 1
+	assert Evaluation.primitiveRoot(1024) is None
+	assert Evaluation.primitiveRoot(1025) is None
+
+
+@pytest.mark.parametrize("m", [7, 10007, 1025], ids=modulusId)
+def test_polynomial(m):
+	rng = random.Random(m)
+	p = Polynomial(randomCoefficients(rng, 20, m), m)
+	points = randomList(rng, 300, m)
+	assert p.evaluate(points) == [naive(p.polynomial(), x, m) for x in points]
+	assert p.compute(points[0]) == naive(p.polynomial(), points[0], m)
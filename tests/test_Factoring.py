@@ -0,0 +1,57 @@
+# Checks the factorization with Pollard-Brent rho and the divisors against trial division
+import random
+from MathExtensions import Factoring, Prime
+
+
+# Returns the prime factors of n with multiplicity, with trial division
+def naiveFactors(n):
+	factors, q = [], 2
+	while q*q <= n:
+		while n % q == 0:
+			factors.append(q)
+			n //= q
+		q += 1
+	return factors + [n] if n > 1 else factors
+
+
+def test_small():
+	for n in range(1, 5000):
+		expected = naiveFactors(n)
+		assert Factoring.primeFactors(n) == expected
+		assert Factoring.primeFactorsUnique(n) == sorted(set(expected))
+		assert Factoring.divisors(n) == [d for d in range(1, n + 1) if n % d == 0]
+		assert sorted(Factoring.divisors(n, False)) == Factoring.divisors(n)
+
+
+def test_random_products():
+	rng = random.Random(1)
+	# Rho needs about sqrt(q) steps to find a factor q, so the factors are kept to 32 bits
+	for bits in [16, 24, 32]:
+		for _ in range(10):
+			factors = []
+			while len(factors) < 3:
+				q = rng.getrandbits(bits) | 1
+				if Prime.prime(q):
+					factors.append(q)
+			factors += factors[:1]
+			n = 1
+			for q in factors:
+				n *= q
+			assert Factoring.primeFactors(n) == sorted(factors)
+			factorization = Factoring.factorization(n)
+			assert factorization == {q: factors.count(q) for q in sorted(set(factors))}
+			assert len(Factoring.divisors(n)) == 12
+
+
+def test_pollardBrent():
+	for n in [1000003*1000033, (2**31 - 1)*(2**61 - 1), 2**64 + 1, 10403]:
+		d = Factoring.pollardBrent(n)
+		assert 1 < d < n and n % d == 0
+
+
+def test_prime_powers():
+	assert Factoring.factorization(2**20) == {2: 20}
+	assert Factoring.divisors(2**20) == [2**k for k in range(21)]
+	assert Factoring.factorization((2**31 - 1)**3) == {2**31 - 1: 3}
+	assert Factoring.primeFactors(1) == []
+	assert Factoring.divisors(1) == [1]
@@ -0,0 +1,112 @@
+# Checks the factorization over GF(p) against trial division, and against products of known irreducible factors
+import random
+import pytest
+import Division
+import Factorization
+import Irreducibility
+from tests.helpers import PRIMES, randomMonic, allMonic, naiveRemainder, naiveProduct, modulusId
+
+
+# Returns the factorization of a monic polynomial mod the prime p by trial division with every monic polynomial in order of degree,
+# sorted like Factorization.factor
+def naiveFactor(coefficients, p):
+	factors = []
+	f = coefficients
+	degree = 1
+	while len(f) - 1 >= 2*degree:
+		for d in allMonic(degree, p):
+			e = 0
+			while not naiveRemainder(f, d, p):
+				f = Division.divide(f, d, p)[0]
+				e += 1
+			if e:
+				factors.append((d, e))
+		degree += 1
+	if len(f) > 1:
+		factors.append((f, 1))
+	return sorted(factors, key=lambda pair: (len(pair[0]), pair[0]))
+
+
+# Returns a random monic irreducible polynomial of the given degree mod p
+def randomIrreducible(rng, degree, p):
+	while True:
+		coefficients = randomMonic(rng, degree, p)
+		if Irreducibility.isIrreducible(coefficients, p):
+			return coefficients
+
+
+# Returns the product of the factors to their multiplicities mod p
+def expand(factors, p):
+	result = [1]
+	for g, e in factors:
+		for _ in range(e):
+			result = naiveProduct(result, g, p)
+	return result
+
+
+@pytest.mark.parametrize("p, degree", [(2, 6), (2, 8), (3, 5), (5, 4), (7, 3)])
+def test_all_polynomials(p, degree):
+	for coefficients in allMonic(degree, p):
+		assert Factorization.factor(coefficients, p) == naiveFactor(coefficients, p)
+
+
+# The trial division tries p^(degree/2) divisors, so the degrees are kept small for the larger p
+@pytest.mark.parametrize("p, maxDegree", [(2, 12), (3, 9), (7, 7), (101, 5)])
+def test_random_small(p, maxDegree):
+	rng = random.Random(p)
+	for _ in range(20):
+		coefficients = randomMonic(rng, rng.randint(1, maxDegree), p)
+		assert Factorization.factor(coefficients, p) == naiveFactor(coefficients, p)
+
+
+# Products of known factors, with repeated and p-th power factors, and a leading coefficient that is dropped
+@pytest.mark.parametrize("p", PRIMES, ids=modulusId)
+def test_known_factors(p):
+	rng = random.Random(p)
+	for _ in range(3):
+		factors = {}
+		for degree in [1, 1, 2, 3, 5, 8]:
+			g = tuple(randomIrreducible(rng, degree, p))
+			factors[g] = factors.get(g, 0) + rng.choice([1, 1, 2, 3, p if p < 10 else 1])
+		expected = sorted(((list(g), e) for g, e in factors.items()), key=lambda pair: (len(pair[0]), pair[0]))
+		lead = rng.randrange(1, p)
+		coefficients = [lead*c % p for c in expand(expected, p)]
+		assert Factorization.factor(coefficients, p) == expected
+
+
+@pytest.mark.parametrize("p", PRIMES, ids=modulusId)
+def test_random(p):
+	rng = random.Random(p)
+	for degree in [1, 2, 10, 40, 120]:
+		coefficients = randomMonic(rng, degree, p)
+		factors = Factorization.factor(coefficients, p)
+		assert expand(factors, p) == coefficients
+		assert all(Irreducibility.isIrreducible(g, p) for g, _ in factors)
+		square = Factorization.squareFree(coefficients, p)
+		assert expand(square, p) == coefficients
+		for g, _ in square:
+			assert all(d == len(h) - 1 or (len(h) - 1) % d == 0 for h, d in Factorization.distinctDegree(g, p))
+			assert expand([(h, 1) for h, _ in Factorization.distinctDegree(g, p)], p) == g
+
+
+@pytest.mark.parametrize("p", [3, 7, 10007, 2**61 - 1], ids=modulusId)
+def test_equal_degree(p):
+	rng = random.Random(p)
+	for d in [1, 3, 6]:
+		factors = {tuple(randomIrreducible(rng, d, p)) for _ in range(4)}
+		product = expand([(g, 1) for g in factors], p)
+		assert sorted(Factorization.equalDegree(product, d, p)) == sorted(list(g) for g in factors)
+
+
+# Both ways of building the matrix, by shifting p times and by multiplying with X^p, against a modular exponentiation
+@pytest.mark.parametrize("p", [2, 3, 23, 29, 257, 2**31 - 1, 2**61 - 1], ids=modulusId)
+@pytest.mark.parametrize("shiftMaxPrime", [0, 300])
+def test_FrobeniusMap(p, shiftMaxPrime, monkeypatch):
+	monkeypatch.setattr(Factorization, "FROBENIUS_SHIFT_MAX_PRIME", shiftMaxPrime)
+	rng = random.Random(p)
+	for degree in [1, 2, 7, 50]:
+		g = randomMonic(rng, degree, p)
+		frobenius = Factorization.FrobeniusMap(g, p)
+		for _ in range(5):
+			h = Division.stripZeroes(randomMonic(rng, rng.randrange(degree), p))
+			assert frobenius.apply(h) == Division.powmod(h, p, g, p)
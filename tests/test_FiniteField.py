@@ -0,0 +1,71 @@
+# Checks the arithmetic of FiniteField (sparse, table and Newton reduction, log tables) against products reduced with long division
+import random
+import pytest
+import PolynomialArithmetic
+from FiniteField import FiniteField
+from Polynomial import Polynomial
+from tests.helpers import randomList, naiveProduct, naiveRemainder, modulusId
+
+
+# Returns the coefficients of a*b mod (h, p) with the double loop and long division, [0] for 0
+def naiveMultiply(a, b, h, p):
+	return naiveRemainder(naiveProduct(a, b, p), h, p) or [0]
+
+
+# Returns a field mod p with the given degree, whose modulus is reduced in the given way
+def field(p, degree, reduction):
+	random.seed(p*degree)
+	method = "sparse" if reduction == "sparse" else "random"
+	while True:
+		h = PolynomialArithmetic.findIrreducible(degree, p, method)
+		F = FiniteField(p, h)
+		if F.reduction == reduction:
+			return F
+
+
+# Moduli of degree 4 or less have at most SPARSE_MAX_TERMS terms, so they are always reduced with the sparse rule
+@pytest.mark.parametrize("p, degree, reduction", [(2, 8, "sparse"), (3, 5, "table"), (7, 4, "sparse"), (10007, 3, "sparse"),
+		(10007, 6, "table"), (101, 60, "newton"), (2**61 - 1, 8, "table"), (2**31 - 1, 48, "newton")], ids=str)
+def test_arithmetic(p, degree, reduction):
+	F = field(p, degree, reduction)
+	h = F.modulus.polynomial()
+	rng = random.Random(p + degree)
+	for _ in range(20):
+		a, b = randomList(rng, degree, p), randomList(rng, degree, p)
+		x, y = F(a), F(b)
+		product = naiveMultiply(a, b, h, p)
+		assert (x*y).polynomial().polynomial() == product
+		assert (x + y) - y == x
+		assert -x + x == F.zero()
+		if not y.isZero():
+			assert (y*y.inverse()) == F.one()
+			assert (x*y)/y == x
+		e = rng.randrange(1, 50)
+		power = [1]
+		for _ in range(e):
+			power = naiveMultiply(power, a, h, p)
+		assert (x**e).polynomial().polynomial() == power
+	# The multiplicative group has p^n - 1 elements
+	assert F(randomList(rng, degree - 1, p) + [1])**(p**degree - 1) == F.one()
+
+
+def test_log_tables():
+	F = FiniteField(3, Polynomial([1, 0, 2, 1], 3))
+	assert F.log is not None and sorted(F.log[1:]) == list(range(26))
+	for a in range(27):
+		for b in range(27):
+			x, y = F(F.decode(a)), F(F.decode(b))
+			assert (x*y).polynomial().polynomial() == naiveMultiply(F.decode(a), F.decode(b), F.modulus.polynomial(), 3)
+
+
+def test_degree():
+	F = FiniteField(5, degree=7)
+	assert F.n == 7 and F.order == 5**7 and F.modulus.isIrreducible()
+	assert FiniteField(5, degree=7) == F
+
+
+def test_invalid():
+	with pytest.raises(Exception):
+		FiniteField(3, Polynomial([1, 0, 1, 0], 3))
+	with pytest.raises(Exception):
+		FiniteField(3)
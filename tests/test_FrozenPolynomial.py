@@ -0,0 +1,78 @@
+# Checks FrozenPolynomial and the result caches against the uncached functions on normal Polynomials
+import random
+from copy import copy
+import pytest
+import PolynomialArithmetic
+import ResultCache
+from FrozenPolynomial import FrozenPolynomial
+from Polynomial import Polynomial
+from MathExtensions import Factoring
+from tests.helpers import randomCoefficients, modulusId
+
+
+# Returns the coefficient lists of a tuple of polynomials
+def lists(polynomials):
+	return [None if p is None else p.polynomial() for p in polynomials]
+
+
+@pytest.mark.parametrize("m", [2, 7, 10007, 2**61 - 1], ids=modulusId)
+def test_arithmetic(m):
+	rng = random.Random(m)
+	for _ in range(20):
+		a, b = randomCoefficients(rng, rng.randint(0, 30), m), randomCoefficients(rng, rng.randint(0, 30), m)
+		f, g = Polynomial(a, m), Polynomial(b, m)
+		ff, fg = FrozenPolynomial(a, m), FrozenPolynomial(b, m)
+		for result, expected in [(ff + fg, f + g), (ff - fg, f - g), (ff*fg, f*g), (-ff, -f), (ff*3, f*3)]:
+			assert isinstance(result, FrozenPolynomial) and result.polynomial() == expected.polynomial()
+		assert ff == f and hash(ff) == hash(FrozenPolynomial.freeze(f))
+		h = ff
+		h += fg
+		assert h is not ff and ff.polynomial() == f.polynomial()
+
+
+# The functions that copy their arguments to work on them take frozen polynomials, and leave them as they were
+@pytest.mark.parametrize("m", [7, 10007], ids=modulusId)
+def test_algorithms(m):
+	rng = random.Random(m)
+	for degreeF, degreeG in [(5, 2), (40, 13), (100, 99)]:
+		a, b = randomCoefficients(rng, degreeF, m), randomCoefficients(rng, degreeG, m)
+		ff, fg = FrozenPolynomial(a, m), FrozenPolynomial(b, m)
+		f, g = Polynomial(a, m), Polynomial(b, m)
+		assert lists(PolynomialArithmetic.longDivision(ff, fg)) == lists(PolynomialArithmetic.longDivision(f, g))
+		assert lists(PolynomialArithmetic.euclidExtended(ff, fg)) == lists(PolynomialArithmetic.euclidExtended(f, g))
+		assert ff.polynomial() == a[len(a) - len(ff.polynomial()):] and fg == g
+	copied = copy(FrozenPolynomial([1, 2], 7))
+	copied.axpy(1, 0, Polynomial([1], 7))
+	assert copied.polynomial() == [1, 3]
+
+
+def test_immutable():
+	f = FrozenPolynomial([1, 2, 3], 7)
+	for change in [lambda: f.__setitem__(0, 1), lambda: f.axpy(1, 0, f), lambda: f.scale(2)]:
+		with pytest.raises(Exception):
+			change()
+	f.polynomial().append(5)
+	assert f.polynomial() == [1, 2, 3]
+	assert (f == None) is False and f in {f: 1} and FrozenPolynomial([0, 1, 2, 3], 7) == f
+
+
+def test_ResultCache():
+	ResultCache.clear()
+	rng = random.Random(1)
+	m = 10007
+	polynomials = [Polynomial(randomCoefficients(rng, rng.randint(2, 12), m), m) for _ in range(30)]
+	for _ in range(2):
+		for f, g in zip(polynomials, polynomials[1:]):
+			assert ResultCache.isIrreducible(f) == f.isIrreducible()
+			assert ResultCache.zeros(f) == f.zeros()
+			assert lists(ResultCache.euclidExtended(f, g)) == lists(PolynomialArithmetic.euclidExtended(f, g))
+			assert [(h.polynomial(), e) for h, e in ResultCache.factor(f)] == \
+					[(h.polynomial(), e) for h, e in PolynomialArithmetic.factor(f)]
+	for n in [1, 12, 2**20, 10007*10009]:
+		assert ResultCache.factorization(n) == Factoring.factorization(n)
+	statistics = ResultCache.statistics()
+	assert statistics["zeros"]["hits"] == statistics["zeros"]["misses"] == 29
+	ResultCache.configure("zeros", 5)
+	assert ResultCache.statistics()["zeros"]["size"] == 5
+	ResultCache.configure("zeros", ResultCache.DEFAULT_CACHE_SIZE)
+	ResultCache.clear()
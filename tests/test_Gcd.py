@@ -0,0 +1,87 @@
+# Checks the half-gcd against the classic Euclidean algorithm
+import random
+import pytest
+import Gcd
+import Division
+import PolynomialArithmetic
+from Polynomial import Polynomial
+from tests.helpers import randomCoefficients, randomMonic, naiveRemainder, naiveProduct, modulusId
+
+
+# Returns the coefficients mod m without leading zeroes, [] for 0
+def reduced(a, m):
+	a = [c % m for c in a]
+	while a and a[0] == 0:
+		a.pop(0)
+	return a
+
+
+# Returns the monic gcd of a and b with the textbook Euclidean algorithm, [0] for gcd(0, 0)
+def naiveGcd(a, b, m):
+	a, b = reduced(a, m), reduced(b, m)
+	while b:
+		a, b = b, naiveRemainder(a, b, m)
+	if not a:
+		return [0]
+	inverse = pow(a[0], -1, m)
+	return [c*inverse % m for c in a]
+
+
+# Returns a and b with a random common factor of the given degree
+def withCommonFactor(rng, degreeA, degreeB, common, m):
+	factor = randomMonic(rng, common, m)
+	return naiveProduct(randomCoefficients(rng, degreeA, m), factor, m), naiveProduct(randomCoefficients(rng, degreeB, m), factor, m)
+
+
+@pytest.mark.parametrize("m", [2, 7, 10007, 2**61 - 1, 2**127 - 1], ids=modulusId)
+def test_extendedGcd(m):
+	rng = random.Random(m)
+	# Degrees on both sides of HALF_GCD_THRESHOLD, with and without a common factor
+	for degreeA, degreeB, common in [(0, 0, 0), (3, 5, 0), (10, 10, 2), (70, 65, 0), (130, 129, 5), (200, 90, 40), (300, 299, 0)]:
+		a, b = withCommonFactor(rng, degreeA, degreeB, common, m)
+		expected = naiveGcd(a, b, m)
+		assert Gcd.gcd(a, b, m) == expected
+		x, y, d = Gcd.extendedGcd(a, b, m)
+		assert d == expected
+		assert Division.add(naiveProduct(x, a, m), naiveProduct(y, b, m), m) == d
+		assert Gcd.extendedGcd(a, b, m, False) == (None, None, expected)
+
+
+@pytest.mark.parametrize("m", [7, 10007], ids=modulusId)
+def test_same_as_classic(m, monkeypatch):
+	rng = random.Random(m)
+	for degreeA, degreeB, common in [(100, 99, 0), (150, 120, 30), (260, 200, 3)]:
+		f, g = (Polynomial(c, m) for c in withCommonFactor(rng, degreeA, degreeB, common, m))
+		fast = [p.polynomial() for p in PolynomialArithmetic.euclidExtended(f, g)]
+		monkeypatch.setattr(Gcd, "HALF_GCD_THRESHOLD", 1 << 30)
+		classic = [p.polynomial() for p in PolynomialArithmetic.euclidExtended(f, g)]
+		monkeypatch.undo()
+		assert fast == classic
+		assert PolynomialArithmetic.gcd(f, g).polynomial() == classic[2]
+
+
+def test_zero():
+	assert Gcd.gcd([0], [0], 7) == [0]
+	assert Gcd.extendedGcd([0], [0], 7) == ([0], [0], [0])
+	assert Gcd.gcd([0], [3, 1], 7) == [1, 5]
+
+
+# Returns the coefficient lists of the result of the call, or the type of the exception it raised
+def outcome(call):
+	try:
+		return [None if p is None else p.polynomial() for p in call()]
+	except Exception as e:
+		return type(e)
+
+
+# Mod a composite number euclidExtended gives the same above HALF_GCD_THRESHOLD as below it, instead of failing in the half-gcd
+@pytest.mark.parametrize("m", [10, 1024, 2**64 + 1], ids=modulusId)
+def test_composite(m, monkeypatch):
+	rng = random.Random(m)
+	for degreeA, degreeB in [(70, 65), (100, 3), (130, 129)]:
+		f, g = Polynomial(randomMonic(rng, degreeA, m), m), Polynomial(randomCoefficients(rng, degreeB, m), m)
+		fast = [outcome(lambda: PolynomialArithmetic.euclidExtended(f, g, bezout)) for bezout in [True, False]]
+		monkeypatch.setattr(Gcd, "HALF_GCD_THRESHOLD", 1 << 30)
+		classic = [outcome(lambda: PolynomialArithmetic.euclidExtended(f, g, bezout)) for bezout in [True, False]]
+		monkeypatch.undo()
+		assert fast == classic
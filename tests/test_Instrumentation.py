@@ -0,0 +1,62 @@
+# Checks that a Profile counts calls without changing results, and puts the original functions back
+import random
+import pytest
+import Instrumentation
+import PolynomialArithmetic
+from Polynomial import Polynomial
+from tests.helpers import randomCoefficients, modulusId
+
+
+# Returns the functions and methods that a Profile replaces by default
+def originals():
+	return dict(vars(Polynomial)), dict(vars(PolynomialArithmetic))
+
+
+@pytest.mark.parametrize("m", [7, 10007, 2**61 - 1], ids=modulusId)
+def test_results(m):
+	rng = random.Random(m)
+	f, g = Polynomial(randomCoefficients(rng, 30, m), m), Polynomial(randomCoefficients(rng, 12, m), m)
+	expected = [p.polynomial() for p in PolynomialArithmetic.longDivision(f, g) + PolynomialArithmetic.euclidExtended(f, g)]
+	before = originals()
+	with Instrumentation.Profile() as profile:
+		result = [p.polynomial() for p in PolynomialArithmetic.longDivision(f, g) + PolynomialArithmetic.euclidExtended(f, g)]
+	assert result == expected
+	assert originals() == before and Instrumentation.Profile.active is None
+
+	functions = profile.statistics()["functions"]
+	sites = profile.statistics()["sites"]
+	assert [site["calls"] for name, site in sites["PolynomialArithmetic.longDivision"].items() if name.endswith("test_results")] == [1]
+	assert functions["PolynomialArithmetic.euclidExtended"]["calls"] == 1
+	# euclidExtended divides with longDivision
+	assert functions["PolynomialArithmetic.longDivision"]["calls"] > 1
+	assert functions["Polynomial.__init__"]["allocations"] == functions["Polynomial.__init__"]["calls"]
+	# The counts of a function include those of the functions it called, and each call site adds up to the function
+	for label, counts in functions.items():
+		assert counts["time"] >= counts["selfTime"] >= 0
+		assert sum(site["calls"] for site in sites[label].values()) == counts["calls"]
+		assert sum(site["coefficientOperations"] for site in sites[label].values()) == counts["coefficientOperations"]
+	assert functions["PolynomialArithmetic.longDivision"]["allocations"] >= 2
+	assert "longDivision" in profile.report()
+
+
+def test_coefficient_operations():
+	f, g = Polynomial([1, 2, 3, 4], 7), Polynomial([5, 6], 7)
+	with Instrumentation.Profile() as profile:
+		f*g
+		f - g
+	functions = profile.statistics()["functions"]
+	assert functions["Polynomial.__mul__"]["coefficientOperations"] == 8
+	# The axpy inside the subtraction is not counted a second time
+	assert functions["Polynomial.__sub__"]["coefficientOperations"] == 4
+
+
+def test_nested_and_errors():
+	before = originals()
+	with Instrumentation.Profile():
+		with pytest.raises(Exception):
+			with Instrumentation.Profile():
+				pass
+	with pytest.raises(ZeroDivisionError):
+		with Instrumentation.Profile():
+			1/0
+	assert originals() == before and Instrumentation.Profile.active is None
@@ -0,0 +1,49 @@
+# Checks modInverse, findQ, batchInverse and inverseTable against trying every value
+import random
+import pytest
+import PolynomialArithmetic
+from tests.helpers import modulusId
+
+
+# Returns the smallest q with a == q*b mod m, or -1 if there is none
+def naiveFindQ(a, b, m):
+	return next((q for q in range(m) if (q*b - a) % m == 0), -1)
+
+
+def test_all_small_moduli():
+	for m in range(1, 40):
+		for a in range(m):
+			# Mod 1 nothing is equal to 1, so there are no inverses
+			assert PolynomialArithmetic.modInverse(a, m) == (naiveFindQ(1, a, m) if m > 1 else -1)
+			for b in range(m):
+				assert PolynomialArithmetic.findQ(a, b, m) == naiveFindQ(a, b, m)
+
+
+@pytest.mark.parametrize("m", [2, 10007, 10000, 2**61 - 1, 2**64 + 1, 2**2203 - 1], ids=modulusId)
+def test_large_moduli(m):
+	rng = random.Random(m)
+	for _ in range(100):
+		a, b = rng.randrange(m), rng.randrange(m)
+		inverse = PolynomialArithmetic.modInverse(b, m)
+		assert inverse == -1 or inverse*b % m == 1
+		q = PolynomialArithmetic.findQ(a, b, m)
+		assert q == -1 or q*b % m == a
+		if inverse != -1:
+			assert q == a*inverse % m
+
+
+@pytest.mark.parametrize("m", [1, 2, 12, 97, 1024, 10007, 2**61 - 1], ids=modulusId)
+def test_batchInverse(m):
+	rng = random.Random(m)
+	values = [rng.randrange(-m, 2*m) for _ in range(200)] + [0, 1, m - 1]
+	assert PolynomialArithmetic.batchInverse(values, m) == [PolynomialArithmetic.modInverse(v % m, m) for v in values]
+
+
+def test_inverseTable():
+	for m in [2, 30, 101]:
+		expected = [naiveFindQ(1, a, m) for a in range(m)]
+		assert PolynomialArithmetic.inverseTable(m) == expected
+		assert [PolynomialArithmetic.modInverse(a, m) for a in range(m)] == expected
+		del PolynomialArithmetic.inverseTables[m]
+	with pytest.raises(Exception):
+		PolynomialArithmetic.inverseTable(PolynomialArithmetic.INVERSE_TABLE_MAX_MODULUS + 1)
@@ -0,0 +1,71 @@
+# Checks Rabin's and Ben-Or's tests against trial division by every polynomial of at most half the degree
+import random
+import pytest
+import Irreducibility
+from Polynomial import Polynomial
+from MathExtensions import Factoring
+from tests.helpers import randomMonic, allMonic, naiveIrreducible, modulusId
+
+
+# Returns the number of monic irreducible polynomials of degree n mod p, with the necklace formula
+def necklaces(n, p):
+	total = 0
+	for d in Factoring.divisors(n):
+		k = n//d
+		mu = 0 if any(e > 1 for e in Factoring.factorization(k).values()) else (-1)**len(Factoring.factorization(k))
+		total += mu*p**d
+	return total//n
+
+
+@pytest.mark.parametrize("p, degree", [(2, 2), (2, 3), (2, 4), (2, 6), (2, 8), (3, 2), (3, 4), (3, 5), (5, 2), (5, 3), (7, 3)])
+def test_all_polynomials(p, degree):
+	irreducible = 0
+	for coefficients in allMonic(degree, p):
+		expected = naiveIrreducible(coefficients, p)
+		assert Irreducibility.isIrreducible(coefficients, p, "rabin") == expected
+		assert Irreducibility.isIrreducible(coefficients, p, "benor") == expected
+		irreducible += expected
+	assert irreducible == necklaces(degree, p)
+
+
+# The trial division tries p^(degree/2) divisors, so the degrees are kept small for the larger p
+@pytest.mark.parametrize("p, degrees", [(11, [2, 3, 4, 5, 6]), (101, [2, 3, 4]), (10007, [2, 3])])
+def test_random(p, degrees):
+	rng = random.Random(p)
+	for degree in degrees:
+		for _ in range(5):
+			coefficients = randomMonic(rng, degree, p)
+			expected = naiveIrreducible(coefficients, p)
+			assert Irreducibility.isIrreducible(coefficients, p, "rabin") == expected
+			assert Irreducibility.isIrreducible(coefficients, p, "benor") == expected
+
+
+# Products of irreducible polynomials without roots, which the old test (looking for roots) accepted
+@pytest.mark.parametrize("p", [3, 10007, 2**61 - 1, 2**127 - 1], ids=modulusId)
+def test_products(p):
+	rng = random.Random(p)
+	# X^2 - a is irreducible exactly when a is not a square
+	nonsquares = [a for a in (rng.randrange(2, p) for _ in range(50)) if pow(a, (p - 1)//2, p) == p - 1][:2]
+	f, g = Polynomial([1, 0, -nonsquares[0]], p), Polynomial([1, 0, -nonsquares[1]], p)
+	for method in ["rabin", "benor"]:
+		assert f.isIrreducible(method) and g.isIrreducible(method)
+		assert not (f*g).isIrreducible(method)
+		assert not (f*f).isIrreducible(method)
+
+
+def test_unknown_method():
+	with pytest.raises(Exception):
+		Irreducibility.isIrreducible([1, 0, 1], 3, "unknown")
+
+
+def test_cache():
+	Irreducibility.frobeniusCache.clear()
+	rng = random.Random(1)
+	polynomials = [randomMonic(rng, 5, 7) for _ in range(Irreducibility.FROBENIUS_CACHE_SIZE + 10)]
+	for coefficients in polynomials:
+		for method in ["rabin", "benor"]:
+			assert Irreducibility.isIrreducible(coefficients, 7, method, True) == naiveIrreducible(coefficients, 7)
+			assert Irreducibility.isIrreducible(coefficients, 7, method, True) == naiveIrreducible(coefficients, 7)
+	assert len(Irreducibility.frobeniusCache) == Irreducibility.FROBENIUS_CACHE_SIZE
+	assert (tuple(polynomials[-1]), 7) in Irreducibility.frobeniusCache
+	assert (tuple(polynomials[0]), 7) not in Irreducibility.frobeniusCache
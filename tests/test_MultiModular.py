@@ -0,0 +1,106 @@
+# Checks the multi-modular products against the double loop, and MultiModularPolynomial against Polynomial
+import random
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import MultiModular
+from Polynomial import Polynomial
+from MathExtensions import Prime
+from tests.helpers import PRIMES, COMPOSITES, HUGE, randomList, randomCoefficients, naiveProduct, modulusId
+
+
+# Returns the exact product of a and b with the double loop
+def naiveExact(a, b):
+	result = [0]*(len(a) + len(b) - 1)
+	for i, x in enumerate(a):
+		for j, y in enumerate(b):
+			result[i + j] += x*y
+	return result
+
+
+def test_channels():
+	primes = MultiModular.channelPrimes(8)
+	assert primes == sorted(primes, reverse=True) and len(set(primes)) == 8
+	for p in primes:
+		assert p < 1 << MultiModular.CHANNEL_BITS and (p - 1) % (1 << MultiModular.CHANNEL_TWO_ADICITY) == 0 and Prime.prime(p)
+
+	rng = random.Random(1)
+	basis = MultiModular.CRTBasis(primes[:3])
+	numbers = [rng.randrange(basis.modulus) for _ in range(50)] + [0, 1, basis.modulus - 1]
+	assert basis.combine(basis.split(numbers)) == numbers
+	signed = [rng.randrange(-(basis.modulus//2) + 1, basis.modulus//2) for _ in range(50)]
+	assert basis.combine(basis.split(signed), True) == signed
+
+
+@pytest.mark.parametrize("bits", [1, 20, 64, 200, 3000])
+def test_multiplyExact(bits):
+	rng = random.Random(bits)
+	for lengths in [(1, 1), (1, 7), (5, 3), (40, 40), (100, 31)]:
+		a = [rng.randint(-(1 << bits), 1 << bits) for _ in range(lengths[0])]
+		b = [rng.randint(-(1 << bits), 1 << bits) for _ in range(lengths[1])]
+		assert MultiModular.multiplyExact(a, b) == naiveExact(a, b)
+	assert MultiModular.multiplyExact([0, 0], [5, -3, 1]) == [0, 0, 0, 0]
+	assert MultiModular.multiplyExact([], [1]) == [0]
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE, ids=modulusId)
+def test_multiply(m):
+	rng = random.Random(m)
+	for lengths in [(1, 1), (3, 9), (30, 30), (64, 17)]:
+		a, b = randomList(rng, lengths[0], m), randomList(rng, lengths[1], m)
+		assert MultiModular.multiply(a, b, m) == naiveProduct(a, b, m)
+	# Unreduced and negative coefficients are reduced first
+	assert MultiModular.multiply([-1, m + 2], [m - 1], m) == naiveProduct([m - 1, 2], [m - 1], m)
+
+
+def test_executor():
+	rng = random.Random(2)
+	m = HUGE[0]
+	a, b = randomList(rng, 50, m), randomList(rng, 50, m)
+	with ThreadPoolExecutor(2) as executor:
+		assert MultiModular.multiply(a, b, m, executor) == naiveProduct(a, b, m)
+
+
+# The primes are given for the moduli with large factors, which would take long to factor
+@pytest.mark.parametrize("primes, given", [([2, 3], False), ([7, 11, 13], False), ([10007, 2**31 - 1], False), ([10007, 2**61 - 1], True),
+		([3, 2**31 - 1, 2**61 - 1, 2**63 - 25], True)])
+def test_MultiModularPolynomial(primes, given):
+	m = 1
+	for p in primes:
+		m *= p
+	primes = primes if given else None
+	rng = random.Random(m)
+	for _ in range(10):
+		a, b = randomCoefficients(rng, rng.randint(0, 40), m), randomCoefficients(rng, rng.randint(0, 40), m)
+		f, g = MultiModular.MultiModularPolynomial(a, m, primes=primes), MultiModular.MultiModularPolynomial(b, m, primes=primes)
+		pf, pg = Polynomial(a, m), Polynomial(b, m)
+		c = rng.randrange(m)
+		for result, expected in [(f + g, pf + pg), (f - g, pf - pg), (f*g, pf*pg), (-f, -pf), (f + c, pf + c), (f - c, pf - c),
+				(f*c, pf*c), (pf + f, pf + pf), (pf - f, pf - pf), (pf*g, pf*pg), (f - f, pf - pf)]:
+			assert isinstance(result, MultiModular.MultiModularPolynomial)
+			assert result.polynomial() == expected.polynomial() and result.degreeMax() == expected.degreeMax() and result == expected
+		assert [f[d] for d in range(len(a) + 2)] == [pf[d] for d in range(len(a) + 2)]
+		points = randomList(rng, 5, m)
+		assert f.compute(points[0]) == pf.compute(points[0]) and f.evaluate(points) == pf.evaluate(points)
+
+		h, ph = f.__copy__(), pf.__copy__()
+		k = rng.randint(0, 5)
+		h.axpy(c, k, g)
+		ph.axpy(c, k, pg)
+		h *= 3
+		ph *= 3
+		h[0] = c
+		ph[0] = c
+		h[h.degreeMax()] = 0
+		ph[ph.degreeMax()] = 0
+		# The leading zero is kept, like for Polynomial
+		assert h.polynomial() == ph.polynomial() and h.degreeMax() == ph.degreeMax() and h.isZero() == ph.isZero()
+		h.stripZeroes()
+		ph.stripZeroes()
+		assert h.polynomial() == ph.polynomial()
+		assert f == pf and f.toPolynomial().polynomial() == a
+
+
+@pytest.mark.parametrize("m, primes", [(12, None), (2**64 + 13, None), (2**127 - 1, None), (12, [2, 2, 3]), (15, [3, 7])])
+def test_bad_moduli(m, primes):
+	with pytest.raises(Exception):
+		MultiModular.MultiModularPolynomial([1, 2], m, primes=primes)
@@ -0,0 +1,54 @@
+# Checks the fast multiplication algorithms against the schoolbook product
+import random
+import pytest
+import Multiplication
+from Polynomial import Polynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, NTT_PRIME, randomList, modulusId, naiveProduct as naive
+
+LENGTHS = [1, 2, 3, 23, 24, 25, 31, 32, 33, 64, 100, 257]
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE, ids=modulusId)
+def test_algorithms(m):
+	rng = random.Random(m)
+	# The products of huge coefficients are slow, and the recursion of karatsuba already starts at length 64
+	for n in LENGTHS if m.bit_length() <= 64 else LENGTHS[:-2]:
+		a, b = randomList(rng, n, m), randomList(rng, rng.randint(1, 2*n), m)
+		expected = naive(a, b, m)
+		assert Multiplication.schoolbook(a, b, m) == expected
+		assert Multiplication.karatsuba(a, b, m) == expected
+		assert Multiplication.kronecker(a, b, m) == expected
+		assert Multiplication.multiply(a, b, m) == expected
+		assert Multiplication.square(a, m) == naive(a, a, m)
+
+
+def test_ntt():
+	rng = random.Random(1)
+	for n in LENGTHS:
+		a, b = randomList(rng, n, NTT_PRIME), randomList(rng, rng.randint(1, 2*n), NTT_PRIME)
+		assert Multiplication.nttSupported(NTT_PRIME, len(a) + len(b) - 1)
+		assert Multiplication.ntt(a, b, NTT_PRIME) == naive(a, b, NTT_PRIME)
+		assert Multiplication.ntt(a, a, NTT_PRIME) == naive(a, a, NTT_PRIME)
+
+
+def test_nttSupported():
+	assert not Multiplication.nttSupported(10007, 64)
+	assert not Multiplication.nttSupported(2**20 + 1, 4)		# 2^20 + 1 is not prime
+	assert Multiplication.nttSupported(NTT_PRIME, 1 << 23)
+
+
+def test_ntt_constants():
+	assert Multiplication.ntt([3], [5], 7) == [1]
+	assert Multiplication.ntt([0], [5], NTT_PRIME) == [0]
+
+
+def test_multiply_empty():
+	assert Multiplication.multiply([], [1, 2], 7) == [0]
+
+
+@pytest.mark.parametrize("m", [2, 10007, 10000, HUGE[0]], ids=modulusId)
+def test_polynomial_mul(m):
+	rng = random.Random(m)
+	for n in LENGTHS:
+		a, b = [1] + randomList(rng, n, m), [1] + randomList(rng, n//2, m)
+		assert (Polynomial(a, m)*Polynomial(b, m)).polynomial() == Polynomial(naive(a, b, m), m).polynomial()
@@ -0,0 +1,73 @@
+# Checks the vectorized operations of NumpyPolynomial against those of Polynomial
+import random
+import pytest
+from Polynomial import Polynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, randomCoefficients, modulusId
+
+pytest.importorskip("numpy")
+from NumpyPolynomial import NumpyPolynomial
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE[:1], ids=modulusId)
+def test_operations(m):
+	rng = random.Random(m)
+	for _ in range(20):
+		a, b = randomCoefficients(rng, rng.randint(0, 60), m), randomCoefficients(rng, rng.randint(0, 60), m)
+		c = rng.randrange(m)
+		f, g = Polynomial(a, m), Polynomial(b, m)
+		nf, ng = NumpyPolynomial(a, m), NumpyPolynomial(b, m)
+		assert (nf + ng).polynomial() == (f + g).polynomial()
+		assert (nf - ng).polynomial() == (f - g).polynomial()
+		assert (nf*ng).polynomial() == (f*g).polynomial()
+		assert (-nf).polynomial() == (-f).polynomial()
+		assert (nf*c).polynomial() == (f*c).polynomial()
+		assert (nf + c).polynomial() == (f + c).polynomial()
+		assert (nf - f).isZero()
+		assert nf.compute(c) == f.compute(c)
+		assert nf == NumpyPolynomial(a, m)
+
+
+@pytest.mark.parametrize("m", [7, 10000, 2**61 - 1], ids=modulusId)
+def test_in_place(m):
+	rng = random.Random(m)
+	for _ in range(20):
+		a, b = randomCoefficients(rng, rng.randint(0, 40), m), randomCoefficients(rng, rng.randint(0, 40), m)
+		c, k = rng.randrange(m), rng.randint(0, 10)
+		f, nf = Polynomial(a, m), NumpyPolynomial(a, m)
+		f.axpy(c, k, Polynomial(b, m))
+		nf.axpy(c, k, NumpyPolynomial(b, m))
+		assert nf.polynomial() == f.polynomial()
+		f.scale(c)
+		nf.scale(c)
+		assert nf.polynomial() == f.polynomial()
+
+
+
+# The values are Python ints, computed without the int64 overflow of the stored coefficients
+@pytest.mark.parametrize("m", [7, 2**31 - 1, 2**61 - 1], ids=modulusId)
+def test_evaluation(m):
+	rng = random.Random(m)
+	for _ in range(10):
+		a = randomCoefficients(rng, rng.randint(0, 40), m)
+		f, nf = Polynomial(a, m), NumpyPolynomial(a, m)
+		points = [rng.randrange(m) for _ in range(5)]
+		assert type(nf.compute(points[0])) is int and nf.compute(points[0]) == f.compute(points[0])
+		assert all(type(v) is int for v in nf.evaluate(points)) and nf.evaluate(points) == f.evaluate(points)
+
+
+@pytest.mark.parametrize("m", [7, 10007, 2**31 - 1, 2**61 - 1], ids=modulusId)
+def test_zeros(m):
+	rng = random.Random(m)
+	assert NumpyPolynomial([1, 0, 6], 7).zeros() == Polynomial([1, 0, 6], 7).zeros() == [1, 6]
+	for _ in range(10):
+		a = randomCoefficients(rng, rng.randint(0, 30), m)
+		assert NumpyPolynomial(a, m).zeros() == Polynomial(a, m).zeros()
+
+
+@pytest.mark.parametrize("m", [2, 7, 10007, 2**61 - 1], ids=modulusId)
+def test_isIrreducible(m):
+	rng = random.Random(m)
+	for _ in range(10):
+		a = randomCoefficients(rng, rng.randint(0, 20), m)
+		for method in ["rabin", "benor"]:
+			assert NumpyPolynomial(a, m).isIrreducible(method) == Polynomial(a, m).isIrreducible(method)
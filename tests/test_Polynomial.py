@@ -0,0 +1,53 @@
+# Checks the in-place operators and axpy of Polynomial against the operators that build new polynomials
+import random
+import pytest
+from Polynomial import Polynomial
+from SparsePolynomial import SparsePolynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, randomCoefficients, modulusId
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE[:1], ids=modulusId)
+def test_in_place(m):
+	rng = random.Random(m)
+	for _ in range(20):
+		a, b = randomCoefficients(rng, rng.randint(0, 50), m), randomCoefficients(rng, rng.randint(0, 50), m)
+		c, k = rng.randrange(-m, m), rng.randint(0, 20)
+		f, g = Polynomial(a, m), Polynomial(b, m)
+		for operation, expected in [("__iadd__", f + g), ("__isub__", f - g), ("__imul__", f*g)]:
+			h = Polynomial(a, m)
+			assert getattr(h, operation)(g) is h and h == expected
+		for operation, expected in [("__iadd__", f + c), ("__isub__", f - c), ("__imul__", f*c)]:
+			h = Polynomial(a, m)
+			assert getattr(h, operation)(c) is h and h == expected
+		# axpy adds c*X^k*g, built here the long way
+		h = Polynomial(a, m)
+		assert h.axpy(c, k, g) is h
+		assert h == f + Polynomial.getX(k, m)*g*c
+		h = Polynomial(a, m)
+		h.scale(c)
+		assert h == f*c
+		# Subtracting a polynomial from itself leaves no leading zeroes
+		h = Polynomial(a, m)
+		h -= f
+		assert h.isZero() and h.polynomial() == [0]
+
+
+def test_other_classes():
+	pytest.importorskip("numpy")
+	from NumpyPolynomial import NumpyPolynomial
+	for other in [NumpyPolynomial([1, 1], 7), SparsePolynomial([1, 1], 7)]:
+		for operation in ["__iadd__", "__isub__", "__imul__"]:
+			f = Polynomial([1, 2, 3], 7)
+			getattr(f, operation)(other)
+			assert f == getattr(Polynomial([1, 2, 3], 7), operation.replace("__i", "__"))(Polynomial([1, 1], 7))
+			assert all(type(c) is int for c in f.polynomial())
+		f = Polynomial([1, 2, 3], 7)
+		f.axpy(3, 2, other)
+		assert all(type(c) is int for c in f.polynomial())
+
+
+def test_stripZeroes():
+	assert Polynomial([0, 0, 0, 5, 1], 7).polynomial() == [5, 1]
+	assert Polynomial([0, 0, 7], 7).polynomial() == [0]
+	assert Polynomial([], 7).polynomial() == [0]
+	assert Polynomial([0, 5], 7, False).polynomial() == [0, 5]
@@ -0,0 +1,55 @@
+# Checks the Miller-Rabin test and prime() against trial division
+import random
+import pytest
+from MathExtensions import Prime
+
+
+# Returns whether n is prime, with trial division
+def naivePrime(n):
+	return n >= 2 and all(n % i for i in range(2, int(n**0.5) + 1))
+
+
+def test_small():
+	for n in range(2, 20000):
+		expected = naivePrime(n)
+		assert Prime.MillerRabinTest(n) == expected
+		assert Prime.prime(n) == expected
+		assert Prime.primeFirstResult(n)[0] == expected
+	assert not Prime.MillerRabinTest(0) and not Prime.MillerRabinTest(1)
+	assert Prime.primesBelow(20000) == [n for n in range(20000) if naivePrime(n)]
+
+
+def test_around_trial_division_limit():
+	limit = Prime.TRIAL_DIVISION_LIMIT
+	for n in range(limit - 2000, limit + 2000):
+		expected = naivePrime(n)
+		assert Prime.prime(n) == expected
+		result, factor = Prime.primeFirstResult(n)
+		assert result == expected
+		assert expected or (factor > 1 and n % factor == 0 and naivePrime(factor))
+
+
+def test_random_64_bit():
+	rng = random.Random(1)
+	for _ in range(300):
+		p, q = rng.getrandbits(32) | 1, rng.getrandbits(32) | 1
+		assert Prime.prime(p) == naivePrime(p)
+		# Products of two odd numbers above 1000 get past the small primes
+		if p > 1000 and q > 1000:
+			assert not Prime.prime(p*q)
+
+
+# Composites that fool the Fermat test or Miller-Rabin for some of the deterministic bases
+PSEUDOPRIMES = [561, 1105, 1729, 2047, 1373653, 25326001, 3215031751, 2152302898747, 3474749660383, 341550071728321,
+		3825123056546413051, 318665857834031151167461, 2**64 + 1, (2**61 - 1)*(2**31 - 1)]
+# Known primes, some of them beyond DETERMINISTIC_BOUND
+PRIMES = [2**31 - 1, 2**61 - 1, 2**64 - 59, 2**89 - 1, 2**127 - 1, 2**521 - 1]
+
+
+def test_known():
+	for n in PSEUDOPRIMES:
+		assert not Prime.MillerRabinTest(n) and not Prime.prime(n)
+	for p in PRIMES:
+		assert Prime.MillerRabinTest(p) and Prime.prime(p) and Prime.primeFirstResult(p) == (True, 0)
+		assert not Prime.prime(p*p)
+		assert Prime.MillerRabinTest(p, 5)
@@ -0,0 +1,58 @@
+# Checks the root finding with gcd(f, X^p - X) against trying every value
+import random
+import pytest
+import Roots
+from Polynomial import Polynomial
+from tests.helpers import randomCoefficients, modulusId
+
+
+# Returns the values where the polynomial is zero, trying every value
+def naive(coefficients, m):
+	return [x for x in range(m) if sum(c*pow(x, d, m) for d, c in enumerate(reversed(coefficients))) % m == 0]
+
+
+# Returns the coefficients of the product of (X - r) for the roots, times a random polynomial
+def withRoots(rng, roots, degree, m):
+	result = randomCoefficients(rng, degree, m)
+	for r in roots:
+		shifted = result + [0]
+		for i, c in enumerate(result):
+			shifted[i + 1] = (shifted[i + 1] - r*c) % m
+		result = shifted
+	return result
+
+
+@pytest.mark.parametrize("m", [2, 3, 7, 1031, 10007, 4, 12, 1024, 1025, 10000], ids=modulusId)
+def test_zeros(m):
+	rng = random.Random(m)
+	for _ in range(10):
+		coefficients = withRoots(rng, [rng.randrange(m) for _ in range(rng.randint(0, 4))], rng.randint(0, 30), m)
+		assert Roots.zeros(coefficients, m) == naive(coefficients, m)
+		assert Polynomial(coefficients, m).zeros() == naive(coefficients, m)
+
+
+# The moduli and degrees where zeros uses the root finding, checked against the roots that were put in
+@pytest.mark.parametrize("m", [2**31 - 1, 2**61 - 1, 2**127 - 1], ids=modulusId)
+def test_roots_large_prime(m):
+	rng = random.Random(m)
+	for _ in range(5):
+		roots = sorted({rng.randrange(m) for _ in range(rng.randint(0, 6))})
+		coefficients = withRoots(rng, roots + roots[:1], 0, m)
+		assert Roots.zeros(coefficients, m) == roots
+		assert Roots.roots(coefficients, m) == roots
+
+
+# Composite moduli above EVALUATE_ALL_MAX_MODULUS are evaluated at every value, even when the root finding would be cheaper
+@pytest.mark.parametrize("m", [1025, 1027, 4096], ids=modulusId)
+def test_zeros_large_composite(m):
+	rng = random.Random(m)
+	for degree in [2, 200, 600]:
+		coefficients = randomCoefficients(rng, degree, m)
+		coefficients[-1] = 0
+		assert Roots.zeros(coefficients, m) == naive(coefficients, m)
+	assert Polynomial([1, 0, 1024], 1025).zeros() == [1, 124, 901, 1024]
+
+
+def test_zeros_of_zero():
+	assert Roots.roots([0, 0], 10007) == list(range(10007))
+	assert Roots.zeros([0], 7) == list(range(7))
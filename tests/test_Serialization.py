@@ -0,0 +1,86 @@
+# Checks that polynomials come back unchanged from bytes, from files and from memory mapped views, at the minimal width per modulus
+import random
+from copy import copy
+import pytest
+import Serialization
+from Polynomial import Polynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, randomCoefficients, modulusId
+
+MODULI = PRIMES + COMPOSITES + HUGE
+
+
+# Returns random polynomials mod m of degree 0 to 40, among them 0 and 1
+def polynomials(rng, m, count):
+	result = [Polynomial([0], m), Polynomial([1], m)]
+	result += [Polynomial(randomCoefficients(rng, rng.randint(0, 40), m), m) for _ in range(count)]
+	return result
+
+
+def test_varint():
+	rng = random.Random(1)
+	for n in [0, 1, 127, 128, 255, 300, 2**63, 2**2203 - 1] + [rng.getrandbits(rng.randint(1, 200)) for _ in range(50)]:
+		data = b"\x07" + Serialization.encodeVarint(n) + b"\x09"
+		assert Serialization.decodeVarint(data, 1) == (n, len(data) - 1)
+
+
+@pytest.mark.parametrize("m", MODULI, ids=modulusId)
+def test_dumps(m):
+	rng = random.Random(m)
+	width = Serialization.coefficientWidth(m)
+	assert width == max(1, (m - 1).bit_length()) and 1 << width >= m
+	for p in polynomials(rng, m, 20):
+		data = Serialization.dumps(p)
+		n = len(p.polynomial())
+		assert len(data) == len(Serialization.encodeVarint(m)) + len(Serialization.encodeVarint(n)) + (n*width + 7)//8
+		q = Serialization.loads(data)
+		assert q.mod() == m and q.polynomial() == p.polynomial()
+
+
+@pytest.mark.parametrize("m", MODULI, ids=modulusId)
+def test_files(m, tmp_path):
+	rng = random.Random(m)
+	path = str(tmp_path / "polynomials")
+	expected = polynomials(rng, m, 30) + polynomials(rng, 7, 3)
+	assert Serialization.writeAll(path, iter(expected)) == len(expected)
+	assert [(p.mod(), p.polynomial()) for p in Serialization.readAll(path)] == [(p.mod(), p.polynomial()) for p in expected]
+
+	with Serialization.Archive(path) as archive:
+		assert len(archive) == len(expected)
+		for i in rng.sample(range(len(expected)), len(expected)):
+			view, p = archive[i], expected[i]
+			assert [view[d] for d in range(p.degreeMax() + 3)] == [p[d] for d in range(p.degreeMax() + 3)]
+			assert view.degreeMax() == p.degreeMax() and view.lc() == p.lc() and view.mod() == p.mod()
+			assert view == p and view.polynomial() == p.polynomial()
+		assert [view.polynomial() for view in archive] == [p.polynomial() for p in expected]
+
+
+def test_views(tmp_path):
+	path = str(tmp_path / "polynomials")
+	m = 10007
+	rng = random.Random(m)
+	expected = polynomials(rng, m, 5)
+	Serialization.writeAll(path, expected)
+	with Serialization.Archive(path) as archive:
+		view, p = archive[4], expected[4]
+		g = expected[5]
+		assert (view + g).polynomial() == (p + g).polynomial() and (view*g).polynomial() == (p*g).polynomial()
+		assert (g - view).polynomial() == (g - p).polynomial()
+		h = view
+		h += g
+		assert h is not view and view == p
+		for change in [lambda: view.__setitem__(0, 1), lambda: view.axpy(1, 0, g), lambda: view.scale(2)]:
+			with pytest.raises(Exception):
+				change()
+		copied = copy(view)
+		copied[0] = 1
+		assert type(copied) is Polynomial and copied[0] == 1 and view == p
+
+
+def test_bad_files(tmp_path):
+	path = tmp_path / "bad"
+	path.write_bytes(b"POLY")
+	with pytest.raises(Exception):
+		Serialization.Archive(str(path))
+	path.write_bytes(b"\x00"*64)
+	with pytest.raises(Exception):
+		list(Serialization.readAll(str(path)))
@@ -0,0 +1,42 @@
+# Checks the segmented smallest prime factor sieve against trial division and Factoring
+import random
+from MathExtensions import Factoring, Prime
+from MathExtensions.Sieve import Sieve
+
+
+# Returns the smallest prime factor of n >= 2, with trial division
+def naiveSmallestFactor(n):
+	return next((q for q in range(2, int(n**0.5) + 1) if n % q == 0), n)
+
+
+def test_table():
+	# Small segments, so that many segment borders are crossed
+	sieve = Sieve(20000, segmentSize=1000)
+	for n in range(2, 20000):
+		assert sieve.smallestPrimeFactor(n) == naiveSmallestFactor(n)
+		assert sieve.prime(n) == (naiveSmallestFactor(n) == n)
+	assert not sieve.prime(0) and not sieve.prime(1)
+
+
+def test_same_as_factoring():
+	sieve = Sieve(1 << 16, segmentSize=1 << 10, maxSegments=4)
+	rng = random.Random(1)
+	# Numbers in the table in random order (so segments are dropped and rebuilt), and numbers above the limit
+	for n in [rng.randrange(2, 1 << 16) for _ in range(2000)] + [rng.randrange(1 << 16, 1 << 40) for _ in range(50)]:
+		assert sieve.factorization(n) == Factoring.factorization(n)
+		assert sieve.primeFactors(n) == Factoring.primeFactors(n)
+		assert sieve.primeFactorsUnique(n) == Factoring.primeFactorsUnique(n)
+		assert sieve.divisors(n) == Factoring.divisors(n)
+		assert sieve.prime(n) == Prime.prime(n)
+	assert len(sieve.segments) <= 4
+	assert sieve.factorization(1) == {} and sieve.divisors(1) == [1]
+
+
+def test_large_limit():
+	# Above 2^32 the table needs 4 bytes per entry, as the smallest factor can be above 2^16
+	sieve = Sieve((1 << 32) + (1 << 18), segmentSize=1 << 12)
+	n = 65537*65537
+	assert sieve.typecode == "I"
+	assert sieve.smallestPrimeFactor(n) == 65537
+	assert sieve.primeFactors(n) == [65537, 65537]
+	assert sieve.prime(n + 2) == Prime.prime(n + 2)
@@ -0,0 +1,88 @@
+# Checks SparsePolynomial against the same operations on dense Polynomials
+import random
+import pytest
+import PolynomialArithmetic
+import SparsePolynomial as Sparse
+from SparsePolynomial import SparsePolynomial
+from Polynomial import Polynomial
+from tests.helpers import PRIMES, COMPOSITES, HUGE, modulusId
+
+
+# Returns random terms {degree: coefficient} with the given number of terms below the degree, and a nonzero term at the degree
+def randomTerms(rng, degree, count, m, monic=False):
+	terms = {rng.randrange(degree): rng.randrange(1, m) for _ in range(count)}
+	terms[degree] = 1 if monic else rng.randrange(1, m)
+	return terms
+
+
+# Returns the dense Polynomial with the terms
+def dense(terms, m):
+	degree = max(terms)
+	return Polynomial([terms.get(degree - i, 0) for i in range(degree + 1)], m)
+
+
+# Returns the coefficients of any polynomial, as a dense list
+def coefficients(p):
+	return p.toPolynomial().polynomial() if isinstance(p, SparsePolynomial) else p.polynomial()
+
+
+@pytest.mark.parametrize("m", PRIMES + COMPOSITES + HUGE[:1], ids=modulusId)
+def test_operations(m):
+	rng = random.Random(m)
+	for degreeF, degreeG, count in [(3, 2, 2), (100, 70, 3), (1000, 999, 5), (2000, 30, 20), (500, 500, 400)]:
+		tf, tg = randomTerms(rng, degreeF, count, m), randomTerms(rng, degreeG, count, m)
+		f, g = SparsePolynomial.fromTerms(tf, m), SparsePolynomial.fromTerms(tg, m)
+		df, dg = dense(tf, m), dense(tg, m)
+		c, x = rng.randrange(m), rng.randrange(m)
+		assert coefficients(f) == df.polynomial()
+		assert coefficients(f + g) == (df + dg).polynomial()
+		assert coefficients(f - g) == (df - dg).polynomial()
+		assert coefficients(f - f) == [0]
+		assert coefficients(-f) == (-df).polynomial()
+		assert coefficients(f*g) == (df*dg).polynomial()
+		assert coefficients(f*c) == (df*c).polynomial()
+		assert coefficients(f + c) == (df + c).polynomial()
+		# Mixed with dense polynomials, on either side
+		assert coefficients(f*dg) == coefficients(df*g) == (df*dg).polynomial()
+		assert coefficients(df + g) == coefficients(f + dg) == (df + dg).polynomial()
+		assert f.compute(x) == df.compute(x)
+		assert f.evaluate([x, c]) == df.evaluate([x, c])
+		assert all(f[d] == df[d] for d in [0, 1, degreeF//2, degreeF, degreeF + 5])
+		assert f == SparsePolynomial(df.polynomial(), m)
+		assert f.degreeMax() == df.degreeMax()
+
+
+@pytest.mark.parametrize("m", [2, 7, 10007, 1024, 2**61 - 1], ids=modulusId)
+def test_in_place(m):
+	rng = random.Random(m)
+	for _ in range(10):
+		tf, tg = randomTerms(rng, 300, 6, m), randomTerms(rng, 200, 6, m)
+		f, df = SparsePolynomial.fromTerms(tf, m), dense(tf, m)
+		c, k = rng.randrange(m), rng.randrange(100)
+		f.axpy(c, k, SparsePolynomial.fromTerms(tg, m))
+		df.axpy(c, k, dense(tg, m))
+		assert coefficients(f) == df.polynomial()
+		f.scale(c)
+		df.scale(c)
+		assert coefficients(f) == df.polynomial()
+
+
+@pytest.mark.parametrize("m", [2, 7, 10007, 1024, 2**61 - 1], ids=modulusId)
+def test_longDivision(m):
+	rng = random.Random(m)
+	for degreeF, degreeG in [(10, 3), (500, 100), (3000, 1000), (100, 100)]:
+		tf, tg = randomTerms(rng, degreeF, 5, m), randomTerms(rng, degreeG, 3, m, monic=m in COMPOSITES)
+		q, r = PolynomialArithmetic.longDivision(SparsePolynomial.fromTerms(tf, m), SparsePolynomial.fromTerms(tg, m))
+		dq, dr = PolynomialArithmetic.longDivision(dense(tf, m), dense(tg, m))
+		assert (coefficients(q), coefficients(r)) == (dq.polynomial(), dr.polynomial())
+
+
+def test_high_degree():
+	m = 10007
+	f = Polynomial.getX(10**7, m) + 1
+	assert isinstance(f, SparsePolynomial) and f.termCount() == 2
+	g = f*f
+	assert isinstance(g, SparsePolynomial) and g[2*10**7] == 1 and g[10**7] == 2 and g[0] == 1
+	assert f.compute(3) == (pow(3, 10**7, m) + 1) % m
+	assert isinstance(Sparse.adapt(dense({100: 1, 0: 1}, m)), SparsePolynomial)
+	assert not isinstance(Sparse.adapt(dense({10: 1, 0: 1}, m)), SparsePolynomial)
@@ -0,0 +1,49 @@
+# Checks the search methods of findIrreducible against trial division, and the cache
+import random
+import pytest
+import PolynomialArithmetic
+from tests.helpers import allMonic, naiveIrreducible
+
+
+@pytest.mark.parametrize("p, degree", [(2, 1), (2, 2), (2, 5), (2, 8), (3, 4), (5, 4), (7, 3), (11, 2)])
+def test_lexicographic(p, degree):
+	expected = next(c for c in allMonic(degree, p) if naiveIrreducible(c, p))
+	assert PolynomialArithmetic.findIrreducible(degree, p).polynomial() == expected
+
+
+@pytest.mark.parametrize("method", ["lexicographic", "random", "sparse"])
+@pytest.mark.parametrize("p, degree", [(2, 3), (2, 7), (3, 4), (5, 5), (101, 3)])
+def test_methods(method, p, degree):
+	random.seed(degree*p)
+	f = PolynomialArithmetic.findIrreducible(degree, p, method)
+	assert f.degreeMax() == degree and f.lc() == 1
+	assert naiveIrreducible(f.polynomial(), p)
+	if method == "sparse" and degree >= 3:
+		assert sum(1 for c in f.polynomial() if c != 0) <= 5
+
+
+def test_large():
+	random.seed(1)
+	for method in ["random", "sparse"]:
+		f = PolynomialArithmetic.findIrreducible(20, 2**61 - 1, method)
+		assert f.degreeMax() == 20 and f.isIrreducible("rabin")
+
+
+def test_cache(tmp_path):
+	PolynomialArithmetic.irreducibleCache.clear()
+	random.seed(2)
+	first = PolynomialArithmetic.findIrreducible(4, 5, "random", True)
+	# Every method has its own entry, and the cache is only used when asked for
+	assert PolynomialArithmetic.findIrreducible(4, 5, "lexicographic", True).polynomial() == [1, 0, 0, 0, 2]
+	assert PolynomialArithmetic.findIrreducible(4, 5, "random", True) == first
+	assert (4, 5, "random") in PolynomialArithmetic.irreducibleCache
+	PolynomialArithmetic.findIrreducible(6, 5, "random")
+	assert (6, 5, "random") not in PolynomialArithmetic.irreducibleCache
+
+	path = str(tmp_path/"irreducible.json")
+	PolynomialArithmetic.saveIrreducibleCache(path)
+	saved = dict(PolynomialArithmetic.irreducibleCache)
+	PolynomialArithmetic.irreducibleCache.clear()
+	PolynomialArithmetic.loadIrreducibleCache(path)
+	assert PolynomialArithmetic.irreducibleCache == saved
+	PolynomialArithmetic.irreducibleCache.clear()